@@ -1,3 +1,11 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from aoc.loader import map_input, read_lines, read_text, split_lines
+
 example = """
 1abc2
 pqr3stu8vwx
@@ -17,42 +25,223 @@ zoneight234
 """
 example2 = example2.split('\n')
 
-with open('Day1.txt', 'rt') as fin:
-    input_text = fin.readlines()
-
 number_words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
 
-def day1(include_words = False):
-    results = []
-
-    for line in [my_string.replace('\n', '') for my_string in input_text]:
-        if line:
-            numbers = []
-            for (pos, char) in enumerate(line):
-                if char.isdigit():
-                    numbers.append((pos, char))
-                elif include_words:
-                    try:
-                        if any([number == line[pos:][:len(number)] for number in number_words]):
-                            digit = line[pos:][:5]
-                            for (idx, number_word) in enumerate(number_words):
-                                if digit.startswith(number_word):
-                                    numbers.append((pos, idx+1))
-                                    break
-                    except IndexError:
-                        pass
-            result = int(f'{numbers[0][1]}{numbers[-1][1]}')
-            results.append(result)
-
-    result = sum(results)
+def build_automaton(patterns):
+    '''
+    Builds an Aho-Corasick automaton that recognises any of a set of patterns, in a single
+    pass over a line, including where they overlap (eg: "eightwo" contains "eight" and "two").
+
+    The goto and failure links are folded into one transition table, so each character costs
+    a single dictionary lookup. Characters that cannot continue any pattern lead back to the
+    root, state 0, and are left out of the table.
+
+    Args:
+        patterns (dict[str, int]): A dictionary of {pattern: value}.
+
+    Returns:
+        tuple[list[dict[str, int]], list[int | None]]: The transitions from each state, as
+            {character: next_state}, and the value of the pattern recognised on entering
+            each state, or None.
+    '''
+    # Trie of the patterns
+    goto = [{}]
+    output = [None]
+    for pattern, value in patterns.items():
+        state = 0
+        for char in pattern:
+            if char not in goto[state]:
+                goto.append({})
+                output.append(None)
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state] = value
+
+    # Breadth-first, complete each state's transitions with those of its failure state
+    alphabet = {char for pattern in patterns for char in pattern}
+    transitions = [dict(goto[0])]
+    transitions.extend({} for _ in goto[1:])
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        if output[state] is None: # A shorter pattern ends here too
+            output[state] = output[fail[state]]
+        for char in alphabet:
+            if char in goto[state]:
+                child = goto[state][char]
+                fail[child] = transitions[fail[state]].get(char, 0)
+                transitions[state][char] = child
+                queue.append(child)
+            elif char in transitions[fail[state]]:
+                transitions[state][char] = transitions[fail[state]][char]
+
+    return transitions, output
+
+def find_digit(line, automaton):
+    '''
+    Finds the first digit in a line, stopping as soon as it is recognised.
+
+    No digit word is contained in another, so the first pattern to end is also the first to
+    start. Scanning the reversed line with an automaton of reversed patterns therefore finds
+    the last digit, without reading the rest of the line.
+
+    Args:
+        line (str): The line, or the reversed line.
+        automaton (tuple): The automaton, as returned by `build_automaton`.
+
+    Returns:
+        int: The value of the first digit, or None if there is none.
+    '''
+    transitions, output = automaton
+    state = 0
+    for char in line:
+        state = transitions[state].get(char, 0)
+        if output[state] is not None:
+            return output[state]
+
+    return None
+
+def find_first_and_last(line, automaton):
+    '''
+    Finds the first and last digits in a line, in a single forward pass.
+
+    Args:
+        line (str): The line.
+        automaton (tuple): The automaton, as returned by `build_automaton`.
+
+    Returns:
+        tuple[int | None, int | None]: The values of the first and last digits, or
+                                       (None, None) if there are none.
+    '''
+    transitions, output = automaton
+    first = last = None
+    state = 0
+    for char in line:
+        state = transitions[state].get(char, 0)
+        if output[state] is not None:
+            last = output[state]
+            if first is None:
+                first = last
+
+    return first, last
+
+digit_patterns = {str(value): value for value in range(1, 10)}
+word_patterns = digit_patterns | {word: idx+1 for (idx, word) in enumerate(number_words)}
+automata = {include_words: (build_automaton(patterns),
+                            build_automaton({pattern[::-1]: value
+                                             for pattern, value in patterns.items()
+                                             }))
+            for include_words, patterns in [(False, digit_patterns), (True, word_patterns)]
+            }
+
+def day1(input_text, include_words = False, reverse_scan = True):
+    '''
+    Sums the calibration values of a document: the first and last digits of each line, read
+    as a two-digit number.
+
+    Args:
+        input_text (list[str]): The lines of the document. Blank lines are skipped.
+        include_words (bool, optional): Whether spelled-out digits ("one" to "nine") count
+                                        as digits. Defaults to False.
+        reverse_scan (bool, optional): Whether to find the last digit by scanning back from
+                                       the end of each line, stopping at the first digit
+                                       found, rather than by reading the whole line forwards.
+                                       Defaults to True.
+
+    Returns:
+        int: The sum of the calibration values.
+
+    Raises:
+        ValueError: If a line contains no digits.
+    '''
+    forward, backward = automata[include_words]
+
+    result = 0
+    for line in input_text:
+        line = line.rstrip('\n')
+        if not line:
+            continue
+        if reverse_scan:
+            first = find_digit(line, forward)
+            last = find_digit(reversed(line), backward)
+        else:
+            first, last = find_first_and_last(line, forward)
+        if first is None:
+            raise ValueError(f'No digits in line: {line!r}')
+        result += 10*first + last
+
     return result
 
-part1_result = day1(include_words = False)
-print(f'Part 1 result: {part1_result}')
-if part1_result == 55172:
-    print('PASS')
+def solve(puzzle_input):
+    input_text = read_lines(puzzle_input)
+    part1_result = day1(input_text, include_words = False)
+    part2_result = day1(input_text, include_words = True)
+
+    return part1_result, part2_result
+
+def calibrate_chunk(inputfile, start, end):
+    '''
+    Sums the calibration values of the lines in one chunk of a document, for both parts.
+
+    The file is mapped rather than read, and only this chunk is decoded, so memory use is
+    bounded by the chunk size rather than the size of the document.
+
+    Args:
+        inputfile (Path): The path to the document.
+        start (int): The index of the start of the chunk, at the start of a line.
+        end (int): The index of the end of the chunk, just after a line ending.
+
+    Returns:
+        tuple[int, int]: The sums of the calibration values for parts 1 and 2.
+    '''
+    with map_input(inputfile) as buffer:
+        input_text = read_lines(read_text(buffer[start:end]))
+    sums = [day1(input_text, include_words = include_words) for include_words in [False, True]]
+
+    return tuple(sums)
+
+def solve_file(inputfile, workers = None, chunk_size = 2**24):
+    '''
+    Solves both parts for a calibration document too big to read into memory comfortably,
+    by splitting it into chunks on line boundaries and summing the chunks in parallel.
+
+    Args:
+        inputfile (Path): The path to the document.
+        workers (int, optional): The maximum number of worker processes. With 1 worker (or a
+                                 single chunk), the chunks are summed in this process.
+                                 Defaults to the number of CPUs.
+        chunk_size (int, optional): The target size of each chunk, in bytes. Defaults to
+                                    16 MiB.
+
+    Returns:
+        tuple[int, int]: The results for parts 1 and 2.
+    '''
+    with map_input(inputfile) as buffer:
+        chunks = split_lines(buffer, chunk_size)
+    starts = [start for start, _ in chunks]
+    ends = [end for _, end in chunks]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(chunks) <= 1:
+        sums = list(map(calibrate_chunk, repeat(inputfile), starts, ends))
+    else:
+        with ProcessPoolExecutor(max_workers = min(workers, len(chunks))) as executor:
+            sums = list(executor.map(calibrate_chunk, repeat(inputfile), starts, ends))
+
+    part1_result = sum(part1 for part1, _ in sums)
+    part2_result = sum(part2 for _, part2 in sums)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    part1_result, part2_result = solve_file(Path('Day1.txt'))
+
+    print(f'Part 1 result: {part1_result}')
+    if part1_result == 55172:
+        print('PASS')
 
-part2_result = day1(include_words = True)
-print(f'Part 2 result: {part2_result}')
-if part2_result == 54925:
-    print('PASS')
+    print(f'Part 2 result: {part2_result}')
+    if part2_result == 54925:
+        print('PASS')
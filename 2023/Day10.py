@@ -1,3 +1,12 @@
+from array import array
+from pathlib import Path
+
+from aoc.grid import Grid
+from aoc.loader import map_input, read_lines
+from aoc.trace import get_tracer
+
+tracer = get_tracer(__name__)
+
 square = """.....
 .S-7.
 .|.|.
@@ -26,89 +35,118 @@ SJLL7
 LJ.LJ"""
 complex_twist = complex_twist.split('\n')
 
-import sys
-sys.setrecursionlimit(100_000)
-
-with open('Day10.txt', 'rt') as fin:
-    input_text = [t.replace('\n', '') for t in fin.readlines()]
-
-def get_adjacent_path(coord, char):
-    x, y = coord
-
-    if char == '.':
-        return None
-    elif char == '|':
-        return (x,y-1),(x,y+1)
-    elif char == '-':
-        return (x-1,y),(x+1,y)
-    elif char == 'L':
-        return (x,y-1),(x+1,y)
-    elif char == 'J':
-        return (x-1,y),(x,y-1)
-    elif char == '7':
-        return (x-1,y),(x,y+1)
-    elif char == 'F':
-        return (x,y+1),(x+1,y)
-    elif char == 'S':
-        return 'end'
-
-def get_next_position(coord, char, previous_coord):
-    adjacent_path = get_adjacent_path(coord, char)
-
-    if adjacent_path is None:
-        return None
-
-    if previous_coord not in adjacent_path:
-        return None
-    
-    for possible_coord in adjacent_path:
-        if possible_coord != previous_coord:
-            return possible_coord
-
-def find_S(grid):
-    for y, row in enumerate(grid):
-        for x, tile in enumerate(row):
-            if tile == 'S':
-                return (x,y)
-
-def walk(grid, coord, previous_coord, distances, distance):
-    if coord is None: # not a loop
-        return None, None
-    
-    if coord not in distances:
-        next_position = get_next_position(coord,
-                                          grid[coord[1]][coord[0]],
-                                          previous_coord
-                                          )
-        if next_position is None:
-            return None, None
-        distances[coord] = distance
-        return walk(grid, next_position, coord, distances, distance+1)
-    else:
-        return distances, previous_coord
-
-def find_paths(grid):
-    (Sx,Sy) = find_S(grid)
-    
-    routes = {}
-    route = 0
-    completed_start_points = []
-    for coord in [(Sx,Sy-1),(Sx+1,Sy),(Sx,Sy+1),(Sx-1,Sy)]:
-        if coord not in completed_start_points:
-            previous_coord = (Sx,Sy)
-            if grid[coord[1]][coord[0]] != '.':
-                distances, last_coord = walk(grid, coord, (Sx,Sy), {(Sx,Sy):0}, 1)
-                if distances is not None:
-                    completed_start_points.append(last_coord)
-                    routes[route] = distances
-                    route += 1
-
-    furthest_point_distances = [len(v) for v in routes.values()]
-    result = int(max(furthest_point_distances)/2)
-
-    return routes, result
-
-routes, part1_result = find_paths(input_text)
-print('Part 1 result:', part1_result)
-if part1_result == 7093:
-    print('PASS')
+# The directions each pipe connects, as indices into Grid.orthogonal (N, E, S, W)
+pipes = {'|': (0, 2), '-': (1, 3), 'L': (0, 1), 'J': (0, 3), '7': (2, 3), 'F': (1, 2)}
+pipe_bytes = {ord(pipe): connections for pipe, connections in pipes.items()}
+
+def trace_loop(grid: Grid, start: int, direction: int) -> array | None:
+    """
+    Follows the pipes from a start tile, iteratively, until they lead back to it.
+
+    Args:
+        grid (Grid): The pipe map.
+        start (int): The flat grid index of the start tile.
+        direction (int): The direction to leave the start tile in, as an index into
+                         `grid.orthogonal`.
+
+    Returns:
+        array: The flat grid indices of the tiles in the loop, in order, from the start tile.
+        None: If the pipes do not lead back to the start tile.
+    """
+    offsets = grid.orthogonal
+    cells = grid.cells
+    loop = array('q', [start])
+    posn = start + offsets[direction]
+    while posn != start:
+        connections = pipe_bytes.get(cells[posn])
+        arrival = (direction + 2) % 4 # The side of this tile the pipe is entered from
+        if connections is None or arrival not in connections:
+            return None
+        loop.append(posn)
+        direction = connections[1] if connections[0] == arrival else connections[0]
+        posn += offsets[direction]
+
+    return loop
+
+def find_loop(grid: Grid) -> tuple[array, str]:
+    """
+    Finds the loop through S, and the pipe hidden under S.
+
+    S connects to the neighbours whose pipes lead into it. Normally there are exactly two,
+    which give its shape and the loop is traced once; otherwise each is tried in turn until
+    one leads back to S.
+
+    Args:
+        grid (Grid): The pipe map. S is replaced by its pipe.
+
+    Returns:
+        tuple[array, str]: The flat grid indices of the tiles in the loop, from S, and the
+                           pipe under S.
+
+    Raises:
+        ValueError: If there is no S, or no loop through it.
+    """
+    start = grid.find('S')
+    if start is None:
+        raise ValueError('There is no S on the map')
+
+    candidates = [direction for direction, offset in enumerate(grid.orthogonal)
+                  if (direction + 2) % 4 in pipe_bytes.get(grid.cells[start + offset], ())
+                  ]
+    for direction in candidates:
+        loop = trace_loop(grid, start, direction)
+        if loop is None:
+            continue
+        # The loop leaves S in `direction`, and returns from the last tile before S
+        back = grid.orthogonal.index(loop[-1] - start)
+        shape = next(pipe for pipe, connections in pipes.items()
+                     if sorted(connections) == sorted([direction, back])
+                     )
+        grid[start] = shape
+        if tracer.debug:
+            tracer.log('Loop', f'length {len(loop)}, S is {shape!r}')
+        return loop, shape
+
+    raise ValueError('There is no loop through S')
+
+def count_enclosed(grid: Grid, loop: array) -> int:
+    """
+    Counts the tiles enclosed by a loop, from its area.
+
+    The shoelace formula gives the area of the polygon through the centres of the loop's
+    tiles, and by Pick's theorem, area = interior + boundary / 2 - 1, where the boundary
+    points are the loop's tiles and the interior points are the enclosed tiles.
+
+    Args:
+        grid (Grid): The pipe map.
+        loop (array): The flat grid indices of the tiles in the loop, in order.
+
+    Returns:
+        int: The number of enclosed tiles.
+    """
+    stride = grid.stride
+    twice_area = 0
+    previous_y, previous_x = divmod(loop[-1], stride)
+    for posn in loop:
+        y, x = divmod(posn, stride)
+        twice_area += previous_x*y - x*previous_y
+        previous_x, previous_y = x, y
+
+    return (abs(twice_area) - len(loop)) // 2 + 1
+
+def solve(puzzle_input):
+    grid = Grid([row for row in read_lines(puzzle_input) if row])
+    loop, _ = find_loop(grid)
+    part1_result = len(loop) // 2
+    part2_result = count_enclosed(grid, loop)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('Day10.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Part 1 result:', part1_result)
+    if part1_result == 7093:
+        print('PASS')
+    print('Part 2 result:', part2_result)
@@ -1,3 +1,7 @@
+from pathlib import Path
+
+from aoc.loader import map_input, read_lines
+
 example = """...#......
 .......#..
 #.........
@@ -10,35 +14,10 @@ example = """...#......
 #...#....."""
 example = example.split('\n')
 
-with open('Day11.txt', 'rt') as fin:
-    input_text = fin.readlines()
-
 def print_grid(grid):
     for row in grid:
         print(row)
 
-def apply_gravity(grid):
-    new_grid = grid[:]
-    cols_to_expand = []
-    row_length = len(new_grid[0])
-    for x in range(row_length):
-        if '#' not in [row[x] for row in new_grid]:
-            cols_to_expand.append(x)
-
-    rows_to_expand = []
-    for y, row in enumerate(new_grid):
-        for pos in cols_to_expand[::-1]:
-            row = row[:pos] + '.' + row[pos:]
-            new_grid[y] = row
-        if '#' not in row:
-            rows_to_expand.append(y)
-
-    row_length += len(cols_to_expand)
-    for pos in rows_to_expand[::-1]:
-        new_grid = new_grid[:pos] + ['.' * row_length] + new_grid[pos:]
-
-    return new_grid, rows_to_expand, cols_to_expand
-
 def find_galaxies(grid):
     galaxies = []
     for y, row in enumerate(grid):
@@ -48,53 +27,95 @@ def find_galaxies(grid):
 
     return galaxies
 
-def find_total_path_length(galaxy1, galaxy2, rows_to_expand, cols_to_expand, expansion):
-    x1,y1 = galaxy1
-    x2,y2 = galaxy2
-    initial_distance = abs(x1-x2) + abs(y1-y2)
+def count_empty_before(occupied, size):
+    '''
+    Builds a prefix sum of empty lines (rows or columns): the number of lines with no
+    galaxies before each line.
+
+    Args:
+        occupied (set[int]): The lines that contain a galaxy.
+        size (int): The number of lines.
+
+    Returns:
+        list[int]: The number of empty lines before each line.
+    '''
+    empty_before = []
+    empty = 0
+    for line in range(size):
+        empty_before.append(empty)
+        if line not in occupied:
+            empty += 1
+
+    return empty_before
+
+def sum_pairwise_differences(values):
+    '''
+    Sums |a - b| over every pair of values, in O(n log n).
+
+    Once sorted, the value at position i is the larger of its pairs with the i values before
+    it, and the smaller of its pairs with the n - 1 - i values after it.
+
+    Args:
+        values (list[int]): The values.
+
+    Returns:
+        int: The sum of the differences.
+    '''
+    values = sorted(values)
+    n = len(values)
+
+    return sum(value * (2*i - n + 1) for (i, value) in enumerate(values))
+
+def find_distance_coefficients(grid):
+    '''
+    Sums the shortest paths between every pair of galaxies, as a linear function of the
+    expansion factor: each empty row or column crossed counts as `expansion` lines.
+
+    Each path is its length in the unexpanded image, plus (expansion - 1) for every empty
+    line it crosses. Along each axis, both totals are sums of pairwise differences, of the
+    galaxies' coordinates and of their counts of empty lines before them.
+
+    Args:
+        grid (list[str]): The image.
+
+    Returns:
+        tuple[int, int]: The intercept and slope, such that the sum of the shortest paths
+                         is intercept + slope * expansion.
+    '''
+    galaxies = find_galaxies(grid)
+    xs = [x for x, _ in galaxies]
+    ys = [y for _, y in galaxies]
+    empty_before_col = count_empty_before(set(xs), len(grid[0]) if grid else 0)
+    empty_before_row = count_empty_before(set(ys), len(grid))
 
-    x_range = list(range(*sorted([x1,x2])))
-    x_expansion = len([x for x in cols_to_expand if x in x_range])
-    
+    image_distance = sum_pairwise_differences(xs) + sum_pairwise_differences(ys)
+    empty_crossings = (sum_pairwise_differences([empty_before_col[x] for x in xs])
+                       + sum_pairwise_differences([empty_before_row[y] for y in ys])
+                       )
 
-    y_range = list(range(*sorted([y1,y2])))
-    y_expansion = len([y for y in rows_to_expand if y in y_range])
+    return image_distance - empty_crossings, empty_crossings
 
-    distance = initial_distance + ((expansion-1) * (x_expansion + y_expansion))
-    #print(f'{initial_distance=}, {galaxy1}, {galaxy2}, {x_expansion+y_expansion}')
-    #print(f'{distance=}')
+def run(grid, expansion):
+    intercept, slope = find_distance_coefficients(grid)
+    result = intercept + slope*expansion
 
-    return distance
+    return result
 
-def find_all_paths(grid, galaxies, rows_to_expand, cols_to_expand, expansion, part2=False):
-    all_distances = []
-    
-    for n, galaxy in enumerate(galaxies):
-        remaining = galaxies[n+1:]
-        for galaxy2 in remaining:
-            if not part2:
-                distance = find_path_length(galaxy, galaxy2)
-            else:
-                distance = find_total_path_length(galaxy, galaxy2, rows_to_expand, cols_to_expand, expansion)
-            all_distances.append(distance)
+def solve(puzzle_input):
+    input_text = [row for row in read_lines(puzzle_input) if row]
+    intercept, slope = find_distance_coefficients(input_text)
+    part1_result = intercept + slope*2
+    part2_result = intercept + slope*1_000_000
 
-    return all_distances
+    return part1_result, part2_result
 
-def run(grid, expansion):
-    new_grid, new_rows, new_cols = apply_gravity(grid)
-    
-    galaxies = find_galaxies(grid)
-    all_distances_part2 = find_all_paths(grid, galaxies, new_rows, new_cols, expansion, part2=True)
-    result = sum(all_distances_part2)
-
-    return result
+if __name__ == '__main__':
+    with map_input(Path('Day11.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-#part1_result, part2_result = run(input_text, expansion=1_000_000)
-part1_result = run(input_text, expansion=2)
-part2_result = run(input_text, expansion=1_000_000)
-print('Part 1 result:', part1_result)
-if part1_result == 9591768:
-    print('PASS')
-print('Part 2 result:', part2_result)
-if part2_result >= 773686136407:
-    print('NOPE')
+    print('Part 1 result:', part1_result)
+    if part1_result == 9591768:
+        print('PASS')
+    print('Part 2 result:', part2_result)
+    if part2_result >= 773686136407:
+        print('NOPE')
@@ -1,3 +1,12 @@
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from aoc.loader import map_input, read_lines
+
 example = """???.### 1,1,3
 .??..??...?##. 1,1,3
 ?#?#?#?#?#?#?#? 1,3,1,6
@@ -8,13 +17,117 @@ example = """???.### 1,1,3
 example = example.split('\n')
 
 def read_input(input_text):
-    instructions = {k:v for v,k in [line.split() for line in input_text]}
+    records = []
+    for line in input_text:
+        if line:
+            springs, runs = line.split()
+            records.append((springs, [int(run) for run in runs.split(',')]))
+
+    return records
+
+def unfold(springs, runs, copies = 5):
+    '''
+    Unfolds a condition record: the springs are repeated with '?' between each copy, and
+    the runs are repeated.
+
+    Args:
+        springs (str): The springs, eg: "???.###".
+        runs (list[int]): The lengths of the runs of damaged springs.
+        copies (int, optional): The number of copies. Defaults to 5.
+
+    Returns:
+        tuple[str, list[int]]: The unfolded springs and runs.
+    '''
+    return ('?').join([springs] * copies), runs * copies
+
+def count_arrangements(springs, runs):
+    '''
+    Counts the ways the unknown springs ('?') can be operational ('.') or damaged ('#') so
+    that the runs of damaged springs have the given lengths, in order.
+
+    The springs are read once, left to right, tabulating the number of ways to reach each
+    state (the index of the current run, and how many of its springs have been seen so far).
+    Different choices that reach the same state are counted together rather than explored
+    separately, so this takes O(springs * runs * longest run) time, however many
+    arrangements there are.
+
+    Args:
+        springs (str): The springs.
+        runs (list[int]): The lengths of the runs of damaged springs.
+
+    Returns:
+        int: The number of arrangements.
+    '''
+    states = {(0, 0): 1}
+    for spring in springs + '.': # An operational spring at the end closes the last run
+        next_states = defaultdict(int)
+        for (run, run_length), ways in states.items():
+            if spring != '.': # Damaged, extending the current run
+                if run < len(runs) and run_length < runs[run]:
+                    next_states[(run, run_length + 1)] += ways
+            if spring != '#': # Operational, closing the current run if one is open
+                if run_length == 0:
+                    next_states[(run, 0)] += ways
+                elif run_length == runs[run]:
+                    next_states[(run + 1, 0)] += ways
+        states = next_states
+
+    return states.get((len(runs), 0), 0)
+
+def count_record(record, copies = 1):
+    '''
+    Counts the arrangements for one record, unfolded if required.
+
+    Args:
+        record (tuple[str, list[int]]): The springs and runs, as returned by `read_input`.
+        copies (int, optional): The number of copies to unfold the record into. Defaults
+                                to 1, for the record as it is.
+
+    Returns:
+        int: The number of arrangements.
+    '''
+    springs, runs = record
+    if copies > 1:
+        springs, runs = unfold(springs, runs, copies)
+
+    return count_arrangements(springs, runs)
+
+def total_arrangements(records, copies = 1, workers = 1):
+    '''
+    Sums the arrangements for every record, spreading the records across a process pool.
+
+    Args:
+        records (list[tuple[str, list[int]]]): The records, as returned by `read_input`.
+        copies (int, optional): The number of copies to unfold each record into. Defaults
+                                to 1.
+        workers (int, optional): The maximum number of worker processes. With 1 worker, or
+                                 where processes cannot be forked, the records are counted
+                                 in this process. Defaults to 1.
+
+    Returns:
+        int: The total number of arrangements.
+    '''
+    # Workers must be forked: when loaded by the runner, this module has no importable name
+    # that spawned workers could find `count_record` under
+    if (workers <= 1 or len(records) <= 1
+        or 'fork' not in multiprocessing.get_all_start_methods()):
+        return sum(map(count_record, records, repeat(copies)))
+
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers = workers, mp_context = context) as executor:
+        chunksize = max(1, len(records) // (4 * workers))
+        return sum(executor.map(count_record, records, repeat(copies), chunksize = chunksize))
+
+def solve(puzzle_input, workers = 1):
+    records = read_input(read_lines(puzzle_input))
+    part1_result = total_arrangements(records, workers = workers)
+    part2_result = total_arrangements(records, copies = 5, workers = workers)
 
-    return instructions
+    return part1_result, part2_result
 
-def generate_possibilities(springs: str, runs: str):
-    run_list = [int(run) for run in runs.split(',')]
-    total_springs = sum(run_list)
-    archetype = ('.').join(['#'*n for n in run_list])
+if __name__ == '__main__':
+    with map_input(Path('Day12.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input, workers = os.cpu_count() or 1)
 
-    return archetype
+    print('Part 1 result:', part1_result)
+    print('Part 2 result:', part2_result)
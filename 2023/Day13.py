@@ -1,3 +1,7 @@
+from pathlib import Path
+
+from aoc.loader import map_input, read_text
+
 example = """#.##..##.
 ..#.##.#.
 ##......#
@@ -14,82 +18,107 @@ example = """#.##..##.
 ..##..###
 #....#..#"""
 
-with open('Day13.txt', 'rt') as fin:
-    input_text = fin.read()
-
 def resolve_patterns(input_string):
     patterns = [pattern.split('\n') for pattern in input_string.split('\n\n')]
 
     return patterns
 
-def resolve_possible_sigma(possible_sigma):
-    if len(possible_sigma) > 1:
-        raise
-    elif len(possible_sigma) == 1:
-        sigma = possible_sigma[0]
-    else:
-        sigma = None
-
-    return sigma
-
-def find_vertical_sigma(pattern):
-    possible_sigma = list(range(1, len(pattern[0])))
-    for line in pattern:
-        for i in possible_sigma[::-1]:
-            if i < (len(line)+1)/2:
-                chunk = line[:i]
-                if not line.startswith(f'{chunk}{chunk[::-1]}'):
-                    possible_sigma.remove(i)
-            else:
-                chunk_length = len(line) - i
-                chunk = line[-chunk_length:]
-                if not line.endswith(f'{chunk[::-1]}{chunk}'):
-                    possible_sigma.remove(i)
-
-    sigma = resolve_possible_sigma(possible_sigma)
-
-    return sigma
-
-def find_horizontal_sigma(pattern):
-    possible_sigma = list(range(1, len(pattern)))
-    width = len(pattern[0])
-    for i in range(width):
-        column = ('').join([line[i] for line in pattern])
-        for i in possible_sigma[::-1]:
-            if i < (len(pattern)+1)/2:
-                chunk = column[:i]
-                if not column.startswith(f'{chunk}{chunk[::-1]}'):
-                    possible_sigma.remove(i)
-            else:
-                chunk_length = len(pattern) - i
-                chunk = column[-chunk_length:]
-                if not column.endswith(f'{chunk[::-1]}{chunk}'):
-                    possible_sigma.remove(i)
-
-    sigma = resolve_possible_sigma(possible_sigma)
-
-    return sigma
-
-def run(input_string):
+# Reads a line of ash (.) and rocks (#) as binary digits
+binary_digits = str.maketrans('.#', '01')
+
+def encode_pattern(pattern):
+    '''
+    Encodes each row and column of a pattern as an integer bitmask, with a set bit for each
+    rock, so that lines can be compared as ints.
+
+    Args:
+        pattern (list[str]): The rows of the pattern.
+
+    Returns:
+        tuple[list[int], list[int]]: The bitmasks of the rows, from top to bottom, and of
+                                     the columns, from left to right.
+    '''
+    rows = [int(row.translate(binary_digits), 2) for row in pattern]
+    columns = [int(('').join(column).translate(binary_digits), 2) for column in zip(*pattern)]
+
+    return rows, columns
+
+def find_sigma(lines, smudges = 0):
+    '''
+    Finds the line of reflection in a list of row or column bitmasks.
+
+    Each pair of lines mirrored across a candidate axis differs in the bits set in their XOR,
+    so a reflection with exactly `smudges` smudges has exactly that many set bits in total.
+    A candidate is abandoned as soon as it has too many.
+
+    Args:
+        lines (list[int]): The bitmasks of the rows or columns, in order.
+        smudges (int, optional): The number of cells that must differ from a perfect
+                                 reflection. Defaults to 0.
+
+    Returns:
+        int: The number of lines before the first line of reflection.
+        None: If there is no line of reflection.
+    '''
+    for sigma in range(1, len(lines)):
+        differences = 0
+        for offset in range(min(sigma, len(lines) - sigma)):
+            differences += (lines[sigma - 1 - offset] ^ lines[sigma + offset]).bit_count()
+            if differences > smudges:
+                break
+        if differences == smudges:
+            return sigma
+
+    return None
+
+def summarise(encoded_patterns, smudges = 0):
+    '''
+    Summarises the lines of reflection of a batch of encoded patterns: the number of columns
+    left of each vertical line, plus 100 times the number of rows above each horizontal one.
+
+    Args:
+        encoded_patterns (list[tuple[list[int], list[int]]]): The patterns, as returned by
+                                                              `encode_pattern`.
+        smudges (int, optional): The number of smudges in each reflection. Defaults to 0.
+
+    Returns:
+        int: The summary.
+    '''
+    result = 0
+    for rows, columns in encoded_patterns:
+        sigma = find_sigma(rows, smudges)
+        if sigma:
+            result += 100*sigma
+        else:
+            result += find_sigma(columns, smudges) or 0
+
+    return result
+
+def encode_patterns(input_string):
     patterns = resolve_patterns(input_string)
+    encoded_patterns = [encode_pattern([line for line in pattern if line])
+                        for pattern in patterns
+                        ]
 
-    horizontals = []
-    verticals = []
-    for pattern in patterns:
-        if '' in pattern:
-            pattern.remove('')
-        sigma = find_horizontal_sigma(pattern)
-        if sigma:
-            horizontals.append(sigma)
-        sigma = find_vertical_sigma(pattern)
-        if sigma:
-            verticals.append(sigma)
+    return encoded_patterns
 
-    result = sum(verticals) + 100*sum(horizontals)
+def run(input_string, smudges = 0):
+    result = summarise(encode_patterns(input_string), smudges)
 
     return result
 
-part1_result = run(input_text)
-print('Part 1 result:', part1_result)
-if part1_result = 32035:
-    print('PASS')
+def solve(puzzle_input):
+    encoded_patterns = encode_patterns(read_text(puzzle_input))
+    part1_result = summarise(encoded_patterns)
+    part2_result = summarise(encoded_patterns, smudges = 1)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('Day13.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Part 1 result:', part1_result)
+    if part1_result == 32035:
+        print('PASS')
+    print('Part 2 result:', part2_result)
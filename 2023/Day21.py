@@ -1,3 +1,11 @@
+from pathlib import Path
+
+from aoc.grid import Grid
+from aoc.loader import map_input, read_lines
+from aoc.trace import INFO, get_tracer
+
+tracer = get_tracer(__name__)
+
 example = """...........
 .....###.#.
 .###.##..#.
@@ -11,45 +19,142 @@ example = """...........
 ..........."""
 example = example.split('\n')
 
-with open('Day21.txt', 'rt') as fin:
-    input_text = fin.readlines()
+def find_distances(grid: Grid, start: int, max_distance: int) -> list[int]:
+    """
+    Finds the fewest steps from the start to every garden plot, by breadth-first search.
+
+    The grid's border stops the search at the edges of the map.
+
+    Args:
+        grid (Grid): The map.
+        start (int): The flat grid index of the start.
+        max_distance (int): The furthest distance to search to.
+
+    Returns:
+        list[int]: How many plots are at each distance from the start, from 0 to
+                   `max_distance`.
+    """
+    rock = ord('#')
+    border = ord(grid.border)
+    cells = grid.cells
+    seen = bytearray(len(cells))
+    seen[start] = 1
+    frontier = [start]
+    counts = []
+    for _ in range(max_distance + 1):
+        if not frontier:
+            break
+        counts.append(len(frontier))
+        next_frontier = []
+        for posn in frontier:
+            for offset in grid.orthogonal:
+                next_posn = posn + offset
+                if not seen[next_posn] and cells[next_posn] != rock and cells[next_posn] != border:
+                    seen[next_posn] = 1
+                    next_frontier.append(next_posn)
+        frontier = next_frontier
+
+    return counts
+
+def count_reachable(counts: list[int], num_steps: int) -> int:
+    """
+    Counts the plots that can be ended on after exactly a number of steps.
+
+    A plot can be ended on if it is within that many steps, since any spare steps can be
+    spent going back and forth, but only if the spare steps are even: every step changes
+    the parity of x + y.
+
+    Args:
+        counts (list[int]): How many plots are at each distance, as from `find_distances`.
+        num_steps (int): The number of steps.
 
-def find_S(grid):
-    for y, row in enumerate(grid):
-        for x, tile in enumerate(row):
-            if tile == 'S':
-                return (x,y)
+    Returns:
+        int: The number of plots.
+    """
+    return sum(counts[num_steps % 2 : num_steps + 1 : 2])
 
-def take_step(init_coord, grid) -> set:
-    (ix,iy) = init_coord
+def tile(rows: list[str], repeats: int) -> Grid:
+    """
+    Tiles a map, keeping only the S at its centre.
 
-    next_positions = [(ix,iy-1),(ix+1,iy),(ix,iy+1),(ix-1,iy)]
-    final_positions = set()
-    for next_position in next_positions:
-        (nx,ny) = next_position
-        try:
-            if grid[ny][nx] != '#':
-                final_positions.add((nx,ny))
-        except IndexError:
-            pass
+    Args:
+        rows (list[str]): The map.
+        repeats (int): The number of copies across and down, which must be odd.
 
-    return final_positions
+    Returns:
+        Grid: The tiled map.
+    """
+    plain_rows = [row.replace('S', '.') for row in rows]
+    tiled_rows = [row * repeats for row in plain_rows] * repeats
+    middle = repeats // 2
+    y, x = next((y, row.index('S')) for y, row in enumerate(rows) if 'S' in row)
+    grid = Grid(tiled_rows)
+    grid[grid.index(middle*len(rows[0]) + x, middle*len(rows) + y)] = 'S'
+
+    return grid
 
 def run(grid, num_steps: int):
-    initial_positions = set((find_S(grid),)) # Initial position
+    grid = Grid(grid)
+    counts = find_distances(grid, grid.find('S'), num_steps)
+    result = count_reachable(counts, num_steps)
+
+    return result
+
+def run_infinite(rows, num_steps: int, extrapolate: bool = True):
+    """
+    Counts the plots that can be ended on after exactly a number of steps, on a map that
+    repeats infinitely in every direction.
+
+    For step counts r, r + n, r + 2n, ..., where n is the size of a square map, the number
+    of plots grows quadratically once the search spreads across whole tiles in a diamond,
+    as it does when the start's row and column and the map's edges are clear (as in the
+    puzzle input). So three searches on a tiled map, at k = 0, 1 and 2, are enough to
+    extrapolate to any k by finite differences.
 
-    for step in range(num_steps):
-        final_positions = set()
-        for coord in initial_positions:
-            current_positions = take_step(coord, grid)
-            final_positions.update(current_positions)
-            initial_positions = final_positions
+    Args:
+        rows (list[str]): The map.
+        num_steps (int): The number of steps.
+        extrapolate (bool, optional): Whether to extrapolate, rather than search the whole
+                                      distance. Defaults to True.
 
-    result = len(final_positions)
+    Returns:
+        int: The number of plots.
+    """
+    size = len(rows)
+    cycles, remainder = divmod(num_steps, size)
+    if extrapolate and cycles > 2:
+        samples = [remainder + k*size for k in range(3)]
+    else:
+        samples = [num_steps]
+
+    # Enough copies in each direction to contain the furthest search from the centre
+    repeats = 2 * max(0, -(-(samples[-1] - size//2) // size)) + 1
+    grid = tile(rows, repeats)
+    counts = find_distances(grid, grid.find('S'), samples[-1])
+    plots = [count_reachable(counts, sample) for sample in samples]
+    if tracer.info:
+        tracer.log('Samples', dict(zip(samples, plots)), level = INFO)
+    if len(plots) == 1:
+        return plots[0]
+
+    first_difference = plots[1] - plots[0]
+    second_difference = plots[2] - 2*plots[1] + plots[0]
+    result = plots[0] + cycles*first_difference + cycles*(cycles - 1)//2 * second_difference
 
     return result
 
-part1_result = run(input_text, 64)
-print('Part 1 result:', part1_result)
-if part1_result == 3639:
-    print('PASS')
+def solve(puzzle_input):
+    input_text = [row for row in read_lines(puzzle_input) if row]
+    part1_result = run(input_text, 64)
+    part2_result = run_infinite(input_text, 26501365)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('Day21.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Part 1 result:', part1_result)
+    if part1_result == 3639:
+        print('PASS')
+    print('Part 2 result:', part2_result)
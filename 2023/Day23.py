@@ -1,6 +1,14 @@
-import sys
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 
-sys.setrecursionlimit(1_000_000)
+from aoc.grid import Grid
+from aoc.loader import map_input, read_lines
+from aoc.trace import INFO, get_tracer
+
+tracer = get_tracer(__name__)
 
 example = """#.#####################
 #.......#########...###
@@ -27,59 +35,293 @@ example = """#.#####################
 #####################.#"""
 example = example.split('\n')
 
-def take_step(grid, initial_pos):
-    ix,iy = initial_pos
-
-    if grid[iy][ix] == '<':
-        return [(ix-1,iy)]
-    elif grid[iy][ix] == 'v':
-        return [(ix,iy+1)]
-    elif grid[iy][ix] == '>':
-        return [(ix+1,iy)]
-    elif grid[iy][ix] == '^':
-        return [(ix,iy-1)]
-    else:
-        positions = []
-        directions = [(ix-1,iy),(ix,iy+1),(ix+1,iy),(ix,iy-1)]
-        next_positions = []
-        for (dx,dy) in directions:
-            try:
-                if grid[dy][dx] != '#':
-                    next_positions.append((dx,dy))
-            except IndexError:
-                pass
-
-        return next_positions
-
-def find_paths(grid, all_paths, final_paths, end):
-    if not all_paths:
-        return final_paths
-    new_paths = []
-    print(len(final_paths))
-    for path in all_paths:
-        if end in path:
-            final_paths.append(path)
-        else:
-            #print(path[-1])
-            next_steps = take_step(grid, path[-1]) # Take a step from the last known position
-            if next_steps:
-                for (nx,ny) in next_steps:
-                    if grid[ny][nx] != '#' and (nx,ny) not in path:
-                        new_paths.append(path + [(nx,ny)])
-
-    return find_paths(grid, new_paths, final_paths, end)
-
-def find_termini(grid):
-    start = (grid[0].index('.'), 0)
-    end = (grid[-1].index('.'), len(grid))
+# The direction each slope forces, as an index into Grid.orthogonal (N, E, S, W)
+slope_directions = {ord('^'): 0, ord('>'): 1, ord('v'): 2, ord('<'): 3}
+
+def find_termini(grid: Grid) -> tuple[int, int]:
+    """
+    Finds the start, the gap in the top row, and the end, the gap in the bottom row.
+
+    Args:
+        grid (Grid): The map.
+
+    Returns:
+        tuple[int, int]: The flat grid indices of the start and end.
+    """
+    rows = grid.rows()
+    start = grid.index(rows[0].index('.'), 0)
+    end = grid.index(rows[-1].index('.'), grid.height - 1)
 
     return start, end
 
-def run(grid):
+def find_moves(grid: Grid, posn: int, slopes: bool) -> list[int]:
+    """
+    Lists the tiles that can be stepped onto from a tile.
+
+    Args:
+        grid (Grid): The map.
+        posn (int): The flat grid index of the tile.
+        slopes (bool): Whether slopes can only be left downhill.
+
+    Returns:
+        list[int]: The flat grid indices of the neighbouring path tiles that can be reached.
+    """
+    cells = grid.cells
+    if slopes and cells[posn] in slope_directions:
+        offsets = [grid.orthogonal[slope_directions[cells[posn]]]]
+    else:
+        offsets = grid.orthogonal
+
+    return [posn + offset for offset in offsets
+            if cells[posn + offset] != ord('#') and grid.in_grid(posn + offset)
+            ]
+
+def compress(grid: Grid, slopes: bool = True) -> tuple[list[list[tuple[int, int]]], int, int]:
+    """
+    Compresses the map into a weighted graph of its junctions.
+
+    The nodes are the start, the end and every tile where paths meet. Each edge is a
+    corridor between two nodes, weighted by its length, and only exists in the directions it
+    can be walked. This leaves the search with tens of nodes rather than thousands of tiles.
+
+    Args:
+        grid (Grid): The map.
+        slopes (bool, optional): Whether slopes can only be walked downhill. Defaults to True.
+
+    Returns:
+        tuple[list[list[tuple[int, int]]], int, int]: The (node, length) edges out of each
+            node, and the nodes of the start and end.
+    """
     start, end = find_termini(grid)
-    all_paths = find_paths(grid, [[start]], [], end)
+    junctions = [posn for posn in grid.indices()
+                 if grid[posn] != '#' and len(find_moves(grid, posn, slopes = False)) > 2
+                 ]
+    nodes = {posn: node for (node, posn) in enumerate([start, end, *junctions])}
+
+    edges = [[] for _ in nodes]
+    for origin, node in nodes.items():
+        for posn in find_moves(grid, origin, slopes):
+            # Follow the corridor to the next node, or to a dead end
+            previous = origin
+            length = 1
+            while posn not in nodes:
+                moves = [move for move in find_moves(grid, posn, slopes) if move != previous]
+                if not moves:
+                    break
+                previous, posn = posn, moves[0]
+                length += 1
+            else:
+                edges[node].append((nodes[posn], length))
+
+    if tracer.info:
+        tracer.log('Graph', f'{len(nodes)} nodes, {sum(map(len, edges))} edges', level = INFO)
+
+    return edges, nodes[start], nodes[end]
+
+def force_last_step(edges: list[list[tuple[int, int]]], end: int
+                    ) -> list[list[tuple[int, int]]]:
+    """
+    Drops the edges that would make a path miss the end for good.
+
+    If the end can only be reached from one node, a path reaching that node must go straight
+    to the end, since it could never come back.
+
+    Args:
+        edges (list[list[tuple[int, int]]]): The (node, length) edges out of each node.
+        end (int): The end node.
+
+    Returns:
+        list[list[tuple[int, int]]]: The remaining edges out of each node.
+    """
+    into_end = [node for node, node_edges in enumerate(edges)
+                if any(neighbour == end for neighbour, _ in node_edges)
+                ]
+    if len(into_end) != 1:
+        return edges
+
+    return [[(end, length) for neighbour, length in node_edges if neighbour == end]
+            if node == into_end[0] else node_edges
+            for node, node_edges in enumerate(edges)
+            ]
+
+def split_branches(edges: list[list[tuple[int, int]]],
+                   start: int,
+                   end: int,
+                   depth: int
+                   ) -> tuple[list[tuple[int, int, int]], list[int]]:
+    """
+    Expands the search tree breadth-first to a depth, giving independent subproblems.
+
+    Args:
+        edges (list[list[tuple[int, int]]]): The (node, length) edges out of each node.
+        start (int): The start node.
+        end (int): The end node.
+        depth (int): The number of edges to expand each path by.
+
+    Returns:
+        tuple[list[tuple[int, int, int]], list[int]]: The partial paths to search on from,
+            as (node, visited bitmask, length), and the lengths of the paths that had already
+            reached the end.
+    """
+    branches = [(start, 1 << start, 0)]
+    finished = []
+    for _ in range(depth):
+        next_branches = []
+        for node, visited, length in branches:
+            if node == end:
+                finished.append(length)
+                continue
+            for neighbour, edge_length in edges[node]:
+                if not visited & (1 << neighbour):
+                    next_branches.append((neighbour, visited | (1 << neighbour),
+                                          length + edge_length
+                                          ))
+        branches = next_branches
+
+    return branches, finished
+
+# The best length found by any worker, shared through `_init_worker`
+_shared_best = None
+
+def _init_worker(shared_best):
+    global _shared_best
+    _shared_best = shared_best
+
+def search_branch(edges: list[list[tuple[int, int]]],
+                  end: int,
+                  branch: tuple[int, int, int]
+                  ) -> int | None:
+    """
+    Finds the longest way to finish a partial path, by an iterative depth-first search that
+    tracks the visited nodes as bits of an int.
+
+    Branches are pruned when even taking the longest edge into every unvisited node could not
+    beat the best path so far. In a worker process, the best path is shared with the other
+    workers, so one worker's find prunes everyone's search.
+
+    Args:
+        edges (list[list[tuple[int, int]]]): The (node, length) edges out of each node.
+        end (int): The end node.
+        branch (tuple[int, int, int]): The partial path, as (node, visited bitmask, length).
+
+    Returns:
+        int: The length of the longest complete path through the branch, if it beats the
+             best found elsewhere when it was found.
+        None: If no such path was found.
+    """
+    # The longest edge into each node bounds what visiting it could add
+    longest_into = [0] * len(edges)
+    for node_edges in edges:
+        for neighbour, edge_length in node_edges:
+            longest_into[neighbour] = max(longest_into[neighbour], edge_length)
+
+    node, visited, length = branch
+    potential = sum(edge_length for (node, edge_length) in enumerate(longest_into)
+                    if not visited & (1 << node)
+                    )
+    best = _shared_best.value if _shared_best is not None else -1
+    found = None
+    stack = [(node, visited, length, potential)]
+    pops = 0
+    while stack:
+        node, visited, length, potential = stack.pop()
+        if node == end:
+            if length > best:
+                best = found = length
+                if _shared_best is not None:
+                    with _shared_best.get_lock():
+                        _shared_best.value = max(_shared_best.value, length)
+            continue
+        pops += 1
+        if _shared_best is not None and not pops % 64: # Catch up with the other workers
+            best = max(best, _shared_best.value)
+        if length + potential <= best:
+            continue
+        for neighbour, edge_length in edges[node]:
+            if not visited & (1 << neighbour):
+                stack.append((neighbour, visited | (1 << neighbour), length + edge_length,
+                              potential - longest_into[neighbour]
+                              ))
+
+    return found
+
+def longest_path(edges: list[list[tuple[int, int]]],
+                 start: int,
+                 end: int,
+                 workers: int = 1,
+                 split_depth: int | None = None
+                 ) -> int | None:
+    """
+    Finds the longest path from the start to the end that visits no node twice.
+
+    With more than one worker, the search tree is split at a depth into independent
+    branches, which are searched across a process pool that shares the best length found so
+    far, for pruning.
+
+    Args:
+        edges (list[list[tuple[int, int]]]): The (node, length) edges out of each node.
+        start (int): The start node.
+        end (int): The end node.
+        workers (int, optional): The maximum number of worker processes. With 1 worker, or
+                                 where processes cannot be forked, the search runs in
+                                 this process. Defaults to 1.
+        split_depth (int | None, optional): The depth to split the search tree at. Defaults
+                                            to None, for the shallowest depth giving at least
+                                            8 branches per worker.
+
+    Returns:
+        int: The length of the longest path.
+        None: If the end cannot be reached.
+    """
+    edges = force_last_step(edges, end)
+    # Workers must be forked: when loaded by the runner, this module has no importable name
+    # that spawned workers could find `search_branch` under
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return search_branch(edges, end, (start, 1 << start, 0))
+
+    if split_depth is None:
+        split_depth = 0
+        branches = [start]
+        while 0 < len(branches) < 8 * workers and split_depth < len(edges):
+            split_depth += 1
+            branches, _ = split_branches(edges, start, end, split_depth)
+    branches, finished = split_branches(edges, start, end, split_depth)
+    if tracer.info:
+        tracer.log('Branches', f'{len(branches)} at depth {split_depth}', level = INFO)
+
+    # Hand out the branches in the order a single depth-first search would take them (last
+    # first), which tends to find long paths early and tighten the bound for the rest
+    context = multiprocessing.get_context('fork')
+    shared_best = context.Value('q', max(finished, default = -1))
+    with ProcessPoolExecutor(max_workers = workers,
+                             mp_context = context,
+                             initializer = _init_worker,
+                             initargs = (shared_best,)
+                             ) as executor:
+        results = executor.map(search_branch, repeat(edges), repeat(end), branches[::-1],
+                               chunksize = max(1, len(branches) // (4 * workers))
+                               )
+        lengths = [length for length in results if length is not None] + finished
+
+    return max(lengths, default = None)
+
+def run(grid, slopes = True, workers = 1):
+    grid = Grid([row for row in grid if row])
+    edges, start, end = compress(grid, slopes)
+    result = longest_path(edges, start, end, workers = workers)
+
+    return result
+
+def solve(puzzle_input, workers = 1):
+    input_text = read_lines(puzzle_input)
+    part1_result = run(input_text)
+    part2_result = run(input_text, slopes = False, workers = workers)
+
+    return part1_result, part2_result
 
-    return all_paths
+if __name__ == '__main__':
+    with map_input(Path('Day23.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input, workers = os.cpu_count() or 1)
 
-all_paths = run(example)
-print('All paths:', all_paths)
+    print('Part 1 result:', part1_result)
+    print('Part 2 result:', part2_result)
@@ -1,10 +1,12 @@
+from math import isqrt
+from pathlib import Path
+
+from aoc.loader import map_input, read_lines
+
 example = """Time:      7  15   30
 Distance:  9  40  200"""
 example = example.split('\n')
 
-with open('Day6.txt', 'rt') as fin:
-    input_text = fin.readlines()
-
 def product(my_list):
     pdt = 1
     for i in my_list:
@@ -13,22 +15,53 @@ def product(my_list):
     return pdt
 
 def count_ways(time, record):
-    ways = 0
-    for button_press in range(1,time):
-        distance = (time - button_press) * button_press
-        if distance > record:
-            ways += 1
+    '''
+    Counts the button-press times that beat the record in a race, exactly and in O(1).
 
-    return ways
+    Holding the button for p ms gives a distance of p * (time - p), which beats the record
+    for p strictly between the roots of p^2 - time*p + record = 0. The integer square root
+    gives an estimate of the lower root, which is corrected in a step or two so that ties
+    with the record never count. The winning times are symmetric about time / 2.
+
+    Args:
+        time (int): The duration of the race, in ms.
+        record (int): The record distance, in mm.
+
+    Returns:
+        int: The number of winning button-press times.
+    '''
+    discriminant = time*time - 4*record
+    if discriminant <= 0: # The best possible distance only equals the record, at most
+        return 0
+
+    # Find the shortest winning press
+    shortest = max((time - isqrt(discriminant)) // 2, 1)
+    while shortest > 1 and (shortest - 1) * (time - shortest + 1) > record:
+        shortest -= 1
+    while shortest * (time - shortest) <= record:
+        shortest += 1
+        if 2*shortest > time:
+            return 0
+
+    return time - 2*shortest + 1
+
+def count_ways_batch(races):
+    '''
+    Counts the winning button-press times for many races.
+
+    Args:
+        races (Iterable[tuple[int, int]]): The (time, record) of each race.
+
+    Returns:
+        list[int]: The number of winning button-press times for each race, in order.
+    '''
+    return [count_ways(time, record) for time, record in races]
 
 def day2_part1(input_text):
     times = input_text[0].split()[1:]
     records = input_text[1].split()[1:]
 
-    results = []
-    for (idx, time) in enumerate(times):
-        ways = count_ways(int(time), int(records[idx]))
-        results.append(ways)
+    results = count_ways_batch(zip(map(int, times), map(int, records)))
     result = product(results)
 
     return result
@@ -43,11 +76,20 @@ def day2_part2(input_text):
 
     return ways
 
-part1_result = day2_part1(input_text)
-print(f'Part 1 result: {part1_result}')
-if part1_result == 1195150:
-    print('PASS')
-part2_result = day2_part2(input_text)
-print(f'Part 2 result: {part2_result}')
-if part2_result == 42550411:
-    print('PASS')
+def solve(puzzle_input):
+    input_text = read_lines(puzzle_input)
+    part1_result = day2_part1(input_text)
+    part2_result = day2_part2(input_text)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('Day6.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print(f'Part 1 result: {part1_result}')
+    if part1_result == 1195150:
+        print('PASS')
+    print(f'Part 2 result: {part2_result}')
+    if part2_result == 42550411:
+        print('PASS')
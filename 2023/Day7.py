@@ -1,3 +1,7 @@
+from pathlib import Path
+
+from aoc.loader import map_input, read_lines
+
 example = '''32T3K 765
 T55J5 684
 KK677 28
@@ -5,44 +9,183 @@ KTJJT 220
 QQQJA 483'''
 example = example.split('\n')
 
-with open('Day7.txt', 'rt') as fin:
-    input_text = fin.readlines()
-
 card_ranks = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
 hand_ranks = [[5], [1, 4], [2, 3], [1, 1, 3], [1, 2, 2], [1, 1, 1, 2], [1, 1, 1, 1, 1]]
 hand_ranks.reverse()
 
-def find_hand_type(hand: str):
-    duplicates = {}
-    for card in hand:
-        if card not in duplicates.keys():
-            duplicates[card] = 5 - len(hand.replace(card, '')) # Count card duplicates
+# Base-13 digits for each card, from weakest to strongest; with jokers, J is the weakest card
+base13_digits = '0123456789abc'
+card_digits = str.maketrans(('').join(reversed(card_ranks)), base13_digits)
+joker_card_digits = str.maketrans('J' + ('').join(card for card in reversed(card_ranks)
+                                                  if card != 'J'), base13_digits)
+# A hand type is identified by its number of distinct cards and its largest group
+hand_strengths = {(len(hand_type), max(hand_type)): strength
+                  for (strength, hand_type) in enumerate(hand_ranks)
+                  }
+
+def encode_hand(hand: str, jokers: bool = False) -> int:
+    '''
+    Encodes a hand as a single integer that orders hands by strength: the hand type in the
+    high digits, then the five cards in order as base-13 digits.
 
-    hand_type = sorted(list(duplicates.values()))
+    Args:
+        hand (str): The five cards, eg: "32T3K".
+        jokers (bool, optional): Whether J cards are jokers, which act as whatever card makes
+                                 the strongest hand type, but are the weakest card when
+                                 breaking ties. Defaults to False.
 
-    return hand_type
+    Returns:
+        int: The key, which is larger for stronger hands.
+    '''
+    if jokers:
+        cards = hand.replace('J', '')
+        distinct = set(cards)
+        # Jokers join the biggest group of cards
+        largest = max(map(cards.count, distinct), default = 0) + 5 - len(cards)
+        strength = hand_strengths[(len(distinct) or 1, largest)]
+        digits = hand.translate(joker_card_digits)
+    else:
+        distinct = set(hand)
+        strength = hand_strengths[(len(distinct), max(map(hand.count, distinct)))]
+        digits = hand.translate(card_digits)
 
-def rank_hands(input_text):
-    #input_dict = {k:v for k,v in [item.split() for item in input_text]}
-    rank_list = [item.split() for item in input_text]
-    rank_dict = dict(enumerate(rank_list))
+    return strength * 13**5 + int(digits, 13)
 
-    ranks = []
-    # Label hands with their hand type (as an index of hand type strength - high is strong)
-    for i, [hand, bid] in rank_dict.items():
-        hand_type = find_hand_type(hand)
-        rank_dict[i].append(hand_ranks.index(hand_type))
+def rank_hands(input_text, jokers = False):
+    '''
+    Ranks every hand from weakest to strongest, and totals the winnings: each hand's bid
+    multiplied by its rank.
 
-    
-    rank_sorted = sorted(rank_dict.values(), key = lambda x: (-x[2], card_ranks.index(x[0][0]), card_ranks.index(x[0][1]), card_ranks.index(x[0][2]), card_ranks.index(x[0][3]), card_ranks.index(x[0][4])))
-    rank_sorted.reverse()
+    Args:
+        input_text (list[str]): The hands and bids, one pair per line.
+        jokers (bool, optional): Whether J cards are jokers. Defaults to False.
+
+    Returns:
+        int: The total winnings.
+    '''
+    keyed_bids = []
+    for line in input_text:
+        if line:
+            hand, bid = line.split()
+            keyed_bids.append((encode_hand(hand, jokers = jokers), int(bid)))
+    keyed_bids.sort()
+
+    total_winnings = sum(bid*(i+1) for (i, (_, bid)) in enumerate(keyed_bids))
 
-    winnings = [int(value[1])*(i+1) for (i,value) in enumerate(rank_sorted)]
-    total_winnings = sum(winnings)
-    
     return total_winnings
 
-part1_result = rank_hands(input_text)
-print(f'Part 1 result: {part1_result}')
-if part1_result == 251136060:
-    print('PASS')
+class FenwickTree:
+    '''
+    A Fenwick (binary indexed) tree of sums over the integers 0 to size - 1, storing only the
+    nodes that have been updated, so a huge index space costs memory only where it is used.
+    '''
+    def __init__(self, size: int):
+        '''
+        Creates a tree with every value zero.
+
+        Args:
+            size (int): The number of indices.
+        '''
+        self.size = size
+        self.nodes = {}
+
+    def add(self, index: int, value: int):
+        '''
+        Adds a value at an index, in O(log size).
+
+        Args:
+            index (int): The index.
+            value (int): The value to add.
+        '''
+        index += 1
+        while index <= self.size:
+            self.nodes[index] = self.nodes.get(index, 0) + value
+            index += index & -index
+
+    def prefix_sum(self, end: int) -> int:
+        '''
+        Sums the values at indices below an end, in O(log size).
+
+        Args:
+            end (int): The index to stop before.
+
+        Returns:
+            int: The sum.
+        '''
+        total = 0
+        while end > 0:
+            total += self.nodes.get(end, 0)
+            end -= end & -end
+
+        return total
+
+class RankedHands:
+    '''
+    Hands and bids, kept ranked as they arrive, with the total winnings always up to date.
+
+    Inserting a hand of rank r adds bid * r to the winnings, and moves every stronger hand up
+    a rank, adding their bids once more. Fenwick trees over the packed hand keys count the
+    weaker hands and sum the stronger hands' bids, so each insert takes O(log n).
+
+    Hands equal to one already inserted are ranked above it.
+
+    Attributes:
+        jokers (bool): Whether J cards are jokers.
+        total_winnings (int): The total winnings of the hands inserted so far.
+    '''
+    def __init__(self, jokers: bool = False):
+        '''
+        Creates an empty index.
+
+        Args:
+            jokers (bool, optional): Whether J cards are jokers. Defaults to False.
+        '''
+        self.jokers = jokers
+        self.total_winnings = 0
+        self._count = 0
+        self._total_bids = 0
+        key_space = len(hand_ranks) * 13**5
+        self._counts = FenwickTree(key_space)
+        self._bids = FenwickTree(key_space)
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, hand: str, bid: int) -> int:
+        '''
+        Inserts a hand and its bid.
+
+        Args:
+            hand (str): The five cards.
+            bid (int): The bid.
+
+        Returns:
+            int: The new total winnings.
+        '''
+        key = encode_hand(hand, jokers = self.jokers)
+        rank = self._counts.prefix_sum(key + 1) + 1
+        stronger_bids = self._total_bids - self._bids.prefix_sum(key + 1)
+        self.total_winnings += bid*rank + stronger_bids
+
+        self._counts.add(key, 1)
+        self._bids.add(key, bid)
+        self._count += 1
+        self._total_bids += bid
+
+        return self.total_winnings
+
+def solve(puzzle_input):
+    input_text = read_lines(puzzle_input)
+    part1_result = rank_hands(input_text)
+    part2_result = rank_hands(input_text, jokers = True)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('Day7.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print(f'Part 1 result: {part1_result}')
+    if part1_result == 251136060:
+        print('PASS')
+    print(f'Part 2 result: {part2_result}')
@@ -1,5 +1,13 @@
+from collections import Counter
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError: # Optional; the pure Python path gives the same answers
+    np = None
+
+from aoc.loader import PuzzleInput, map_input, read_int_array
+
 example1 = '''3   4
     4   3
     2   5
@@ -8,92 +16,111 @@ example1 = '''3   4
     3   3'''
 example1 = example1.split('\n    ')
 
-def read_inputfile(inputfile: Path) -> list[str]:
+def parse_data(puzzle_input: PuzzleInput) -> tuple[list[int], list[int]]:
     """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
+    Parses the two location lists into integers.
 
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
-def parse_data(data: list[str]) -> tuple[tuple[str], tuple[str]]:
-    """
-    Parses a list of strings by splitting each string into two parts and returns
-    two tuples containing the left and right parts, respectively.
+    If NumPy is installed, the lists are parsed straight into arrays, reading a buffer in
+    place rather than copying it.
 
     Args:
-        data (list[str]): A list of strings, each expected to contain two whitespace-separated 
-                          values.
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file, with two whitespace-separated values per line.
 
     Returns:
-        tuple[tuple[str, ...], tuple[str, ...]]: A tuple of two tuples; the first containing
-                                                 the left parts and the second containing
-                                                 the right parts of the split strings.
+        tuple[list[int], list[int]]: The left and right lists of location IDs, as NumPy
+                                     arrays if NumPy is installed.
     """
-    left, right = zip(*(n.split() for n in data))
-
-    return left, right
-
-def calculate_result(left: list[str], right: list[str]) -> int:
+    if np is not None:
+        values = read_int_array(puzzle_input)
+    else:
+        if not isinstance(puzzle_input, str):
+            # A buffer such as an mmap has no split(), so this copies it; int() accepts bytes,
+            # so at least there is no need to decode
+            puzzle_input = bytes(puzzle_input)
+        values = list(map(int, puzzle_input.split()))
+
+    return values[0::2], values[1::2]
+
+def calculate_result(left: list[int], right: list[int]) -> int:
     """
     Calculates the sum of distances between corresponding elements of two lists after sorting 
     them.
 
+    If NumPy is installed, the lists are sorted and subtracted as arrays.
+
     Args:
-        left (list[str]): A list of strings representing numerical values to be sorted.
-        right (list[str]): A list of strings representing numerical values to be sorted.
+        left (list[int]): The left list of location IDs.
+        right (list[int]): The right list of location IDs.
 
     Returns:
         int: The sum of the absolute differences between sorted elements of the two lists.
     """
-    left_sorted = sorted(left)
-    right_sorted = sorted(right)
+    if np is not None:
+        left_sorted = np.sort(np.asarray(left, dtype = np.int64))
+        right_sorted = np.sort(np.asarray(right, dtype = np.int64))
+        return int(np.abs(left_sorted - right_sorted).sum())
 
-    # Calculate the differences between values in each of the sorted lists
-    results = [abs(int(x)-int(y)) for (x,y) in [(value,right_sorted[i]) for (i, value) in enumerate(left_sorted)]]
-    # Sum the distances
-    result = sum(results)
+    # Sum the distances between values in each of the sorted lists
+    result = sum(abs(x - y) for (x, y) in zip(sorted(left), sorted(right)))
 
     return result
 
-def calculate_similarity(left: list[str], right: list[str]) -> int:
+def calculate_similarity(left: list[int], right: list[int]) -> int:
     """
     Calculates a similarity score based on the frequency and value of entries in two lists.
 
+    Each left entry is looked up in a table of the frequencies of the right entries: a
+    Counter, or if NumPy is installed, the sorted distinct values and their counts.
+
     Args:
-        left (list[str]): A list of strings representing numerical values.
-        right (list[str]): A list of strings representing numerical values, some of which will 
-                           be repeated from the left list
+        left (list[int]): The left list of location IDs.
+        right (list[int]): The right list of location IDs, some of which will be repeated
+                           from the left list.
 
     Returns:
         int: The similarity score, calculated as the sum of each value in the 'left' list
              multiplied by the frequency of its occurrence in the 'right' list.
     """
-    similarity = 0
-    for entry in left:
-        similarity_multiplier = right.count(entry)
-        similarity += (int(entry) * int(similarity_multiplier))
-    
+    if np is not None:
+        left = np.asarray(left, dtype = np.int64)
+        values, counts = np.unique(np.asarray(right, dtype = np.int64), return_counts = True)
+        if not len(values):
+            return 0
+        positions = np.searchsorted(values, left).clip(max = len(values) - 1)
+        frequencies = np.where(values[positions] == left, counts[positions], 0)
+        return int((left * frequencies).sum())
+
+    frequencies = Counter(right)
+    similarity = sum(entry * frequencies[entry] for entry in left)
+
     return similarity
 
-inputfile = Path('day01.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the total distance and the similarity score of the two location lists.
 
-left_list, right_list = parse_data(data)
-part1_result = calculate_result(left_list, right_list)
-part2_result = calculate_similarity(left_list, right_list)
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
 
-print('Day 1:', part1_result)
-if part1_result == 2970687:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 23963899:
-    print('PASS')
\ No newline at end of file
+    Returns:
+        tuple[int, int]: A tuple containing the total distance (Part 1) and the
+            similarity score (Part 2).
+    """
+    left_list, right_list = parse_data(puzzle_input)
+    part1_result = calculate_result(left_list, right_list)
+    part2_result = calculate_similarity(left_list, right_list)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('day01.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 2970687:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 23963899:
+        print('PASS')
@@ -1,5 +1,12 @@
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError: # Optional; only needed for classify_batch()
+    np = None
+
+from aoc.loader import PuzzleInput, map_input, read_int_array, read_lines
+
 example1 = '''7 6 4 2 1
     1 2 7 8 9
     9 7 6 2 1
@@ -8,21 +15,29 @@ example1 = '''7 6 4 2 1
     1 3 6 7 9'''
 example1 = example1.split('\n    ')
 
-def read_inputfile(inputfile: Path) -> list[str]:
+def find_violation(levels: list[int]) -> int | None:
     """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
+    Finds the first pair of adjacent levels that breaks the safety rules, in a single pass.
+
+    The direction of the report (increasing or decreasing) is set by its first pair, and
+    every difference between consecutive levels must be between 1 and 3 in that direction.
 
     Args:
-        inputfile (Path): The path to the input file to be read.
+        levels (list[int]): A list of integers representing safety levels.
 
     Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
+        int: The index of the first level of the first bad pair.
+        None: If the report is safe.
     """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
+    if len(levels) < 2:
+        return None
 
-    return [line.strip() for line in data]
+    direction = 1 if levels[1] > levels[0] else -1
+    for i in range(len(levels) - 1):
+        if not 1 <= direction * (levels[i+1] - levels[i]) <= 3:
+            return i
+
+    return None
 
 def calculate_safety(levels: list[int]) -> bool:
     """
@@ -37,25 +52,15 @@ def calculate_safety(levels: list[int]) -> bool:
     Returns:
         bool: True if the list is considered safe according to the criteria; False otherwise.
     """
-    # Check whether levels are in ascending or descending order
-    if levels == sorted(levels) or levels == sorted(levels, reverse = True):
-        for i in range(len(levels)-1):
-            delta = abs(levels[i] - levels[i+1])
-            # Check whether difference between this level and the following is within limits
-            if not 1 <= delta <= 3:
-                return False # Part 1: no level in report must be "bad"
-    else:
-        return False
-    
-    # If nothing has been found to indicate unsafe
-    return True
+    return find_violation(levels) is None
 
 def calculate_safety_part2(levels: list[int]) -> bool:
     """
     Determines whether a list of safety levels can be made safe by removing one element.
 
-    A list is considered potentially safe if removing any single element results
-    in a list that meets the safety criteria defined in `calculate_safety`.
+    Only the levels of the first bad pair, i and i+1, need to be tried, and i-1 in case
+    the first pair set the wrong direction: removing any other level leaves the bad pair in
+    place, in the same direction. So each report takes at most four linear passes.
 
     Args:
         levels (list[int]): A list of integers representing safety levels.
@@ -63,16 +68,83 @@ def calculate_safety_part2(levels: list[int]) -> bool:
     Returns:
         bool: True if the list can be made safe by removing one element; False otherwise.
     """
-    for i in range(len(levels)):
-        # Remove each element in turn and recalculate the safety level without it
-        new_levels = levels[:i] + levels[i+1:]
-        result = calculate_safety(new_levels)
-        if result:
+    violation = find_violation(levels)
+    if violation is None:
+        return True
+
+    for i in range(max(violation - 1, 0), violation + 2):
+        # Remove the candidate and recalculate the safety level without it
+        if find_violation(levels[:i] + levels[i+1:]) is None:
             return True
-    
+
     # If there is no way to make the report safe
     return False
 
+def classify_batch(data: list[str]) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Classifies many reports at once, as a padded NumPy matrix of levels.
+
+    A report is safe without dampening if every difference between consecutive levels is
+    good: between 1 and 3 in one direction. Removing level k leaves the differences before
+    k-1 and after k, and merges the two either side of it into one. So for each k, the
+    report can be made safe if all the differences before k-1 are good (a running AND from
+    the left), all those after k are good (a running AND from the right), and the merged
+    difference is good. Differences past the end of a report are padding, and count as
+    good.
+
+    Args:
+        data (list[str]): A list of strings, where each string contains space-separated
+                          numerical values representing levels of a report.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Boolean arrays of which reports are safe without and
+                                       with dampening.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError('The batch mode needs NumPy')
+
+    reports = [report for report in data if report.strip()]
+    lengths = np.array([len(report.split()) for report in reports], dtype = np.int64)
+    width = int(lengths.max(initial = 2))
+    flat = read_int_array((' ').join(reports))
+    levels = np.zeros((len(reports), width), dtype = np.int64)
+    levels[np.arange(width) < lengths[:, None]] = flat
+
+    differences = np.diff(levels, axis = 1)
+    padding = np.arange(width - 1) >= (lengths[:, None] - 1)
+    # The merged difference when removing level k (1 <= k <= width - 2)
+    merged = differences[:, :-1] + differences[:, 1:]
+    merged_padding = np.arange(1, width - 1) >= (lengths[:, None] - 1)
+
+    safe = np.zeros(len(reports), dtype = bool)
+    dampened = np.zeros(len(reports), dtype = bool)
+    for direction in [1, -1]:
+        good = ((direction * differences >= 1) & (direction * differences <= 3)) | padding
+        safe |= good.all(axis = 1)
+
+        # Whether all differences before index j are good, and from index j on
+        all_before = np.ones((len(reports), width + 1), dtype = bool)
+        all_before[:, 1:width] = np.logical_and.accumulate(good, axis = 1)
+        all_after = np.ones((len(reports), width + 1), dtype = bool)
+        all_after[:, :width - 1] = np.logical_and.accumulate(good[:, ::-1], axis = 1)[:, ::-1]
+
+        merged_good = np.ones((len(reports), width), dtype = bool)
+        merged_good[:, 1:width - 1] = (((direction * merged >= 1) & (direction * merged <= 3))
+                                       | merged_padding
+                                       )
+        k = np.arange(width)
+        removable = (all_before[:, np.maximum(k - 1, 0)]
+                     & all_after[:, k + 1]
+                     & merged_good
+                     & (k < lengths[:, None])
+                     )
+        dampened |= removable.any(axis = 1)
+
+    return safe, dampened | safe
+
 def calculate_result(data: list[str]) -> tuple[int, int]:
     """
     Evaluates a list of safety reports and counts how many are safe based on two criteria.
@@ -82,6 +154,8 @@ def calculate_result(data: list[str]) -> tuple[int, int]:
     - Part 2: A report is also considered safe if it can be made safe by "dampening": removing 
         one element, as determined by `calculate_safety_part2`.
 
+    If NumPy is installed, the reports are classified together by `classify_batch`.
+
     Args:
         data (list[str]): A list of strings, where each string contains space-separated
                           numerical values representing levels of a report.
@@ -91,11 +165,17 @@ def calculate_result(data: list[str]) -> tuple[int, int]:
             - The first integer is the count of reports that are safe according to Part 1.
             - The second integer is the count of reports that are safe according to Part 2.
     """
+    if np is not None:
+        safe, dampened = classify_batch(data)
+        return int(safe.sum()), int(dampened.sum())
+
     safe_reports_part1 = 0
     safe_reports_part2 = 0
     for report in data:
         # Split report into levels
         levels = [int(n) for n in report.split()]
+        if not levels: # Blank line
+            continue
         # Check whether report is inherently safe (before dampening)
         report_is_safe_part1 = calculate_safety(levels)
         if report_is_safe_part1:
@@ -108,14 +188,28 @@ def calculate_result(data: list[str]) -> tuple[int, int]:
     
     return safe_reports_part1, safe_reports_part2
 
-inputfile = Path('day02.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of safe reports, without and with the Problem Dampener.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 counts of safe reports.
+    """
+    data = read_lines(puzzle_input)
+
+    return calculate_result(data)
 
-part1_result, part2_result = calculate_result(data)
+if __name__ == '__main__':
+    with map_input(Path('day02.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 269:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 337:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 269:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 337:
+        print('PASS')
@@ -1,96 +1,80 @@
 import re
-
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, iter_chunks, map_input
+
 example1 = '''xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))'''
 example2 = '''xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))'''
 
-def read_inputfile(inputfile: Path) -> str:
-    """
-    Reads a text file and returns its content as a single string.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        str: The content of the file as a single string.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.read()
-
-    return data
+# Multiplications take 1-3 digit numbers, so no instruction is longer than "mul(999,999)"
+INSTRUCTION_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+MAX_INSTRUCTION_LENGTH = len('mul(999,999)')
 
-def execute_multiplication_instruction(instruction: str) -> int:
+def scan_memory(chunks: Iterable[bytes]) -> tuple[int, int]:
     """
-    Parses a multiplication instruction from a string and returns the product of the two numbers.
+    Executes the instructions in a memory dump, read as a stream of chunks, for both parts
+    at once.
 
-    The input string is expected to be in the format "mul(x,y)" where x and y are integers.
+    Instructions may be split across chunks, so the last few bytes of each chunk, which
+    could be the start of an unfinished instruction, are carried over and scanned again
+    with the next one. Since instructions have a maximum length, only that much is ever
+    carried, and memory use does not grow with the size of the dump.
 
     Args:
-        instruction (str): A string containing the multiplication instruction in the format "mul(x,y)".
+        chunks (Iterable[bytes]): The memory dump, in order, in chunks of any size.
 
     Returns:
-        int: The product of the two integers extracted from the instruction.
+        tuple[int, int]: The sum of all multiplications (Part 1), and of those enabled by
+                         the most recent "do()" or "don't()" instruction (Part 2).
     """
-    # Parse the two numbers to be multiplied, as strings
-    first = instruction.partition('mul(')[2].partition(',')[0]
-    second = instruction.partition(',')[2].partition(')')[0]
-
-    # Convert to integers and multiply them
-    first = int(first)
-    second = int(second)
-    product = first * second
-
-    return product
-
-def follow_instructions(matches: list[str]):
-    """
-    Processes a list of instructions to calculate a result based on conditional execution.
-
-    The function iterates over a list of instructions, enabling or disabling multiplication
-    based on the control instructions ("don't()" and "do()"). Only when multiplication is 
-    enabled, the function executes multiplication instructions and sums their results.
+    part1_result = 0
+    part2_result = 0
+    multiplication_enabled = True
+    carry = b''
+    # A final None flushes the carried bytes
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            buffer = carry
+            cutoff = len(buffer)
+        else:
+            buffer = carry + chunk
+            # Instructions starting after here may not be complete yet
+            cutoff = len(buffer) - MAX_INSTRUCTION_LENGTH + 1
+
+        resume = max(cutoff, 0)
+        for match in INSTRUCTION_PATTERN.finditer(buffer):
+            if match.start() >= cutoff:
+                break
+            resume = max(resume, match.end())
+            if match[1] is not None:
+                product = int(match[1]) * int(match[2])
+                part1_result += product
+                if multiplication_enabled:
+                    part2_result += product
+            else:
+                multiplication_enabled = match[0] == b'do()'
+        carry = buffer[resume:]
 
-    Args:
-        matches (list[str]): A list of strings containing instructions. These can include:
-                             - Control instructions: "don't()" to disable multiplication,
-                               and "do()" to enable it.
-                             - Multiplication instructions in the format "mul(x,y)" where
-                               x and y are integers.
+    return part1_result, part2_result
 
-    Returns:
-        int: The cumulative result of executing enabled multiplication instructions.
-    """
-    result = 0 # Initial value
-    multiplication_enabled = True
-    for instruction in matches:
-        # Ignore multiplication functions following a "don't()" instruction
-        if instruction.startswith('don\'t('):
-            multiplication_enabled = False
-        # Enable multiplication function following a "do()" instruction
-        elif instruction.startswith('do('):
-            multiplication_enabled = True
-        # If multiplication is enabled, run the multiplication instruction and add it to result
-        elif multiplication_enabled:
-            product = execute_multiplication_instruction(instruction)
-            result += product
-    
-    return result
-
-def calculate_results(data: str):
+def calculate_results(data: PuzzleInput, chunk_size: int = 2**20) -> tuple[int, int]:
     """
     Calculates results based on multiplication instructions and control commands within a string.
 
-    This function processes the input string to extract and execute multiplication instructions
-    under two different scenarios:
+    The instructions are scanned in a single streaming pass under two different scenarios:
     - Part 1: Only multiplication instructions are considered.
     - Part 2: Both multiplication instructions and control commands ("do()" and "don't()") are
               considered, affecting whether multiplication instructions are enabled.
 
     Args:
-        data (str): A string containing instructions. Instructions can include:
-                    - Multiplication instructions in the format "mul(x,y)".
-                    - Control instructions "do()" to enable and "don't()" to disable multiplication.
+        data (PuzzleInput): A string or buffer containing instructions. Instructions can
+                            include:
+                            - Multiplication instructions in the format "mul(x,y)".
+                            - Control instructions "do()" to enable and "don't()" to disable
+                              multiplication.
+        chunk_size (int, optional): The number of bytes to scan at a time. Defaults to 1 MiB.
 
     Returns:
         Tuple[int, int]: A tuple containing two integers:
@@ -98,22 +82,28 @@ def calculate_results(data: str):
             - The second integer is the result of executing multiplication instructions with control 
               commands (Part 2).
     """
-    part1_matches = re.findall(r"mul\(\d+,\d+\)", data)
-    part2_matches = re.findall(r"mul\(\d+,\d+\)|do\(\)|don't\(\)", data)
-
-    part1_result = follow_instructions(part1_matches)
-    part2_result = follow_instructions(part2_matches)
+    return scan_memory(iter_chunks(data, chunk_size))
 
-    return part1_result, part2_result
-
-inputfile = Path('day03.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the sum of all multiplications, and of only the enabled ones.
 
-part1_result, part2_result = calculate_results(data)
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
 
-print('Day 1:', part1_result)
-if part1_result == 175615763:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 74361272:
-    print('PASS')
\ No newline at end of file
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    return calculate_results(puzzle_input)
+
+if __name__ == '__main__':
+    with map_input(Path('day03.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 175615763:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 74361272:
+        print('PASS')
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = '''47|53
     97|13
     97|61
@@ -30,22 +32,6 @@ example = '''47|53
     97,13,75,29,47'''
 example = example.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def parse_protocol(data: list[str]) -> tuple[list[list[str, str]], list[str]]:
     """
     Parses protocol data into two sections based on line formats.
@@ -188,15 +174,30 @@ def check_all_updates(section1: list[list[str, str]], section2: list[str]) -> tu
     
     return part1_result, part2_result
 
-inputfile = Path('day05.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the middle page sums of correctly-ordered and of fixed updates.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    section1, section2 = parse_protocol(data)
+
+    return check_all_updates(section1, section2)
 
-section1, section2 = parse_protocol(data)
-part1_result, part2_result = check_all_updates(section1, section2)
+if __name__ == '__main__':
+    with map_input(Path('day05.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 6242:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 5169:
-    print('PASS')
+    print('Day 1:', part1_result)
+    if part1_result == 6242:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 5169:
+        print('PASS')
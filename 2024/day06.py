@@ -1,5 +1,11 @@
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.loader import PuzzleInput, map_input, read_lines
+from aoc.trace import get_tracer
+
+tracer = get_tracer(__name__)
+
 example='''....#.....
     .........#
     ..........
@@ -12,46 +18,29 @@ example='''....#.....
     ......#...'''
 example = example.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
-def find_guard(grid: list[str]) -> tuple[int, int]:
+def find_guard(grid: Grid) -> int:
     """
     Finds the position of a guard character in a grid.
 
-    This function searches through a grid of strings to find the first occurrence
-    of any specified guard character from the global list, and returns its coordinates.
+    This function searches through the grid to find the first occurrence of any specified 
+    guard character from the global list, and returns its position.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
+        grid (Grid): The grid of the area being patrolled.
 
     Returns:
-        tuple[int, int]: A tuple containing the x and y coordinates of the first found guard 
-            character.
+        int: The flat grid index of the first found guard character.
         None: If no guard character is found. This should not happen
     """
-    for y, line in enumerate(grid):
-        for x, posn in enumerate(line):
-            if posn in guard:
-                return (x,y)
+    for sprite in guard:
+        guard_posn = grid.find(sprite)
+        if guard_posn is not None:
+            return guard_posn
             
-def take_step(grid: list[str], 
-              guard_posn: tuple[int, int], 
+def take_step(grid: Grid, 
+              guard_posn: int, 
               guard_sprite: 'str'
-              ) -> tuple[str, tuple[int, int], bool]:
+              ) -> tuple[str, int, bool]:
     """
     Moves a guard within a grid based on its current direction and handles obstacles.
 
@@ -61,9 +50,8 @@ def take_step(grid: list[str],
     to simulate a change in direction.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-        guard_posn (tuple[int, int]): A tuple representing the current x and y coordinates of 
-                                      the guard.
+        grid (Grid): The grid of the area being patrolled.
+        guard_posn (int): The flat grid index of the guard's current position.
         guard_sprite (str): A character representing the guard's current direction, used to 
                             determine movement.
 
@@ -71,58 +59,49 @@ def take_step(grid: list[str],
         tuple: A tuple containing:
             - The updated guard sprite (str), indicating the guard's new direction if it has 
               changed.
-            - The new position (tuple[int, int]) of the guard.
+            - The new position (int) of the guard, as a flat grid index.
             - A boolean indicating completion (or not) of the guard's path through the area. 
     """
-    x, y = guard_posn
-    delta_x, delta_y = guard_directions[guard_sprite]
-    next_x = x + delta_x
-    next_y = y + delta_y
+    heading = guard.index(guard_sprite)
+    next_posn = guard_posn + grid.orthogonal[heading]
 
     # Check whether the guard remains in the area
-    if 0 <= next_x < len(grid[0]) and 0 <= next_y < len(grid):
-        potential_new_position = grid[next_y][next_x]
-    else: # Guard has left the area and her path is complete
+    if not grid.in_grid(next_posn): # Guard has left the area and her path is complete
         return guard_sprite, guard_posn, True
 
-    if potential_new_position != '#': # Guard moves forwards
-        return guard_sprite, (next_x, next_y), False
+    if grid[next_posn] != '#': # Guard moves forwards
+        return guard_sprite, next_posn, False
     else: # There's an obstacle, "#"
-        next_sprite_index = (guard.index(guard_sprite) + 1) % 4
+        next_sprite_index = (heading + 1) % 4
         return guard[next_sprite_index], guard_posn, False
 
-def add_obstacle(grid: list[str], obstacle_posn: tuple[int, int]) -> list[str] | None:
+def add_obstacle(grid: Grid, obstacle_posn: int) -> bool:
     """
     Adds an obstacle to a specified position in a grid, if the position can receive an obstacle.
 
-    This function attempts to place an obstacle ('#') at the given coordinates in the grid.
-    If the position is already occupied by a guard or an existing obstacle, the operation
-    is aborted, and None is returned.
+    This function attempts to place an obstacle ('#') at the given position, changing the 
+    grid in place. If the position is already occupied by a guard or an existing obstacle, 
+    the operation is aborted and the grid is left unchanged.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-        obstacle_posn (tuple[int, int]): A tuple representing the x and y coordinates where
-                                         the obstacle should be placed.
+        grid (Grid): The grid of the area being patrolled.
+        obstacle_posn (int): The flat grid index where the obstacle should be placed.
 
     Returns:
-        list[str]: A new grid with the obstacle added, if the position is valid. 
-        None: If the position is disallowed.
+        bool: True if the obstacle was added; False if the position is disallowed.
     """
-    x, y = obstacle_posn
-    new_grid = grid[:]
     disallowed_positions = guard + ['#']
-    if new_grid[y][x] in disallowed_positions:
-        return None
+    if grid[obstacle_posn] in disallowed_positions:
+        return False
 
     else:
-        original_line = new_grid[y]
-        new_grid[y] = original_line[:x] + '#' + original_line[(x+1):]
-        return new_grid
+        grid[obstacle_posn] = '#'
+        return True
 
-def add_to_path(path: dict[tuple[int, int], list[str]],
+def add_to_path(path: dict[int, list[str]],
                 guard_sprite: str,
-                guard_posn: tuple[int, int]
-                ) -> tuple[dict[tuple[int, int], list[str]], bool]:
+                guard_posn: int
+                ) -> tuple[dict[int, list[str]], bool]:
     """
     Adds the current guard position and sprite to the path, indicating traversal.
 
@@ -131,11 +110,10 @@ def add_to_path(path: dict[tuple[int, int], list[str]],
     True to indicate redundancy; otherwise, it updates the path and returns False.
 
     Args:
-        path (dict): A dictionary where keys are tuples representing positions (x, y) and
+        path (dict): A dictionary where keys are flat grid indices of positions and
                      values are lists of guard sprites that have been at those positions.
         guard_sprite (str): A character representing the guard's current direction.
-        guard_posn (tuple[int, int]): A tuple representing the current x and y coordinates of 
-                                      the guard.
+        guard_posn (int): The flat grid index of the guard's current position.
 
     Returns:
         tuple[dict, bool]: A tuple containing:
@@ -154,8 +132,7 @@ def add_to_path(path: dict[tuple[int, int], list[str]],
         
     return path, False
 
-def find_guard_path(grid: list[str]
-                    ) -> dict[tuple[int, int], list[str]] | None:
+def find_guard_path(grid: Grid) -> dict[int, list[str]] | None:
     """
     Determines the path of a guard moving through a grid until it completes a path or loops.
 
@@ -164,16 +141,16 @@ def find_guard_path(grid: list[str]
     path if it terminates normally, or None if the path forms a loop.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
+        grid (Grid): The grid of the area being patrolled.
 
     Returns:
-        dict[tuple[int, int], list[str]]: A dictionary mapping each position (x, y) to
-                                          a list of guard directions previously encountered at 
-                                          that position, if the path is finite.
+        dict[int, list[str]]: A dictionary mapping each position (as a flat grid index) to
+                              a list of guard directions previously encountered at that 
+                              position, if the path is finite.
         None: If the path turns into a loop.
     """
     guard_posn = find_guard(grid)
-    guard_sprite = grid[guard_posn[1]][guard_posn[0]]
+    guard_sprite = grid[guard_posn]
 
     complete = False
     path = {}
@@ -189,17 +166,18 @@ def find_guard_path(grid: list[str]
     
     return path
 
-def run(grid: list[str]) -> tuple[int, int]:
+def run(data: list[str]) -> tuple[int, int]:
     """
     Simulates the movement of a guard through a grid and evaluates the impact of adding 
     obstacles.
 
     This function calculates the length of the guard's path without obstacles and then attempts
     to add obstacles at each position in the grid. It counts how many obstacle placements result
-    in the guard's path forming a loop.
+    in the guard's path forming a loop. Each obstacle is added to the grid in place, and removed
+    again once the guard's new path is known.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
+        data (list[str]): A list of strings representing the grid, where each string is a row.
 
     Returns:
         tuple[int, int]: A tuple containing:
@@ -207,37 +185,48 @@ def run(grid: list[str]) -> tuple[int, int]:
             - The number of successful obstacle placements that cause the guard's path to loop
               (successful_obstacles).
     """
+    grid = Grid(data)
     path = find_guard_path(grid)
     part1_result = len(path)
 
     # Part 2
     successful_obstacles = 0
-    for y, line in enumerate(grid):
-        for x, posn in enumerate(line):
-            # I could have made this much faster by checking for previous subpaths. But I didn't
-            new_grid = add_obstacle(grid, (x,y))
-            if new_grid: # If there wasn't already an obstacle here
-                print('Running position', f'({x}, {y})')
-                path = find_guard_path(new_grid)
-                if not path:
-                    successful_obstacles += 1
+    for posn in grid.indices():
+        # I could have made this much faster by checking for previous subpaths. But I didn't
+        if add_obstacle(grid, posn): # If there wasn't already an obstacle here
+            if tracer.debug:
+                tracer.log('Running position', grid.coords(posn))
+            path = find_guard_path(grid)
+            if not path:
+                successful_obstacles += 1
+            grid[posn] = '.' # Remove the obstacle again
 
     return part1_result, successful_obstacles
 
-guard_directions = {'^': (0, -1),
-                    '>': (1, 0),
-                    'v': (0, 1),
-                    '<': (-1, 0)
-                    }
-guard = list(guard_directions.keys())
-
-inputfile = Path('day06.txt')
-data = read_inputfile(inputfile)
-part1_result, part2_result = run(data)
-
-print('Day 1:', part1_result)
-if part1_result == 4789:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 1304:
-    print('PASS')
\ No newline at end of file
+guard = ['^', '>', 'v', '<'] # Clockwise from N, in the same order as Grid.orthogonal
+
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the guard's path length and the number of looping obstacles.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
+
+if __name__ == '__main__':
+    with map_input(Path('day06.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 4789:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 1304:
+        print('PASS')
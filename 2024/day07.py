@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = '''190: 10 19
     3267: 81 40 27
     83: 17 5
@@ -11,22 +13,6 @@ example = '''190: 10 19
     292: 11 6 16 20'''
 example = example.split('\n    ')
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def evaluate_combinations(initial_results: list[int], 
                           values: list[int],
                           part2 = False
@@ -157,14 +143,28 @@ def run(data):
 
     return part1_result, part2_result
 
-inputfile = Path('day07.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the total calibration result without and with concatenation.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(data)
+if __name__ == '__main__':
+    with map_input(Path('day07.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 2314935962622:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 401477450831495:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 2314935962622:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 401477450831495:
+        print('PASS')
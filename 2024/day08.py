@@ -1,6 +1,8 @@
 import itertools
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example1 = '''............
     ........0...
     .....0......
@@ -15,22 +17,6 @@ example1 = '''............
     ............'''
 example1 = example1.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def find_antennae(grid: list[str]
                   ) -> dict[str, list[tuple[int, int]]]:
     """
@@ -197,14 +183,28 @@ def run(grid: list[str]) -> tuple[int, int]:
 
     return len(antinodes), len(antinodes_part2)
 
-inputfile = Path('day08.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of antinodes without and with resonant harmonics.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(data)
+if __name__ == '__main__':
+    with map_input(Path('day08.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 392:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 1235:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 392:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 1235:
+        print('PASS')
@@ -47,4 +47,12 @@ def run(grid):
     for trailhead in trailheads.keys():
         trailheads[trailhead] = take_step(grid, trailhead)
     
-    return trailheads
\ No newline at end of file
+    return trailheads
+
+def solve(puzzle_input):
+    # Unfinished: run() does not yet give the correct trailhead scores (8 rather than 36 for
+    # the example), so neither part is solved
+    return None, None
+
+if __name__ == '__main__':
+    print(run(example))
\ No newline at end of file
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example1 = """########
     #..O.O.#
     ##@.O..#
@@ -35,21 +38,6 @@ example2 = """##########
     v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^"""
 example2 = example2.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns its contents, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        str: A string representing the file contents, with leading/trailing whitespace removed. 
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def parse_data(data: list[str]) -> tuple[list[str], str]:
     """
     Parses input data into a grid sequence and movement instructions.
@@ -84,99 +72,84 @@ def parse_data(data: list[str]) -> tuple[list[str], str]:
 
     return grid, movements
 
-def find_robot(grid: list[str]) -> tuple[int, int]:
+def find_robot(grid: Grid) -> int:
     """
     Locates the position of a robot within a grid.
 
-    This function searches through a grid to find the coordinates of the robot,
-    which is represented by the '@' character. It returns the position as a 
-    tuple of indices.
+    This function searches through a grid to find the position of the robot,
+    which is represented by the '@' character. 
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each 
-                          string is a row. Each character in the grid represents 
-                          a grid position (wall, box, space, or robot).
+        grid (Grid): The warehouse grid. Each cell represents a grid position 
+                     (wall, box, space, or robot).
 
     Returns:
-        tuple[int, int]: A tuple containing the x and y coordinates of the 
-                         robot in the grid.
+        int: The flat grid index of the robot.
         None: If the robot is not found. This should not happen. 
     """
-    for x, line in enumerate(grid):
-        for y, posn in enumerate(line):
-            if posn == '@': # Robot sprite
-                return (x,y)
+    return grid.find('@') # Robot sprite
 
-def get_sprite_in_front(grid: list[str],
-                        posn: tuple[int, int],
+def get_sprite_in_front(grid: Grid,
+                        posn: int,
                         direction: str
-                        ) -> tuple[str, int, int]:
+                        ) -> tuple[str, int]:
     """
     Determines the sprite and position directly in front of a given position 
     in a specified direction.
 
     This function calculates the position directly in front of the current 
     position based on the given direction. It returns the sprite at that 
-    position, along with its coordinates.
+    position, along with its position.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each 
-                          string is a row.
-        posn (tuple[int, int]): A tuple of integers representing the current x 
-                                and y coordinates.
+        grid (Grid): The warehouse grid.
+        posn (int): The flat grid index of the current position.
         direction (str): A string representing the direction to look in, where 
                          valid keys correspond to entries in the `directions` 
                          dictionary.
 
     Returns:
-        tuple[str, tuple[int, int]]: A tuple containing:
+        tuple[str, int]: A tuple containing:
             - The character (sprite) found at the next position in the 
               specified direction.
-            - A tuple of the next x and y coordinates.
+            - The flat grid index of the next position.
     """
-    x, y = posn
-    delta_x, delta_y = directions[direction]
-    next_x = x + delta_x
-    next_y = y + delta_y
-    sprite = grid[next_y][next_x]
+    next_posn = posn + grid.offset(*directions[direction])
+    sprite = grid[next_posn]
 
-    return sprite, (next_x, next_y)
+    return sprite, next_posn
 
-def move(grid: list[str],
-         posn: tuple[int, int],
+def move(grid: Grid,
+         posn: int,
          direction: str
-         ) -> tuple[list[str], tuple[int, int]]:
+         ) -> tuple[Grid, int]:
     """
     Moves a robot within a grid in a specified direction, handling obstacles 
     and movable boxes.
 
     This function attempts to move the robot from its current position in the 
     given direction. It does not move if a wall ('#') is obstructing, and moves 
-    boxes ('O') if they are not blocked. The grid is updated to reflect the 
-    new positions of any moved objects.
+    boxes ('O') if they are not blocked. The grid is updated in place to reflect 
+    the new positions of any moved objects.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each 
-                          string is a row. Characters in the grid include '.' 
-                          for empty space, '#' for walls, and 'O' for boxes.
-        posn (tuple[int, int]): A tuple representing the current x and y 
-                                coordinates of the robot.
+        grid (Grid): The warehouse grid. Cells include '.' for empty space, '#' for 
+                     walls, and 'O' for boxes.
+        posn (int): The flat grid index of the robot's current position.
         direction (str): A string representing the direction to move, where 
                          valid keys correspond to entries in the `directions` 
                          dictionary.
 
     Returns:
-        tuple[list[str], tuple[int, int]]: A tuple containing:
+        tuple[Grid, int]: A tuple containing:
             - The updated grid after the move attempt.
-            - A tuple of the new x and y coordinates of the robot after the 
-              move.
+            - The flat grid index of the robot after the move.
 
     Note: This function does not update the position of the robot sprite, since 
           it is deemed not to matter. 
     """
     # Find out about the potential next position
     sprite_in_front, next_posn = get_sprite_in_front(grid, posn, direction)
-    next_x, next_y = next_posn
 
     if sprite_in_front == '#': # Nothing can move
         return grid, posn
@@ -184,25 +157,21 @@ def move(grid: list[str],
         sprite_posn = next_posn
         while True:
             next_sprite, sprite_posn = get_sprite_in_front(grid, sprite_posn, direction)
-            sprite_in_front = f'{sprite_in_front}{next_sprite}'
             if next_sprite != 'O': # End of decision-making
                 break
-        if sprite_in_front.endswith('#'): # Nothing can move
+        if next_sprite == '#': # Nothing can move
             return grid, posn
         else: # We move a series of at least 1 boxes, and the robot
             # Update the last place pushed to be a box
-            sprite_x, sprite_y = sprite_posn
-            sprite_line = grid[sprite_y]
-            grid[sprite_y] = sprite_line[:sprite_x] + 'O' + sprite_line[sprite_x+1:]
+            grid[sprite_posn] = 'O'
             # Update the position the robot moved to
-            robot_line = grid[next_y]
-            grid[next_y] = robot_line[:next_x] + '.' + robot_line[next_x+1:]
+            grid[next_posn] = '.'
 
             return grid, next_posn
     else:
         return grid, next_posn # Only the robot moves
 
-def calculate_gps_sum(grid: list[str]) -> int:
+def calculate_gps_sum(grid: Grid) -> int:
     """
     Calculates the sum of GPS coordinates for boxes ('O') in a grid.
 
@@ -212,21 +181,19 @@ def calculate_gps_sum(grid: list[str]) -> int:
     GPS coordinates.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each 
-                          string is a row. The character 'O' represents a box 
-                          whose GPS coordinate is to be calculated.
+        grid (Grid): The warehouse grid. The character 'O' represents a box 
+                     whose GPS coordinate is to be calculated.
 
     Returns:
         int: The sum of all GPS coordinates for the boxes ('O') found in the 
              grid.
     """
     result = 0
-    for y, line in enumerate(grid):
-        for x, posn in enumerate(line):
-            if posn == 'O':
-                # Calculate GPS coordinate and add it to the running total
-                gps_coordinate = (100 * y) + x
-                result += gps_coordinate
+    for posn in grid.find_all('O'):
+        x, y = grid.coords(posn)
+        # Calculate GPS coordinate and add it to the running total
+        gps_coordinate = (100 * y) + x
+        result += gps_coordinate
     
     return result
 
@@ -252,7 +219,8 @@ def run(data: list[str]) -> int:
              executing all movements.
     """
     # Split the input into the map and the movement instructions
-    grid, movements = parse_data(data)
+    rows, movements = parse_data(data)
+    grid = Grid(rows)
     robot = find_robot(grid)
 
     # Execute all movement instructions
@@ -263,17 +231,33 @@ def run(data: list[str]) -> int:
 
     return part1_result
 
-inputfile = Path(r"day15.txt")
-data = read_inputfile(inputfile)
-
 directions = {'<': (-1, 0),
               'v': (0, 1),
               '>': (1, 0),
               '^': (0, -1)
               }
 
-part1_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves Part 1: the sum of box GPS coordinates after all robot movements.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the Part 1 result, and None since Part 2
+            is not solved.
+    """
+    data = read_lines(puzzle_input)
+    part1_result = run(data)
+
+    return part1_result, None
+
+if __name__ == '__main__':
+    with map_input(Path('day15.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 1463715:
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 1463715:
+        print('PASS')
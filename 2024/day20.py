@@ -1,6 +1,9 @@
 from collections import deque
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """###############
     #...#...#.....#
     #.#.#.#.#.###.#
@@ -18,200 +21,149 @@ example = """###############
     ###############"""
 example = example.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
+def find_start_and_end(grid: Grid) -> tuple[int, int]:
     """
-    Reads a text file and returns its contents as a list of strings, with leading/trailing 
-    whitespace removed from each string.
+    Finds the positions of the start ('S') and end ('E') in a grid.
 
     Args:
-        inputfile (Path): The path to the input file to be read.
+        grid (Grid): The racetrack grid. The characters 'S' and 'E' indicate the start and 
+                     end positions, respectively.
 
     Returns:
-        list[str]: A list of strings representing the file contents, with leading/trailing 
-                   whitespace removed from each string. 
+        tuple[int, int]: A tuple containing the flat grid indices of the start and end 
+                         positions.
     """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
-def find_start_and_end(grid: list[str]) -> tuple[tuple[int, int], tuple[int, int]]:
-    """
-    Finds the coordinates of the start ('S') and end ('E') positions in a grid.
-
-    This function scans a grid represented as a list of strings to locate the positions
-    marked by 'S' (start) and 'E' (end). It returns the coordinates of these positions
-    as tuples.
+    return grid.find('S'), grid.find('E')
 
-    Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-                          The characters 'S' and 'E' indicate the start and end positions, 
-                          respectively.
-
-    Returns:
-        tuple[tuple[int, int], tuple[int, int]]: A tuple containing two tuples:
-            - The first tuple represents the (x, y) coordinates of the start position.
-            - The second tuple represents the (x, y) coordinates of the end position.
-    """
-    start = None
-    end = None
-    for y, row in enumerate(grid):
-        for x, posn in enumerate(row):
-            if posn == 'S': # Start
-                start = (x, y)
-            elif posn == 'E': # End
-                end = (x, y)
-        if start and end:
-            return start, end
-
-def validate_position(grid: list[str], 
-                      posn: tuple[int, int]
-                      ) -> bool:
+def validate_position(grid: Grid, posn: int) -> bool:
     """
     Validates whether a given position is within the internal area of a grid, excluding borders.
 
-    This function checks if the specified position (x, y) is located within the interior of the 
+    This function checks if the specified position is located within the interior of the 
     grid, ensuring it is also not on the border. The interior is defined as the area within the 
     grid that is not on the border.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-        posn (tuple[int, int]): A tuple of integers representing the (x, y) coordinates to 
-                                validate.
+        grid (Grid): The racetrack grid.
+        posn (int): The flat grid index of the position to validate.
 
     Returns:
         bool: True if the position is within the internal part of the grid; False if it is on the 
               border.
     """
-    x, y = posn
-    boundary = {'x_min': 1, 'x_max': len(grid[0]) - 1,
-                'y_min': 1, 'y_max': len(grid) - 1
-                }
+    x, y = grid.coords(posn)
         
-    if boundary['x_min'] <= x < boundary['x_max'] and \
-        boundary['y_min'] <= y < boundary['y_max']:
+    if 1 <= x < grid.width - 1 and 1 <= y < grid.height - 1:
         return True
     else:
         return False
 
 # Ok we're going to do one of those bfs things
-def bfs(grid: list[str], start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+def bfs(grid: Grid, start: int, end: int) -> list[int]:
     """
     Performs a breadth-first search (BFS) on a grid to find the shortest path from a start to an 
     end position.
 
     This function uses a queue to explore the grid from the start position, moving in all possible 
-    directions until the end position is reached. It returns the path taken as a list of coordinates, 
+    directions until the end position is reached. It returns the path taken as a list of positions, 
     or None if no path exists. Positions marked with '#' are walls that cannot be traversed.
 
     Args:
-        grid (list[list[str]]): A 2D list representing the grid, where each element is a character.
-                                The character '#' represents a wall.
-        start (tuple[int, int]): A tuple representing the starting coordinates (x, y) in the grid.
-        end (tuple[int, int]): A tuple representing the ending coordinates (x, y) in the grid.
+        grid (Grid): The racetrack grid. The character '#' represents a wall.
+        start (int): The flat grid index of the starting position.
+        end (int): The flat grid index of the ending position.
 
     Returns:
-        list[tuple[int, int]]: A list of tuples representing the path from the start to the end 
-                               coordinates, in order.
+        list[int]: A list of flat grid indices representing the path from the start to the end, 
+                   in order.
         None: If no path is found.
     """
+    # Work out the steps once, keeping the order of `directions`, which decides between 
+    # equally short paths
+    steps = [grid.offset(*direction) for direction in directions]
     queue = deque([start])
     path_so_far = {start: None} # dict of format {posn: previous_posn}
 
     while queue:
         current_posn = queue.popleft()
-        x, y = current_posn
         # If we finished, return the path we took from start to end
         if current_posn == end:
             path = []
-            while current_posn:
+            while current_posn is not None:
                 path.append(current_posn)
                 current_posn = path_so_far[current_posn]
             return path[::-1]
 
-        for direction in directions:
-            delta_x, delta_y = direction
-            next_x = x + delta_x
-            next_y = y + delta_y
+        for step in steps:
+            possible_next_step = current_posn + step
 
-            # Figure out whether we can move this way
-            if validate_position(grid, (next_x, next_y)) and \
-                grid[next_y][next_x] != '#':
-                possible_next_step = (next_x, next_y)
+            # Figure out whether we can move this way. The border is all wall, so this also 
+            # keeps us within the grid
+            if grid[possible_next_step] != '#':
                 # If we haven't been here, move & record where we've been
                 if possible_next_step not in path_so_far:
                     queue.append(possible_next_step)
                     path_so_far[possible_next_step] = current_posn
 
-def find_cheats(grid: list[str]) -> list[list[tuple[int, int], tuple[int, int]]]:
+def find_cheats(grid: Grid) -> list[tuple[int, int]]:
     """
     Identifies potential "cheat" moves within a grid, where a move bypasses a wall.
 
     This function scans the grid to find pairs of adjacent positions where the first is a wall
     ('#') and the second is not. It returns a list of such pairs, representing "cheat" moves 
-    of length 2 ps, that bypass walls.
+    of length 2 ps, that bypass walls. Each pair is only generated once, from its wall.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-                          The character '#' represents a wall.
+        grid (Grid): The racetrack grid. The character '#' represents a wall.
 
     Returns:
-        list[list[tuple[int, int], tuple[int, int]]]: A list of pairs, where each pair consists of
-        two tuples representing coordinates in the grid. Each pair indicates a move from a wall
-        to a viable path position.
+        list[tuple[int, int]]: A list of pairs of flat grid indices. Each pair indicates a move 
+                               from a wall to a viable path position.
     """
+    steps = [grid.offset(*direction) for direction in directions]
     cheats = []
-    for y, line in enumerate(grid):
-        for x, posn in enumerate(line):
-            for direction in directions:
-                delta_x, delta_y = direction
-                next_x = x + delta_x
-                next_y = y + delta_y
-                # Check cheat is within bounds
-                if validate_position(grid, (x, y)) and \
-                    validate_position(grid, (next_x, next_y)):
-                    cheat = [(x, y), (next_x, next_y)]
-                    # Check cheat goes from wall to non-wall and hasn't been done before
-                    if posn == '#' and grid[next_y][next_x] != '#' and cheat not in cheats:
-                        cheats.append(cheat)
+    for posn in grid.find_all('#'):
+        if not validate_position(grid, posn):
+            continue
+        for step in steps:
+            next_posn = posn + step
+            # Check cheat goes from wall to non-wall. Non-wall cells are never on the border
+            if grid[next_posn] != '#':
+                cheats.append((posn, next_posn))
 
     return cheats
 
-def add_cheat(grid: list[str], 
-              start: tuple[int, int], 
-              end: tuple[int, int], 
-              cheat: list[tuple[int, int], tuple[int, int]]
+def add_cheat(grid: Grid, 
+              start: int, 
+              end: int, 
+              cheat: tuple[int, int]
               ) -> int | None:
     """
-    Modifies a grid by applying a "cheat" move to potentially reduce the path length between two 
-    points.
+    Temporarily applies a "cheat" move to a grid to potentially reduce the path length between 
+    two points.
 
-    This function replaces specified "cheat" positions in the grid with passable terrain ('.') and
-    uses breadth-first search (BFS) to find a path from the start to the end position. It checks 
-    that the path includes a direct step from the first to the second cheat position, indicating a 
-    successful shortcut, and returns the length of the path if successful.
+    This function replaces the first "cheat" position in the grid with passable terrain ('.') and
+    uses breadth-first search (BFS) to find a path from the start to the end position, before 
+    restoring the wall. It checks that the path includes a direct step from the first to the 
+    second cheat position, indicating a successful shortcut, and returns the length of the path 
+    if successful.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
-        start (tuple[int, int]): The starting coordinates (x, y) for the pathfinding.
-        end (tuple[int, int]): The ending coordinates (x, y) for the pathfinding.
-        cheat (list[tuple[int, int], tuple[int, int]]): A list containing two tuples, each representing
-                                                        the coordinates of the positions to be modified
-                                                        for the cheat move.
+        grid (Grid): The racetrack grid. It is left unchanged once this function returns.
+        start (int): The flat grid index of the start position for the pathfinding.
+        end (int): The flat grid index of the end position for the pathfinding.
+        cheat (tuple[int, int]): The flat grid indices of the two positions of the cheat move.
 
     Returns:
         int: The length of the path from start to end if the cheat allows a direct step between
              the specified positions
         None: If the path does not include the cheat.
     """
-    this_grid = grid[:]
-    # Replace cheat0 position with '.'
-    cheat0_x, cheat0_y = cheat[0]
-    line = this_grid[cheat0_y]
-    this_grid[cheat0_y] = line[:cheat0_x] + '.' + line[cheat0_x+1:]
-
-    # Find shortest path within new grid
-    path = bfs(this_grid, start, end)
+    # Replace cheat0 position with '.', and find shortest path within new grid
+    grid[cheat[0]] = '.'
+    path = bfs(grid, start, end)
+    grid[cheat[0]] = '#'
+
     try:
         cheat0_index = path.index(cheat[0])
         cheat1_index = path.index(cheat[1])
@@ -220,7 +172,7 @@ def add_cheat(grid: list[str],
     if cheat1_index - cheat0_index == 1: # Stepped from Cheat 0 to Cheat 1
         return len(path) - 1 # Travel time in ps
 
-def run(grid: list[str]) -> int:
+def run(data: list[str]) -> int:
     """
     Calculates the potential time savings from applying "cheats" in a grid and returns the total time
     saved for significant shortcuts.
@@ -230,11 +182,12 @@ def run(grid: list[str]) -> int:
     the number of significant time savings (100 ps or more) and returns the total count.
 
     Args:
-        grid (list[str]): A list of strings representing the grid, where each string is a row.
+        data (list[str]): A list of strings representing the grid, where each string is a row.
 
     Returns:
         int: The total number of significant time savings (100 ps or more) from applying cheats.
     """
+    grid = Grid(data, border = '#')
     start, end = find_start_and_end(grid)
     baseline_path = bfs(grid, start, end) # Travel without cheating
     baseline = len(baseline_path) - 1 # Baseline travel time in ps
@@ -253,10 +206,27 @@ def run(grid: list[str]) -> int:
 
 directions = [(-1, 0), (0, -1), (1, 0), (0, 1)]
 
-inputfile = Path(r"day20.txt")
-data = read_inputfile(inputfile)
-part1_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves Part 1: the number of cheats saving at least 100 ps.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the Part 1 result, and None since Part 2
+            is not solved.
+    """
+    data = read_lines(puzzle_input)
+    part1_result = run(data)
+
+    return part1_result, None
+
+if __name__ == '__main__':
+    with map_input(Path('day20.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 1323:
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 1323:
+        print('PASS')
@@ -2,6 +2,10 @@ from collections import deque
 from pathlib import Path
 from typing import Any
 
+from aoc.trace import INFO, get_tracer
+
+tracer = get_tracer(__name__)
+
 example = '''029A
     980A
     179A
@@ -10,7 +14,8 @@ example = '''029A
 example = example.split()
 
 def find_button(button: Any, keypad: list[list[Any]]) -> tuple[int, int]:
-    print('finding', button)
+    if tracer.debug:
+        tracer.log('finding', button)
     for y, row in enumerate(keypad):
         for x, location in enumerate(row):
             if str(location) == button:
@@ -26,7 +31,8 @@ def move_to_button(actuator_pos: tuple[int, int],
     while True:
         delta_x = button_loc[0] - x
         delta_y = button_loc[1] - y
-        print('actuator', keypad[y][x])
+        if tracer.debug:
+            tracer.log('actuator', keypad[y][x])
         if delta_x > 0: # No empty gaps on the right
             movements.append('>')
             x += 1
@@ -51,7 +57,8 @@ def move_to_button(actuator_pos: tuple[int, int],
 
 def press_button(button, keypad, actuator_pos):
     button_loc = find_button(button, keypad)
-    print('move', actuator_pos, button_loc, keypad)
+    if tracer.debug:
+        tracer.log('move', actuator_pos, button_loc, keypad)
     movements = move_to_button(actuator_pos, button_loc, keypad)
 
     return movements, button_loc
@@ -67,7 +74,8 @@ def process_sequence(code, keypads, actuators):
             # Update actuator location
             actuator_pos = button_loc
             next_buttons += movements
-        print('current', current_buttons, next_buttons)
+        if tracer.debug:
+            tracer.log('current', current_buttons, next_buttons)
         current_buttons = next_buttons[:]
         # Update final actuator location in dictionary
         actuators[i] = button_loc
@@ -77,7 +85,8 @@ def process_sequence(code, keypads, actuators):
 def calculate_complexity(code: str, sequence: list[str]):
     numeric_code = ('').join([char for char in code if char.isdigit()])
 
-    print('complexity', len(sequence), int(numeric_code))
+    if tracer.info:
+        tracer.log('complexity', len(sequence), int(numeric_code), level = INFO)
 
     return len(sequence) * int(numeric_code)
 
@@ -89,18 +98,28 @@ def run(data, keypads, actuators):
 
     return complexity
 
+def initial_actuators():
+    # Position the actuators over the A buttons to start
+    directional_a = find_button('A', keypad_1)
+    actuators = {0: find_button('A', keypad_0),
+                 1: directional_a,
+                 2: directional_a,
+                 3: directional_a
+                 }
+
+    return actuators
+
+def solve(puzzle_input):
+    # Unfinished: run() doesn't give the shortest final sequences but possible sequences, so
+    # its complexity is not the answer and neither part is solved
+    return None, None
+
 keypad_0 = [[7, 8, 9], [4, 5, 6], [1, 2, 3], [None, 0, 'A']] # Door
 keypad_1 = [[None, '^', 'A'], ['<', 'v', '>']] # 3 directional keypads
 keypads = [keypad_0] + ([keypad_1] * 2) # Directional keypads have same format
 
-# Position the actuators over the A buttons to start
-directional_a = find_button('A', keypad_1)
-actuators = {0: find_button('A', keypad_0),
-             1: directional_a,
-             2: directional_a,
-             3: directional_a
-             }
-print('\n')
-
-# This doesn't give the shortest final sequence but a possible sequence
-run(example[:1], keypads, actuators)
\ No newline at end of file
+if __name__ == '__main__':
+    actuators = initial_actuators()
+
+    # This doesn't give the shortest final sequence but a possible sequence
+    run(example[:1], keypads, actuators)
\ No newline at end of file
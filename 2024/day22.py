@@ -1,39 +1,25 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, iter_ints, map_input
+
 example = """1
     10
     100
     2024"""
 example = example.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns its contents as a list of strings, with leading/trailing 
-    whitespace removed from each string.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list of strings representing the file contents, with leading/trailing 
-                   whitespace removed from each string. 
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
-def get_next_number(number: str) -> int:
+def get_next_number(number: int | str) -> int:
     """
     Computes a transformed number through a series of bitwise and arithmetic operations.
 
-    This function takes an input secret number as a string, converts it to an integer, 
+    This function takes an input secret number, converts it to an integer if needed, 
     and applies a series of transformations involving multiplication, bitwise XOR, and 
     modulus operations. The transformation is designed to produce a new number within 
     a specified range.
 
     Args:
-        number (str): A string representing the initial secret number to be transformed.
+        number (int | str): The initial secret number to be transformed, as an integer or a 
+                            string.
 
     Returns:
         int: The final secret number after applying the series of operations.
@@ -54,18 +40,17 @@ def get_next_number(number: str) -> int:
 
     return pruned3
 
-def run(data: list[str]) -> int:
+def run(data: list[int]) -> int:
     """
     Processes a list of seret numbers through iterative transformations and calculates 
     their sum after 2000 iterations of transforming each secret number.
 
-    This function takes a list of secret numbers as strings, applies a transformation 
-    function `get_next_number` to each number in a loop for 2000 iterations, collects 
-    the final transformed secret numbers, and returns their sum.
+    This function takes a list of secret numbers, applies a transformation function 
+    `get_next_number` to each number in a loop for 2000 iterations, collects the final 
+    transformed secret numbers, and returns their sum.
 
     Args:
-        data (list[str]): A list of strings, where each string represents a number to be 
-                          transformed.
+        data (list[int]): A list of initial secret numbers to be transformed.
 
     Returns:
         int: The sum of the final transformed numbers after applying the transformation 
@@ -83,10 +68,28 @@ def run(data: list[str]) -> int:
     
     return result
 
-inputfile = Path(r"day22.txt")
-data = read_inputfile(inputfile)
-part1_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves Part 1: the sum of each buyer's 2000th secret number.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the Part 1 result, and None since Part 2
+            is not solved.
+    """
+    # Parse the secret numbers straight from the input buffer
+    data = list(iter_ints(puzzle_input))
+    part1_result = run(data)
+
+    return part1_result, None
+
+if __name__ == '__main__':
+    with map_input(Path('day22.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 13429191512:
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 13429191512:
+        print('PASS')
@@ -1,6 +1,8 @@
 from itertools import combinations
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """kh-tc
     qp-kh
     de-cg
@@ -35,23 +37,6 @@ example = """kh-tc
     td-yn"""
 example = example.split()
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns its contents as a list of strings, with leading/trailing 
-    whitespace removed from each string.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list of strings representing the file contents, with leading/trailing 
-            whitespace removed from each string. 
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def add_computers_to_dict(computers: tuple[str, str],
                           groups: dict[str, set[str]]
                           ) -> dict[str, set[str]]:
@@ -210,13 +195,28 @@ def run(data: list[str]) -> tuple[int, str]:
 
     return len(chief_subnetworks), password
 
-inputfile = Path(r"day23.txt")
-data = read_inputfile(inputfile)
-part1_result, part2_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, str]:
+    """
+    Solves both parts: the number of chief triangles and the LAN party password.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, str]: A tuple containing the Part 1 count and the Part 2 password.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
+
+if __name__ == '__main__':
+    with map_input(Path('day23.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 1476:
-    print('PASS')
-print('Part 2:', part2_result)
-if part2_result == 'ca,dw,fo,if,ji,kg,ks,oe,ov,sb,ud,vr,xr':
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 1476:
+        print('PASS')
+    print('Part 2:', part2_result)
+    if part2_result == 'ca,dw,fo,if,ji,kg,ks,oe,ov,sb,ud,vr,xr':
+        print('PASS')
@@ -1,6 +1,8 @@
 from itertools import combinations
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """x00: 1
     x01: 0
     x02: 1
@@ -71,23 +73,6 @@ example2 = """x00: 0
     x05 AND y05 -> z00"""
 example2 = example2.split('\n    ')
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns its contents as a list of strings, with leading/trailing 
-    whitespace removed from each string.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list of strings representing the file contents, with leading/trailing 
-            whitespace removed from each string. 
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-
-    return [line.strip() for line in data]
-
 def parse_gate(line: str) -> dict[str, str | list[str, str]]:
     """
     Parses a string representing a logic gate operation into its components.
@@ -302,10 +287,27 @@ def run(data):
 
     return part1_result
 
-inputfile = Path(r"day24.txt")
-data = read_inputfile(inputfile)
-part1_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves Part 1: the decimal number output on the wires starting with "z".
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the Part 1 result, and None since Part 2
+            is not solved.
+    """
+    data = read_lines(puzzle_input)
+    part1_result = run(data)
+
+    return part1_result, None
+
+if __name__ == '__main__':
+    with map_input(Path('day24.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 55920211035878:
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 55920211035878:
+        print('PASS')
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_text
+
 example = """#####
     .####
     .####
@@ -41,21 +43,6 @@ example = """#####
     #####""".replace('    ', '')
 example = example.split('\n\n')
 
-def read_inputfile(inputfile: Path) -> str:
-    """
-    Reads a text file and returns its contents.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        str: A string representing the file contents. 
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.read()
-
-    return data
-
 def parse_data(data: list[str]) -> tuple[list[str], list[str]]:
     """
     Parses a list of strings containing newlines into locks and keys, respectively 
@@ -185,11 +172,27 @@ def run(data: list[str]) -> int:
     
     return keys_that_fit
 
-inputfile = Path(r"day25.txt")
-data = read_inputfile(inputfile)
-data = data.split('\n\n')
-part1_result = run(data)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves the puzzle: the number of unique lock/key pairs that fit together.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the result, and None since there is no
+            Part 2 puzzle.
+    """
+    data = read_text(puzzle_input).split('\n\n')
+    part1_result = run(data)
+
+    return part1_result, None
+
+if __name__ == '__main__':
+    with map_input(Path('day25.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Part 1:', part1_result)
-if part1_result == 3291:
-    print('PASS')
\ No newline at end of file
+    print('Part 1:', part1_result)
+    if part1_result == 3291:
+        print('PASS')
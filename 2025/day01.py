@@ -1,5 +1,10 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+from aoc.trace import get_tracer
+
+tracer = get_tracer(__name__)
+
 example = """L68
     L30
     R48
@@ -12,22 +17,6 @@ example = """L68
     L82"""
 example = example.split('\n    ')
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
 def move_dial(start_pos: int, direction: str, steps: int) -> tuple[int, int]:
     """
     Move a 0–DIAL_MAX circular dial left or right by a number of steps.
@@ -94,8 +83,8 @@ def read_instructions(data: list[str]):
               all instructions (as reported by move_dial).
 
     Side Effects:
-        Prints the position and times_passing_zero for each processed
-        instruction in the form: "<position> <times_passing_zero>".
+        Traces the position and times_passing_zero for each processed
+        instruction at debug level, in the form: "Dial <position> <times_passing_zero>".
 
     Raises:
         ValueError: If an instruction has an invalid direction or a non-integer
@@ -112,26 +101,29 @@ def read_instructions(data: list[str]):
         position, times_passing_zero = move_dial(position, direction, steps)
         if position == 0:
             zero_positions += 1
-        print(position, times_passing_zero)
+        if tracer.debug:
+            tracer.log('Dial', position, times_passing_zero)
         zero_passed += times_passing_zero
 
     return zero_positions, zero_passed
 
-inputfile = Path('day01.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of times the dial lands on zero, and passes zero.
 
-START = 50
-DIAL_MAX = 99
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
 
-part1_result, part2_result = read_instructions(data)
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 counts.
+    """
+    data = read_lines(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 995:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 5847:
-    print('PASS')
+    return read_instructions(data)
 
+START = 50
+DIAL_MAX = 99
 
 def move_dial_tests():
     """
@@ -160,4 +152,15 @@ def move_dial_tests():
 
     for start_pos, direction, steps, expected in test_cases:
         result = move_dial(start_pos, direction, steps)
-        assert result == expected, f"move_dial({start_pos}, {direction}, {steps}) = {result}, expected {expected}"
\ No newline at end of file
+        assert result == expected, f"move_dial({start_pos}, {direction}, {steps}) = {result}, expected {expected}"
+
+if __name__ == '__main__':
+    with map_input(Path('day01.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 995:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 5847:
+        print('PASS')
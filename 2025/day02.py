@@ -2,22 +2,12 @@ from pathlib import Path
 
 from deprecation import deprecated
 
-example = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124"
-
-def read_inputfile(inputfile: Path) -> str:
-    """
-    Reads a text file and returns it as a string, with leading/trailing whitespace removed.
+from aoc.loader import PuzzleInput, map_input, read_text
+from aoc.trace import get_tracer
 
-    Args:
-        inputfile (Path): The path to the input file to be read.
+tracer = get_tracer(__name__)
 
-    Returns:
-        str: The data string from the file, with whitespace removed
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.read()
-    
-    return data.strip()
+example = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124"
 
 def parse_data(data: str) -> list[tuple[int, int]]:
     """Parses a comma-separated list of hyphen-delimited ranges.
@@ -70,11 +60,13 @@ def has_repeat(value: str) -> bool:
     max_len_repeat = len_value // 2 # Repeating section can have up to half the length
     for i in range(max_len_repeat):
         for j in range(len_value - i):
-            print(i, '\t', j, '\t', value[j:j+i+1])
+            if tracer.debug:
+                tracer.log('Substring', i, j, value[j:j+i+1])
             substring = value[j : j+i+1]
             try:
                 if substrings[-(i+1)] == substring:
-                    print(substring, substrings)
+                    if tracer.debug:
+                        tracer.log('Repeat', substring, substrings)
                     return True
             except IndexError:
                 pass
@@ -209,14 +201,28 @@ def run(data: str) -> tuple[int, int]:
 
     return day1_result, day2_result
 
-inputfile = Path('day02.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the sums of invalid IDs under the two repetition rules.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_text(puzzle_input).strip()
+
+    return run(data)
 
-part1_result, part2_result = run(data)
+if __name__ == '__main__':
+    with map_input(Path('day02.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 30608905813:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 31898925685:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 30608905813:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 31898925685:
+        print('PASS')
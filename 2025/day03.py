@@ -1,27 +1,13 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """987654321111111
     811111111111119
     234234234234278
     818181911112111"""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
 def max_joltage(battery_str: str) -> int:
     """
     Compute the highest possible two-digit “joltage” from the digits of a string of batteries 
@@ -135,14 +121,28 @@ def run(batteries: list[str]) -> tuple[int, int]:
     
     return part1_result, part2_result
 
-inputfile = Path('day03.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the total output joltage using 2 and 12 batteries per bank.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(data)
+if __name__ == '__main__':
+    with map_input(Path('day03.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 17155:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 169685670469164:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 17155:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 169685670469164:
+        print('PASS')
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """..@@.@@@@.
     @@@.@.@.@@
     @@@@@.@.@@
@@ -12,107 +15,73 @@ example = """..@@.@@@@.
     @.@.@@@.@."""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
+def analyse_surroundings(grid: Grid, posn: int) -> int:
     """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
+    Count the number of adjacent '@' symbols around a grid position.
 
-def analyse_surroundings(data: list[str], x: int, y: int) -> int:
-    """
-    Count the number of adjacent '@' symbols around a grid coordinate.
-
-    Checks the eight neighboring positions (as defined by the iterable
-    `surroundings` of (dx, dy) offsets) around the cell at (x, y) in the
-    2D character grid `data`. In-bounds neighbors with the character '@'
-    are counted.
+    Checks the eight neighboring positions (as given by the grid's `surrounding`
+    offsets) around the cell at `posn`. Neighbors with the character '@' are
+    counted.
 
     Args:
-        data (list[str]): Rectangular grid represented as a list of equal-length
-            strings, where data[y][x] accesses the character at (x, y).
-        x (int): Zero-based column index of the reference cell.
-        y (int): Zero-based row index of the reference cell.
+        grid (Grid): Rectangular character grid.
+        posn (int): Flat grid index of the reference cell.
 
     Returns:
         int: The number of adjacent cells containing '@'.
 
     Notes:
-        - Cells outside the grid boundaries are ignored.
+        - Cells outside the grid boundaries are border cells, so are never counted.
     """
     adjacent_rolls = 0
-    max_x = len(data[0])
-    max_y = len(data)
-
-    for delta_x, delta_y in surroundings:
-        new_x = x + delta_x
-        new_y = y + delta_y
-        if 0 <= new_x < max_x and 0 <= new_y < max_y:
-            new_char = data[new_y][new_x]
-            if new_char == '@':
-                adjacent_rolls += 1
+    for offset in grid.surrounding:
+        if grid[posn + offset] == '@':
+            adjacent_rolls += 1
     
     return adjacent_rolls
 
-def run_part1(data: list[str]) -> list[tuple[int, int]]:
+def run_part1(grid: Grid) -> list[int]:
     """
     Find all '@' positions with fewer than four adjacent '@' neighbors.
 
-    Scans the 2D grid and, for each cell containing '@', counts adjacent '@'
+    Scans the grid and, for each cell containing '@', counts adjacent '@'
     using analyse_surroundings. Rolls with a neighbor count less than 4 are
     collected as accessible rolls.
 
     Args:
-        data (list[str]): Rectangular character grid represented as a list of
-            equal-length strings.
+        grid (Grid): Rectangular character grid.
 
     Returns:
-        list[tuple[int, int]]: List of (x, y) coordinates where the cell is '@'
-        and has fewer than four adjacent '@' cells.
+        list[int]: List of flat grid indices where the cell is '@' and has fewer
+        than four adjacent '@' cells.
     """
     accessible_rolls = []
 
-    for y, row in enumerate(data):
-        for x, char in enumerate(row):
-            if char == '@':
-                adjacent_rolls = analyse_surroundings(data, x, y)
-                # print(x+1, y+1, adjacent_rolls)
-                if adjacent_rolls < 4:
-                    accessible_rolls.append((x, y))
+    for posn in grid.find_all('@'):
+        adjacent_rolls = analyse_surroundings(grid, posn)
+        if adjacent_rolls < 4:
+            accessible_rolls.append(posn)
     
     return accessible_rolls
 
-def remove_roll(grid: list[str], roll: tuple[int, int]) -> list[str]:
+def remove_roll(grid: Grid, roll: int) -> Grid:
     """
-    Replace a single '@' (or any character) at a given coordinate with '.' in a grid.
+    Replace a single '@' (or any character) at a given position with '.' in a grid.
 
-    Takes an immutable-string grid representation (list of strings), targets the
-    specified (x, y) coordinate, and returns that roll replaced by a '.' character.
+    The grid is changed in place, in constant time.
 
     Args:
-        grid (list[str]): Rectangular grid as a list of equal-length strings.
-        roll (tuple[int, int]): Zero-based (x, y) coordinate to clear.
+        grid (Grid): Rectangular character grid.
+        roll (int): Flat grid index of the cell to clear.
 
     Returns:
-        list[str]: The same list object with the specified cell replaced by '.'.
+        Grid: The same grid object with the specified cell replaced by '.'.
     """
-    roll_x, roll_y = roll
-    row = grid[roll_y]
-
-    grid[roll_y] = row[:roll_x] + '.' + row[roll_x+1:]
+    grid[roll] = '.'
 
     return grid
 
-def run_part2(data: list[str]) -> int:
+def run_part2(grid: Grid) -> int:
     """
     Iteratively remove accessible '@' cells until none remain and count th eremovals.
 
@@ -121,38 +90,48 @@ def run_part2(data: list[str]) -> int:
     accessible rolls, then returns the total number of removals performed.
 
     Args:
-        data (list[str]): Rectangular character grid represented as a list of
-            equal-length strings.
+        grid (Grid): Rectangular character grid. It is changed in place, so pass a
+            copy if the original is still needed.
 
     Returns:
         int: Total count of '@' cells removed across all iterations.
     """
-    grid = data
     accessible_rolls = True # Default
     rolls_removed = 0
 
     while accessible_rolls:
         accessible_rolls = run_part1(grid)
-        # Define new grid with rolls removed
+        # Remove the accessible rolls from the grid
         for roll in accessible_rolls:
             grid = remove_roll(grid, roll)
         rolls_removed += len(accessible_rolls)
 
     return rolls_removed
 
-inputfile = Path('day04.txt')
-data = read_inputfile(inputfile)
-
-surroundings = [
-    (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1)
-    ]
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of accessible rolls, and of rolls removed in total.
 
-part1_result = len(run_part1(data))
-part2_result = len(run_part2(data))
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
 
-print('Day 1:', part1_result)
-if part1_result == 1464:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 8409:
-    print('PASS')
\ No newline at end of file
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 counts.
+    """
+    grid = Grid(read_lines(puzzle_input))
+    part1_result = len(run_part1(grid))
+    part2_result = run_part2(grid)
+
+    return part1_result, part2_result
+
+if __name__ == '__main__':
+    with map_input(Path('day04.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 1464:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 8409:
+        print('PASS')
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, find_blank_line, iter_ints, map_input
+
 example = """3-5
     10-14
     16-20
@@ -11,57 +13,42 @@ example = """3-5
     11
     17
     32"""
-example = [line.strip() for line in example.split('\n')]
+example = '\n'.join(line.strip() for line in example.split('\n'))
 
-def read_inputfile(inputfile: Path) -> list[str]:
+def parse_input(data: PuzzleInput) -> tuple[list[tuple[int, int]], list[int]]:
     """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
+    Parse the puzzle input into inclusive integer ranges and a list of ingredient IDs.
 
-def parse_input(data: list[str]) -> tuple[list[tuple[int, int]], list[int]]:
-    """
-    Parse input lines into inclusive integer ranges and a list of ingredient IDs.
-
-    Expects a list of strings where an empty string "" separates two sections:
+    Expects two sections separated by a blank line:
     - The top section contains range lines in the form "start-end" (inclusive).
     - The bottom section contains one integer per line representing ingredient IDs.
+    The integers are read straight from the input, so a memory-mapped file is parsed 
+    without first being copied into lines of text.
 
     Args:
-        data (list[str]): Input lines. Must contain exactly one empty string
-            delimiter between the ranges section and the ingredients section.
+        data (PuzzleInput): The puzzle input, as a string or a buffer of the input file.
 
     Returns:
         tuple[list[tuple[int, int]], list[int]]:
             - fresh_ranges: A list of (start, end) integer tuples, inclusive.
             - available_ingredients: A list of integers parsed from the lines
-              after the empty delimiter.
+              after the blank line.
 
     Raises:
-        ValueError: If the delimiter "" is missing, if a range line is malformed
-            (not "start-end" with int-like strings), or if any ingredient line is not an
-            int-like string.
+        ValueError: If the blank line delimiter is missing, or if the ranges section 
+            does not contain pairs of integers.
     """
-    input_split_index = data.index('')
-    fresh_ranges = data[:input_split_index]
-    available_ingredients = data[input_split_index+1:]
+    separator = find_blank_line(data)
+    if separator is None:
+        raise ValueError('No blank line between the ranges and the ingredient IDs')
+    ranges_end, ingredients_start = separator
 
     # Take ingredient values as integers
-    fresh_ranges = [(int(first), int(last)) 
-                    for this_range in fresh_ranges 
-                    for first, _, last in [this_range.partition('-')]
-                    ]
-    available_ingredients = [int(i) for i in available_ingredients]
+    bounds = list(iter_ints(data, 0, ranges_end))
+    if len(bounds) % 2:
+        raise ValueError('Ranges must each have a start and an end')
+    fresh_ranges = list(zip(bounds[::2], bounds[1::2]))
+    available_ingredients = list(iter_ints(data, ingredients_start))
 
     return fresh_ranges, available_ingredients
 
@@ -139,7 +126,7 @@ def fresh_ingredients(fresh_ranges: list[tuple[int, int]]) -> int:
 
     return num_ingredients
 
-def run(data: list[str]) -> tuple[int, int]:
+def run(data: PuzzleInput) -> tuple[int, int]:
     """
     Compute the number of usable ingredients and the total unique fresh coverage.
 
@@ -148,7 +135,7 @@ def run(data: list[str]) -> tuple[int, int]:
     the total count of distinct integers covered by all fresh ranges (part2).
 
     Args:
-        data (list[str]): Input lines where an empty string separates a section
+        data (PuzzleInput): The puzzle input, where a blank line separates a section
             of "start-end" range lines from a section of integer ingredient IDs.
 
     Returns:
@@ -158,7 +145,6 @@ def run(data: list[str]) -> tuple[int, int]:
 
     Raises:
         ValueError: Propagated from parse_input if the input format is invalid.
-        ValueError: If non-digit content is found in ranges or ingredient lines.
     """
     fresh_ranges, available_ingredients = parse_input(data)
     usable = usable_ingredients(fresh_ranges, available_ingredients)
@@ -167,14 +153,26 @@ def run(data: list[str]) -> tuple[int, int]:
 
     return len(usable), part2
 
-inputfile = Path('day05.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of fresh available ingredients and of fresh IDs.
 
-part1_result, part2_result = run(data)
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
 
-print('Day 1:', part1_result)
-if part1_result == 735:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 344306344403172:
-    print('PASS')
\ No newline at end of file
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    return run(puzzle_input)
+
+if __name__ == '__main__':
+    with map_input(Path('day05.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
+
+    print('Day 1:', part1_result)
+    if part1_result == 735:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 344306344403172:
+        print('PASS')
@@ -3,28 +3,14 @@ from pathlib import Path
 
 import pandas as pd
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """123 328  51 64 
  45 64  387 23 
   6 98  215 314
 *   +   *   +  """
 example = example.split('\n')
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.replace('\n', '') for line in data]
-
 def parse_formulae_humans(data: list[str]) -> tuple[pd.DataFrame, list[str]]:
     """
     Parse lines of mixed numeric rows and a trailing operations line into a DataFrame and tokens.
@@ -156,14 +142,29 @@ def run(data: list[str]) -> tuple[int, int]:
     
     return total, part2
 
-inputfile = Path('day06.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the worksheet grand totals read by humans and by cephalopods.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    # Whitespace is significant in this puzzle, so lines are not stripped
+    data = read_lines(puzzle_input, strip = False)
+
+    return run(data)
 
-part1_result, part2_result = run(data)
+if __name__ == '__main__':
+    with map_input(Path('day06.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 4878670269096:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 8674740488592:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 4878670269096:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 8674740488592:
+        print('PASS')
@@ -1,6 +1,9 @@
 from functools import lru_cache
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """.......S.......
     ...............
     .......^.......
@@ -19,139 +22,115 @@ example = """.......S.......
     ..............."""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
-def find_start(grid: list[str]) -> tuple[int, int]:
+def find_start(grid: Grid) -> int:
     """
-    Locate the start coordinate 'S' in a 2D grid of characters.
+    Locate the start position 'S' in a grid of characters.
 
-    Scans the grid row by row and returns the (x, y) coordinate of the first
-    occurrence of the character 'S'. Coordinates are zero-based: x is the
-    column index within a row, y is the row index within the grid.
+    Returns the flat grid index of the first occurrence of the character 'S',
+    in reading order.
 
     Args:
-        grid (list[str]): The character grid represented as a list of strings.
+        grid (Grid): The character grid.
 
     Returns:
-        tuple[int, int]: The (x, y) position of the first 'S' found.
-
-    Raises:
-        ValueError: If no 'S' character exists in the grid.
+        int: The flat grid index of the first 'S' found.
+        None: If no 'S' character exists in the grid.
     """
-    for y, line in enumerate(grid):
-        for x, char in enumerate(line):
-            if char == 'S':
-                return (x, y)
+    return grid.find('S')
 
-def progress_tachyons(grid: list[str], start: tuple[int, int]) -> int:
+def progress_tachyons(grid: Grid, start: int) -> int:
     """
     Advance a beam through the grid from a start position and count splits.
 
-    Treats the beam as a set of coordinates reached in the previous row. For each
-    cell (x, y), if its parent (x, y-1) is in the beam:
-    - '.' moves the beam straight down to (x, y).
-    - '^' splits the beam to (x-1, y) and (x+1, y) and increments beam_splits.
+    Treats the beam as a set of positions reached in the previous row. For each
+    cell, if the cell directly above it is in the beam:
+    - '.' moves the beam straight down to the cell.
+    - '^' splits the beam to the cells either side of it and increments beam_splits.
 
     Args:
-        grid (list[str]): 2D character grid as a list of strings.
-        start (tuple[int, int]): Initial coordinate (x, y) where the beam starts.
+        grid (Grid): The character grid.
+        start (int): Initial flat grid index where the beam starts.
 
     Returns:
         int: The total number of splits achieved.
     """
-    beam = {start} # Set of 1 tuple
+    beam = {start} # Set of 1 index
     beam_splits = 0
 
-    for y, line in enumerate(grid):
-        for x, char in enumerate(line):
-            if (x, y-1) in beam:
-                if char == '.':
-                    beam.add((x, y))
-                elif char == '^':
-                    beam.update({(x-1, y), (x+1, y)})
-                    beam_splits += 1
+    for posn in grid.indices():
+        if posn - grid.stride in beam:
+            char = grid[posn]
+            if char == '.':
+                beam.add(posn)
+            elif char == '^':
+                beam.update({posn - 1, posn + 1})
+                beam_splits += 1
     
     return beam_splits
 
-def count_timelines(grid: list[str], start: tuple[int, int]) -> int:
+def count_timelines(grid: Grid, start: int) -> int:
     """
-    Count the number of completed downward paths from a start coordinate.
+    Count the number of completed downward paths from a start position.
 
     Uses recursion with memoization to traverse the grid from `start`, moving one
     row down per step according to the cell beneath:
-    - '^' splits the path to (x-1, y+1) and (x+1, y+1).
-    - '.' continues straight to (x, y+1).
+    - '^' splits the path to the cells either side of it.
+    - '.' continues straight down.
     - Any other character ends the path immediately (a completion).
     A path is considered complete when it reaches the last grid row.
 
     Args:
-        grid (list[str]): The character grid as a list of strings.
-        start (tuple[int, int]): Starting coordinate (x, y).
+        grid (Grid): The character grid.
+        start (int): Starting flat grid index.
 
     Returns:
         int: Total number of completed paths from `start`.
     """
     @lru_cache(maxsize = None)
-    def recur(cur_x: int, cur_y: int) -> int:
+    def recur(current_posn: int) -> int:
         """
-        Recursively compute the number of paths downwards from (cur_x, cur_y).
+        Recursively compute the number of paths downwards from current_posn.
 
-        At each step, look one row below (next_y = cur_y + 1) and apply the movement
-        rule based on the cell beneath:
-        - '^': split to (cur_x - 1, next_y) and (cur_x + 1, next_y), summing both.
-        - '.': continue straight to (cur_x, next_y).
+        At each step, look at the cell one row below and apply the movement rule
+        based on it:
+        - '^': split to the cells either side of it, summing both.
+        - '.': continue straight down.
         - any other character: terminate the path (counts as 1 completed path).
 
         A path is considered complete when it has reached the bottom row, in which 
         case 1 is returned.
 
         Args:
-            cur_x (int): Current column index.
-            cur_y (int): Current row index.
+            current_posn (int): Current flat grid index.
 
         Returns:
-            int: Number of completed paths reachable from (cur_x, cur_y).
+            int: Number of completed paths reachable from current_posn.
 
         Notes:
-            - Results are memoized per (x, y) via lru_cache to avoid recomputation.
+            - Results are memoized per position via lru_cache to avoid recomputation.
             - Since no splitters exist on the outer row-wise bounds of grid, no bounds checks
             are performed for sideways moves. 
         """
-        next_y = cur_y + 1
-        if next_y > max_y:
+        next_posn = current_posn + grid.stride
+        if not grid.in_grid(next_posn):
             return 1 # Path is complete
         
-        cell_beneath = grid[next_y][cur_x]
+        cell_beneath = grid[next_posn]
         if cell_beneath == '^':
             total = 0
-            total += recur(cur_x - 1, next_y) # Add from left split
-            total += recur(cur_x + 1, next_y) # Add from right split
+            total += recur(next_posn - 1) # Add from left split
+            total += recur(next_posn + 1) # Add from right split
             return total if total > 0 else 1 # XXX
         elif cell_beneath == '.':
-            return recur(cur_x, next_y) # Add from path straight down
+            return recur(next_posn) # Add from path straight down
         else:
             return 1
 
-    max_y = len(grid) - 1
-    paths = recur(*start)
+    paths = recur(start)
 
     return paths
 
-def run(grid: list[str]) -> tuple[int, int]:
+def run(data: list[str]) -> tuple[int, int]:
     """
     Execute both beam progression and timeline counting from the grid start.
 
@@ -160,7 +139,7 @@ def run(grid: list[str]) -> tuple[int, int]:
     using count_timelines. Returns both results.
 
     Args:
-        grid (list[str]): 2D character grid as a list of strings.
+        data (list[str]): 2D character grid as a list of strings.
 
     Returns:
         tuple[int, int]: (part1, part2) where:
@@ -170,20 +149,35 @@ def run(grid: list[str]) -> tuple[int, int]:
     Raises:
         ValueError: If no 'S' start coordinate is found by find_start.
     """
+    grid = Grid(data)
     start = find_start(grid)
     part1 = progress_tachyons(grid, start)
     part2 = count_timelines(grid, start)
 
     return part1, part2
 
-inputfile = Path('day07.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the number of beam splits and of tachyon timelines.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(example)
+if __name__ == '__main__':
+    with map_input(Path('day07.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 1553:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 15811946526915:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 1553:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 15811946526915:
+        print('PASS')
@@ -3,6 +3,8 @@ from itertools import combinations
 import math
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """162,817,812
     57,618,57
     906,360,560
@@ -25,22 +27,6 @@ example = """162,817,812
     425,690,689"""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
 def parse_coords(data: list[str]) -> list[tuple[int, int, int]]:
     """
     Parse a list of comma-separated coordinate strings into 3D integer tuples.
@@ -228,14 +214,28 @@ def run(data: list[str], max_connections: int = 1_000) -> tuple[int, int]:
 
     return part1_result, part2_result
 
-inputfile = Path('day08.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the product of the largest circuit sizes, and of the last X coordinates.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(example)
+if __name__ == '__main__':
+    with map_input(Path('day08.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 121770:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 7893123992:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 121770:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 7893123992:
+        print('PASS')
@@ -2,6 +2,8 @@ from collections import defaultdict
 from itertools import combinations
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """7,1
     11,1
     11,7
@@ -12,22 +14,6 @@ example = """7,1
     7,3"""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
 def parse_coords(data: list[str]) -> list[tuple[int, int]]:
     """
     Parse a list of comma-separated "x,y" strings into 2D integer coordinate tuples.
@@ -255,14 +241,28 @@ def run(data: list[str]) -> tuple[int, int]:
 
     return max_area, part2
 
-inputfile = Path('day09.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, int]:
+    """
+    Solves both parts: the largest rectangle area, without and with the green-tile rule.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, int]: A tuple containing the Part 1 and Part 2 results.
+    """
+    data = read_lines(puzzle_input)
+
+    return run(data)
 
-part1_result, part2_result = run(example)
+if __name__ == '__main__':
+    with map_input(Path('day09.txt')) as puzzle_input:
+        part1_result, part2_result = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 4759420470:
-    print('PASS')
-print('Day 2:', part2_result)
-if part2_result == 1603439684:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 4759420470:
+        print('PASS')
+    print('Day 2:', part2_result)
+    if part2_result == 1603439684:
+        print('PASS')
@@ -1,27 +1,13 @@
 from collections import deque
 from pathlib import Path
 
+from aoc.loader import PuzzleInput, map_input, read_lines
+
 example = """[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
     [...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
     [.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
 example = [line.strip() for line in example.split('\n')]
 
-def read_inputfile(inputfile: Path) -> list[str]:
-    """
-    Reads a text file and returns a list of its lines, with leading/trailing whitespace removed.
-
-    Args:
-        inputfile (Path): The path to the input file to be read.
-
-    Returns:
-        list[str]: A list containing each line of the file as a string, with leading/trailing 
-                   whitespace removed.
-    """
-    with open(inputfile, 'rt') as fin:
-        data = fin.readlines()
-    
-    return [line.strip() for line in data]
-
 def parse_schematics(schematics_str: str) -> list[list[int]]:
     """
     Parse a string of button schematics into a list of integer index lists.
@@ -201,11 +187,27 @@ def run(data: list[str]) -> int:
     
     return total
 
-inputfile = Path('day10.txt')
-data = read_inputfile(inputfile)
+def solve(puzzle_input: PuzzleInput) -> tuple[int, None]:
+    """
+    Solves Part 1: the fewest button presses needed to configure every machine.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                    input file.
+
+    Returns:
+        tuple[int, None]: A tuple containing the Part 1 result, and None since Part 2
+            is not solved.
+    """
+    data = read_lines(puzzle_input)
+    part1_result = run(data)
+
+    return part1_result, None
 
-part1_result = run(example)
+if __name__ == '__main__':
+    with map_input(Path('day10.txt')) as puzzle_input:
+        part1_result, _ = solve(puzzle_input)
 
-print('Day 1:', part1_result)
-if part1_result == 509:
-    print('PASS')
\ No newline at end of file
+    print('Day 1:', part1_result)
+    if part1_result == 509:
+        print('PASS')
@@ -0,0 +1,14 @@
+"""
+Shared tooling for running the Advent of Code solutions in this repository.
+
+Each day script in a year directory (eg: 2024/day06.py) exposes a side-effect-free 
+`solve(puzzle_input)` function returning `(part1, part2)`, where the input is a string or 
+a memory-mapped buffer of the input file (see `aoc.loader`). The runner in `aoc.runner` 
+imports those scripts by path and executes any selection of years and days, optionally 
+across a process pool. Run it from the repository root:
+
+    python -m aoc 2023 2024:6 2025:1-4
+
+Day scripts import `aoc`, so to run one directly from its year directory, put the 
+repository root on PYTHONPATH first.
+"""
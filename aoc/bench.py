@@ -0,0 +1,410 @@
+"""
+Benchmarks the solutions: times repeated solves of each day, measures peak memory, checks
+the answers against `answers.json`, and compares the timings against a previous run.
+
+    python -m aoc.bench 2024 --repeat 10 --output bench.json
+    python -m aoc.bench 2024 --baseline bench.json --margin 0.25
+
+With `--scaling`, each day is instead solved on synthetic inputs of increasing size (see
+`aoc.generators`), to estimate how its running time grows with the size of its input:
+
+    python -m aoc.bench 2024:1 --scaling 1 10 100
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aoc.generators import GENERATORS, generate
+from aoc.loader import map_input
+from aoc.runner import find_input, load_day, parse_selection
+
+ANSWERS_FILE = Path(__file__).with_name('answers.json')
+
+def load_answers(answers_file: Path = ANSWERS_FILE) -> dict[tuple[int, int], list]:
+    """
+    Loads the table of known answers.
+
+    The file maps each year to a dictionary of {day: [part1, part2]}, with null for any part
+    whose answer is not known.
+
+    Args:
+        answers_file (Path, optional): The JSON file to load. Defaults to `answers.json` in
+                                       this package.
+
+    Returns:
+        dict[tuple[int, int], list]: A dictionary of {(year, day): [part1, part2]}.
+    """
+    with open(answers_file) as fin:
+        table = json.load(fin)
+
+    return {(int(year), int(day)): answers
+            for year, days in table.items()
+            for day, answers in days.items()
+            }
+
+def check_answers(result: dict, expected: list | None) -> bool | None:
+    """
+    Checks a day's answers against the known answers.
+
+    Parts whose answer is not known are not checked.
+
+    Args:
+        result (dict): A benchmark result containing 'part1' and 'part2'.
+        expected (list | None): The known [part1, part2] answers, or None if the day is not
+                                in the answer table.
+
+    Returns:
+        bool: True if every known answer matches; False if any does not.
+        None: If no answer is known for either part.
+    """
+    if expected is None or expected == [None, None]:
+        return None
+
+    actual = [result['part1'], result['part2']]
+    return all(answer is None or answer == given for answer, given in zip(expected, actual))
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Returns a percentile of some values, using the nearest-rank method.
+
+    Args:
+        values (list[float]): The values. Must not be empty.
+        fraction (float): The percentile as a fraction, eg: 0.95 for p95.
+
+    Returns:
+        float: The smallest value that at least `fraction` of the values are less than or
+               equal to.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+
+    return ordered[rank - 1]
+
+def benchmark_day(year: int, day: int, repeat: int = 5) -> dict:
+    """
+    Solves a day several times, timing each solve, then once more to measure peak memory.
+
+    Memory is measured in a separate solve because tracing allocations slows Python down
+    considerably, which would distort the timings. Anything the solver prints is discarded.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        repeat (int, optional): The number of timed solves. Defaults to 5.
+
+    Returns:
+        dict: A dictionary with keys 'year', 'day', 'part1', 'part2', 'repeat', 'min',
+              'median' and 'p95' (wall times in seconds), 'peak_memory' (the peak size, in
+              bytes, of memory allocated by Python during a solve) and 'error' (a message,
+              or None). The timings and memory are None if the day failed.
+    """
+    result = {'year': year, 'day': day,
+              'part1': None, 'part2': None,
+              'repeat': repeat,
+              'min': None, 'median': None, 'p95': None,
+              'peak_memory': None, 'error': None
+              }
+    try:
+        module = load_day(year, day)
+        if not hasattr(module, 'solve'):
+            raise NotImplementedError('no solve() function')
+        with map_input(find_input(year, day)) as puzzle_input, \
+                contextlib.redirect_stdout(io.StringIO()):
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result['part1'], result['part2'] = module.solve(puzzle_input)
+                times.append(time.perf_counter() - start)
+
+            tracemalloc.start()
+            try:
+                module.solve(puzzle_input)
+                _, result['peak_memory'] = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+        return result
+
+    result['min'] = min(times)
+    result['median'] = statistics.median(times)
+    result['p95'] = percentile(times, 0.95)
+
+    return result
+
+def fit_exponent(scales: list[float], times: list[float]) -> float | None:
+    """
+    Estimates the exponent k of a running time that grows as size^k, by a least-squares fit
+    of a straight line to log(time) against log(size).
+
+    Args:
+        scales (list[float]): The relative sizes of the inputs.
+        times (list[float]): The running time for each input size.
+
+    Returns:
+        float: The estimated exponent, eg: about 1 for a linear solver and 2 for a quadratic
+               one.
+        None: If there are fewer than two distinct sizes with a measurable time.
+    """
+    points = [(math.log(scale), math.log(time)) for scale, time in zip(scales, times)
+              if time > 0
+              ]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x)**2 for x, _ in points)
+
+    return covariance / variance
+
+def benchmark_scaling(year: int,
+                      day: int,
+                      scales: list[float],
+                      repeat: int = 3,
+                      seed: int = 0
+                      ) -> dict:
+    """
+    Solves synthetic inputs of a day at several scales, to measure how its running time
+    grows with the size of its input.
+
+    Anything the solver prints is discarded. The answers are not checked, since they are
+    not known.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        scales (list[float]): The input sizes, as multiples of the day's base size.
+        repeat (int, optional): The number of timed solves at each scale, of which the
+                                fastest is kept. Defaults to 3.
+        seed (int, optional): The random seed for the inputs. Defaults to 0.
+
+    Returns:
+        dict: A dictionary with keys 'year', 'day', 'scales', 'lengths' (the length of each
+              input, in characters), 'times' (the fastest time at each scale, in seconds),
+              'exponent' (as estimated by `fit_exponent`) and 'error' (a message, or None).
+              If a day fails partway, the lists only cover the scales that succeeded.
+    """
+    result = {'year': year, 'day': day,
+              'scales': [], 'lengths': [], 'times': [],
+              'exponent': None, 'error': None
+              }
+    try:
+        module = load_day(year, day)
+        if not hasattr(module, 'solve'):
+            raise NotImplementedError('no solve() function')
+        for scale in scales:
+            puzzle_input = generate(year, day, scale = scale, seed = seed)
+            times = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    module.solve(puzzle_input)
+                    times.append(time.perf_counter() - start)
+            result['scales'].append(scale)
+            result['lengths'].append(len(puzzle_input))
+            result['times'].append(min(times))
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+
+    result['exponent'] = fit_exponent(result['scales'], result['times'])
+
+    return result
+
+def find_regressions(results: list[dict], baseline: dict, margin: float) -> list[dict]:
+    """
+    Finds the days whose median time is slower than in a previous benchmark run by more than
+    a margin.
+
+    Days that are missing from the baseline, or that failed in either run, are not compared.
+
+    Args:
+        results (list[dict]): The results of this run, as returned by `benchmark_day`.
+        baseline (dict): A previous run, as written by `main` with `--output`.
+        margin (float): The allowed slowdown, as a fraction of the baseline median, eg: 0.25
+                        allows a day to become up to 25% slower.
+
+    Returns:
+        list[dict]: One dictionary per regressed day, with keys 'year', 'day', 'baseline'
+                    and 'median' (both in seconds) and 'slowdown' (the ratio of the two).
+    """
+    baseline_medians = {(entry['year'], entry['day']): entry['median']
+                        for entry in baseline['results']
+                        if entry['median'] is not None
+                        }
+
+    regressions = []
+    for result in results:
+        key = (result['year'], result['day'])
+        if result['median'] is None or key not in baseline_medians:
+            continue
+        baseline_median = baseline_medians[key]
+        if result['median'] > baseline_median * (1 + margin):
+            regressions.append({'year': result['year'], 'day': result['day'],
+                                'baseline': baseline_median,
+                                'median': result['median'],
+                                'slowdown': result['median'] / baseline_median
+                                })
+
+    return regressions
+
+def format_result(result: dict) -> str:
+    """
+    Formats a single day's benchmark as one line of text.
+
+    Args:
+        result (dict): A result as returned by `benchmark_day`, with 'correct' added.
+
+    Returns:
+        str: A line describing the timings, peak memory and answer check, or the error.
+    """
+    label = f"{result['year']} day {result['day']:>2}"
+    if result['error']:
+        return f"{label}  ERROR  {result['error']}"
+
+    check = {True: 'ok', False: 'WRONG', None: '-'}[result['correct']]
+    return (f"{label}  min {result['min']:8.4f} s  median {result['median']:8.4f} s  "
+            f"p95 {result['p95']:8.4f} s  peak {result['peak_memory'] / 2**20:8.2f} MiB  "
+            f"{check}"
+            )
+
+def format_scaling(result: dict) -> str:
+    """
+    Formats a single day's scaling benchmark as one line of text.
+
+    Args:
+        result (dict): A result as returned by `benchmark_scaling`.
+
+    Returns:
+        str: A line giving the time at each scale and the estimated exponent, followed by
+             the error if there was one.
+    """
+    columns = [f"{result['year']} day {result['day']:>2}"]
+    for scale, time_taken in zip(result['scales'], result['times']):
+        columns.append(f'x{scale:<5g} {time_taken:8.4f} s')
+    if result['exponent'] is not None:
+        columns.append(f"~ n^{result['exponent']:.2f}")
+    if result['error']:
+        columns.append(f"ERROR  {result['error']}")
+
+    return ('  ').join(columns)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point: benchmarks the selected days and prints one line per day.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments, excluding the program
+                                           name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status; 1 if any day failed, gave a wrong answer or regressed,
+             otherwise 0.
+    """
+    parser = argparse.ArgumentParser(prog = 'python -m aoc.bench',
+                                     description = 'Benchmark Advent of Code solutions.'
+                                     )
+    parser.add_argument('selectors', nargs = '*',
+                        help = 'YEAR, YEAR:DAY or YEAR:FIRST-LAST (default: everything)'
+                        )
+    parser.add_argument('-n', '--repeat', type = int, default = 5,
+                        help = 'number of timed solves per day (default: 5)'
+                        )
+    parser.add_argument('-o', '--output', type = Path,
+                        help = 'write the results to this JSON file'
+                        )
+    parser.add_argument('-b', '--baseline', type = Path,
+                        help = 'a previous JSON output to check for regressions against'
+                        )
+    parser.add_argument('-m', '--margin', type = float, default = 0.25,
+                        help = 'allowed slowdown against the baseline, as a fraction '
+                               '(default: 0.25)'
+                        )
+    parser.add_argument('-s', '--scaling', type = float, nargs = '+', metavar = 'SCALE',
+                        help = 'time synthetic inputs at these multiples of each day\'s base '
+                               'size, instead of the real inputs'
+                        )
+    parser.add_argument('--seed', type = int, default = 0,
+                        help = 'random seed for --scaling inputs (default: 0)'
+                        )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    try:
+        days = parse_selection(args.selectors)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.scaling:
+        results = []
+        for year, day in days:
+            if (year, day) not in GENERATORS:
+                print(f'{year} day {day:>2}  no input generator')
+                continue
+            result = benchmark_scaling(year, day, args.scaling,
+                                       repeat = args.repeat, seed = args.seed
+                                       )
+            results.append(result)
+            print(format_scaling(result), flush = True)
+
+        if args.output:
+            report = {'timestamp': datetime.now(timezone.utc).isoformat(timespec = 'seconds'),
+                      'python': platform.python_version(),
+                      'platform': platform.platform(),
+                      'repeat': args.repeat,
+                      'seed': args.seed,
+                      'scaling': results
+                      }
+            with open(args.output, 'w') as fout:
+                json.dump(report, fout, indent = 4)
+
+        return int(any(result['error'] for result in results))
+
+    answers = load_answers()
+    results = []
+    for year, day in days:
+        result = benchmark_day(year, day, repeat = args.repeat)
+        result['correct'] = None if result['error'] else check_answers(result,
+                                                                       answers.get((year, day))
+                                                                       )
+        results.append(result)
+        print(format_result(result), flush = True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as fin:
+            baseline = json.load(fin)
+        regressions = find_regressions(results, baseline, args.margin)
+        for regression in regressions:
+            print(f"REGRESSION  {regression['year']} day {regression['day']:>2}  "
+                  f"median {regression['median']:.4f} s vs {regression['baseline']:.4f} s  "
+                  f"({regression['slowdown']:.2f}x)"
+                  )
+
+    if args.output:
+        report = {'timestamp': datetime.now(timezone.utc).isoformat(timespec = 'seconds'),
+                  'python': platform.python_version(),
+                  'platform': platform.platform(),
+                  'repeat': args.repeat,
+                  'margin': args.margin,
+                  'results': results,
+                  'regressions': regressions
+                  }
+        with open(args.output, 'w') as fout:
+            json.dump(report, fout, indent = 4, default = str)
+
+    failed = any(result['error'] or result['correct'] is False for result in results)
+    return int(failed or bool(regressions))
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from aoc.loader import PuzzleInput
+
+# The shared modules that day scripts import; changing any of them invalidates every entry
+LIBRARY_DIR = Path(__file__).resolve().parent
+
+class ResultCache:
+    """
+    An on-disk cache of answers, addressed by the content of the input and of the solver.
+
+    Each entry is a small JSON file named after a SHA-256 hash of the input file, the day
+    script's source and the source of the shared `aoc` modules. Editing any of those gives a
+    new key, so stale answers are never returned and need no explicit invalidation; they
+    simply age out. When the cache grows beyond its maximum size, the least recently used
+    entries are deleted.
+
+    The cache holds no state besides its settings, so it can be sent to worker processes,
+    which may all use the same directory at once.
+
+    Attributes:
+        directory (Path): The directory holding the entries.
+        max_size (int): The maximum total size of the entries, in bytes.
+    """
+    def __init__(self, directory: Path, max_size: int = 10 * 2**20):
+        """
+        Sets up a cache in a directory, which is created when the first entry is stored.
+
+        Args:
+            directory (Path): The directory to hold the entries.
+            max_size (int, optional): The maximum total size of the entries, in bytes.
+                                      Defaults to 10 MiB.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def key(self, script: Path, puzzle_input: PuzzleInput) -> str:
+        """
+        Computes the cache key for solving an input with a day script.
+
+        Args:
+            script (Path): The path to the day script.
+            puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the
+                                        input file.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest identifying the input and solver.
+        """
+        digest = hashlib.sha256()
+        if isinstance(puzzle_input, str):
+            puzzle_input = puzzle_input.encode()
+        digest.update(puzzle_input) # Buffers are hashed in place, without copying
+        for source_file in [script, *sorted(LIBRARY_DIR.glob('*.py'))]:
+            digest.update(b'\0')
+            digest.update(source_file.read_bytes())
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """
+        Looks up an entry, marking it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            dict: The stored entry.
+            None: If there is no entry for the key, or it cannot be read.
+        """
+        entry_file = self.directory / f'{key}.json'
+        try:
+            with open(entry_file) as fin:
+                entry = json.load(fin)
+            os.utime(entry_file) # Record the use, for eviction
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def put(self, key: str, entry: dict):
+        """
+        Stores an entry, then evicts old entries if the cache has grown too big.
+
+        The entry is written to a temporary file and renamed into place, so that other
+        processes never read a partly written entry.
+
+        Args:
+            key (str): The cache key.
+            entry (dict): The entry to store. It must be serialisable as JSON.
+        """
+        self.directory.mkdir(parents = True, exist_ok = True)
+        entry_file = self.directory / f'{key}.json'
+        temp_file = entry_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_file, 'w') as fout:
+            json.dump(entry, fout)
+        os.replace(temp_file, entry_file)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used entries until the cache is within its maximum size.
+        """
+        entries = []
+        for entry_file in self.directory.glob('*.json'):
+            try:
+                stat = entry_file.stat()
+            except FileNotFoundError: # Deleted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_file))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_file in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            entry_file.unlink(missing_ok = True)
+            total_size -= size
@@ -0,0 +1,233 @@
+"""
+A long-running solver that imports every day once, then answers solve requests without
+paying for interpreter start-up or heavy imports again.
+
+Requests and responses are JSON objects. The daemon listens either on a Unix domain socket,
+taking one request per line and answering each with one line:
+
+    python -m aoc.daemon --socket /tmp/aoc.sock
+    echo '{"selectors": ["2024:1-6"]}' | socat - UNIX-CONNECT:/tmp/aoc.sock
+
+or over HTTP on localhost, taking requests as the body of a POST to /solve:
+
+    python -m aoc.daemon --http 8025
+    curl -d '{"year": 2024, "day": 1, "input": "3   4\\n4   3"}' localhost:8025/solve
+
+A request either names days to solve from their input files, with "selectors" as on the
+runner's command line, or gives a single "year" and "day" and the "input" text to solve.
+The response has "results" (one per day, as returned by `aoc.runner.run_day`) and "time",
+the seconds taken to handle the request; or "error" if the request was invalid.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from aoc.runner import find_days, load_day, parse_selection, run_day
+
+def preload() -> dict[tuple[int, int], str]:
+    """
+    Imports every day script, so that later solves start warm.
+
+    Returns:
+        dict[tuple[int, int], str]: A dictionary of {(year, day): error_message} for the
+                                    days that failed to import.
+    """
+    errors = {}
+    for year, day in parse_selection([]):
+        try:
+            load_day(year, day)
+        except Exception as error:
+            errors[(year, day)] = f'{type(error).__name__}: {error}'
+
+    return errors
+
+def solve_text(year: int, day: int, puzzle_input: str) -> dict:
+    """
+    Solves a day from input text rather than from its input file.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        puzzle_input (str): The puzzle input.
+
+    Returns:
+        dict: A dictionary with keys 'year', 'day', 'part1', 'part2', 'time' (seconds spent
+              in `solve`, or None) and 'error' (a message, or None).
+    """
+    result = {'year': year, 'day': day,
+              'part1': None, 'part2': None,
+              'time': None, 'error': None
+              }
+    try:
+        if day not in find_days(year):
+            raise ValueError(f'No script found for {year} day {day}')
+        module = load_day(year, day)
+        if not hasattr(module, 'solve'):
+            raise NotImplementedError('no solve() function')
+        start = time.perf_counter()
+        result['part1'], result['part2'] = module.solve(puzzle_input)
+        result['time'] = time.perf_counter() - start
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+
+    return result
+
+def handle_request(request: dict) -> dict:
+    """
+    Carries out one solve request.
+
+    Args:
+        request (dict): Either {'selectors': [...]} to solve days from their input files,
+                        or {'year': ..., 'day': ..., 'input': ...} to solve given text.
+
+    Returns:
+        dict: A dictionary with keys 'results' (a list of results) and 'time' (seconds), or
+              with the single key 'error' if the request was invalid.
+    """
+    start = time.perf_counter()
+    try:
+        if 'input' in request:
+            results = [solve_text(int(request['year']), int(request['day']), request['input'])]
+        elif 'selectors' in request:
+            if not isinstance(request['selectors'], list):
+                raise TypeError('"selectors" must be a list of selectors, eg: ["2024"]')
+            results = [run_day(year, day) for year, day in parse_selection(request['selectors'])]
+        else:
+            raise ValueError('A request needs either "selectors", or "year", "day" and "input"')
+    except (KeyError, TypeError, ValueError) as error:
+        return {'error': f'{type(error).__name__}: {error}'}
+
+    return {'results': results, 'time': time.perf_counter() - start}
+
+def handle_json(line: bytes | str) -> dict:
+    """
+    Decodes a JSON request and carries it out.
+
+    Args:
+        line (bytes | str): The request, as JSON text.
+
+    Returns:
+        dict: The response, as returned by `handle_request`, or with the single key 'error'
+              if the request was not a JSON object.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as error:
+        return {'error': f'Invalid JSON: {error}'}
+    if not isinstance(request, dict):
+        return {'error': 'The request must be a JSON object'}
+
+    return handle_request(request)
+
+class SocketHandler(socketserver.StreamRequestHandler):
+    """
+    Answers requests on a Unix socket connection: one JSON object per line in, one per
+    line out, until the client closes the connection.
+    """
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = handle_json(line)
+            self.wfile.write(json.dumps(response, default = str).encode() + b'\n')
+            self.wfile.flush()
+
+class HTTPHandler(BaseHTTPRequestHandler):
+    """
+    Answers requests over HTTP: POST /solve with a JSON body, or GET /days to list the days
+    that are loaded.
+    """
+    def send_json(self, response: dict, status: int = 200):
+        body = json.dumps(response, default = str).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/days':
+            self.send_json({'error': f'Not found: {self.path}'}, status = 404)
+            return
+        days = [f'{year}:{day}' for year, day in parse_selection([])]
+        self.send_json({'days': days})
+
+    def do_POST(self):
+        if self.path != '/solve':
+            self.send_json({'error': f'Not found: {self.path}'}, status = 404)
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        response = handle_json(self.rfile.read(length))
+        self.send_json(response, status = 400 if 'error' in response else 200)
+
+def send_request(socket_path: str, request: dict) -> dict:
+    """
+    Sends one request to a daemon listening on a Unix socket and waits for the response.
+
+    Args:
+        socket_path (str): The path of the daemon's socket.
+        request (dict): The request.
+
+    Returns:
+        dict: The response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile('rwb') as stream:
+            stream.write(json.dumps(request).encode() + b'\n')
+            stream.flush()
+            return json.loads(stream.readline())
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point: preloads every day, then serves requests until interrupted.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments, excluding the program
+                                           name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status, 0.
+    """
+    parser = argparse.ArgumentParser(prog = 'python -m aoc.daemon',
+                                     description = 'Serve Advent of Code solutions warm.'
+                                     )
+    listener = parser.add_mutually_exclusive_group(required = True)
+    listener.add_argument('--socket', metavar = 'PATH', help = 'listen on this Unix socket')
+    listener.add_argument('--http', type = int, metavar = 'PORT',
+                          help = 'listen for HTTP on this port of localhost'
+                          )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    errors = preload()
+    print(f'Preloaded in {time.perf_counter() - start:.3f} s', flush = True)
+    for (year, day), error in errors.items():
+        print(f'{year} day {day:>2}  ERROR  {error}', flush = True)
+
+    if args.socket:
+        if os.path.exists(args.socket) and stat.S_ISSOCK(os.stat(args.socket).st_mode):
+            os.unlink(args.socket) # Left behind by an earlier daemon
+        server = socketserver.UnixStreamServer(args.socket, SocketHandler)
+    else:
+        server = HTTPServer(('127.0.0.1', args.http), HTTPHandler)
+
+    print('Listening on', args.socket or f'http://127.0.0.1:{args.http}', flush = True)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.socket:
+            os.unlink(args.socket)
+
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,716 @@
+"""
+Generates synthetic puzzle inputs at any scale, for measuring how the solvers grow with the
+size of their input.
+
+Each generator makes text in the same shape as the real input for its day, following the
+puzzle's guarantees where the solver relies on them (eg: the guard in 2024 day 6 always
+leaves the map). Inputs are reproducible: the same day, scale and seed always give the same
+text.
+
+Scale 1 is a small input of `base_size` units, where the unit depends on the day (lines,
+grid cells, schematics...), and other scales multiply that. Print an input with:
+
+    python -m aoc.generators 2024:1 --scale 100 > big_input.txt
+"""
+import argparse
+import math
+import random
+import string
+from collections.abc import Callable
+
+# A dictionary of {(year, day): (generator_function, base_size)}
+GENERATORS = {}
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+def generator(year: int, day: int, base_size: int) -> Callable:
+    """
+    Registers a function as the input generator for a day.
+
+    The function is called with the size of input to make, in the day's own units, and a
+    seeded random number generator, and returns the input text.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        base_size (int): The size of input to make at scale 1.
+
+    Returns:
+        Callable: A decorator that registers the function and returns it unchanged.
+    """
+    def register(function: Callable[[int, random.Random], str]) -> Callable:
+        GENERATORS[(year, day)] = (function, base_size)
+        return function
+
+    return register
+
+def generate(year: int, day: int, scale: float = 1, seed: int = 0) -> str:
+    """
+    Makes a synthetic input for a day.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        scale (float, optional): The size of the input, as a multiple of the day's base
+                                 size. Defaults to 1.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The input text.
+
+    Raises:
+        ValueError: If there is no generator for the day.
+    """
+    if (year, day) not in GENERATORS:
+        raise ValueError(f'No input generator for {year} day {day}')
+
+    function, base_size = GENERATORS[(year, day)]
+    size = max(1, round(base_size * scale))
+    rng = random.Random(f'{year}:{day}:{size}:{seed}')
+
+    return function(size, rng)
+
+def grid_side(size: int, minimum: int = 5) -> int:
+    """
+    Returns the side length of a square grid with about `size` cells.
+
+    Args:
+        size (int): The number of cells wanted.
+        minimum (int, optional): The smallest side length to return. Defaults to 5.
+
+    Returns:
+        int: The side length.
+    """
+    return max(minimum, math.isqrt(size))
+
+def random_grid(side: int, rng: random.Random, weights: dict[str, float]) -> list[list[str]]:
+    """
+    Makes a square grid of characters chosen at random with the given weights.
+
+    Args:
+        side (int): The number of rows and of columns.
+        rng (random.Random): The random number generator.
+        weights (dict[str, float]): A dictionary of {character: relative_weight}.
+
+    Returns:
+        list[list[str]]: The grid, as a list of rows of single characters, so that cells can
+                         be changed before it is joined into text.
+    """
+    chars = list(weights)
+    char_weights = list(weights.values())
+
+    return [rng.choices(chars, char_weights, k = side) for _ in range(side)]
+
+def join_grid(grid: list[list[str]]) -> str:
+    """
+    Joins a grid of characters into text, one row per line.
+
+    Args:
+        grid (list[list[str]]): The grid, as a list of rows of single characters.
+
+    Returns:
+        str: The grid as text.
+    """
+    return ('\n').join(('').join(row) for row in grid)
+
+# 2023
+
+@generator(2023, 1, base_size = 100)
+def calibration_document(size: int, rng: random.Random) -> str:
+    # Lines of letters, digits and digit words, each with at least one digit
+    lines = []
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(2, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                parts.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append(('').join(rng.choices(string.ascii_lowercase,
+                                                   k = rng.randint(1, 5)
+                                                   )))
+        if not any(part.isdigit() for part in parts):
+            parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append(('').join(parts))
+
+    return ('\n').join(lines)
+
+@generator(2023, 6, base_size = 1000)
+def race_sheet(size: int, rng: random.Random) -> str:
+    # Part 2 reads the race times as one number, so give them about as many digits as `size`
+    digits = len(str(size))
+    races = min(4, digits)
+    race_digits = [1] * races
+    for _ in range(digits - races):
+        race_digits[rng.randrange(races)] += 1
+
+    times, records = [], []
+    for race_digit in race_digits:
+        time = rng.randint(max(2, 10**(race_digit - 1)), 10**race_digit - 1)
+        best = (time // 2) * (time - time // 2) # The furthest the boat can go
+        times.append(str(time))
+        records.append(str(rng.randint(best // 2, best - 1)))
+
+    width = max(len(token) for token in times + records) + 2
+    return (f"Time:    {('').join(time.rjust(width) for time in times)}\n"
+            f"Distance:{('').join(record.rjust(width) for record in records)}"
+            )
+
+@generator(2023, 7, base_size = 100)
+def camel_cards(size: int, rng: random.Random) -> str:
+    # Every hand is distinct, as in the real input, so ties never need ranking
+    size = min(size, 13**5)
+    hands = set()
+    lines = []
+    while len(lines) < size:
+        # Drawing from a few card kinds gives a realistic mix of pairs, full houses, etc
+        kinds = rng.sample('AKQJT98765432', rng.randint(1, 5))
+        hand = ('').join(rng.choices(kinds, k = 5))
+        if hand in hands:
+            continue
+        hands.add(hand)
+        lines.append(f'{hand} {rng.randint(1, 1000)}')
+
+    return ('\n').join(lines)
+
+@generator(2023, 10, base_size = 400)
+def pipe_maze(size: int, rng: random.Random) -> str:
+    # A rectangular loop through S, surrounded and filled by unconnected junk pipes
+    side = grid_side(size)
+    grid = random_grid(side, rng, {char: 1 for char in '|-LJ7F.'})
+    left, top = rng.randint(0, side // 4), rng.randint(0, side // 4)
+    right, bottom = side - 1 - rng.randint(0, side // 4), side - 1 - rng.randint(0, side // 4)
+    for x in range(left + 1, right):
+        grid[top][x] = grid[bottom][x] = '-'
+    for y in range(top + 1, bottom):
+        grid[y][left] = grid[y][right] = '|'
+    grid[top][left], grid[top][right] = 'F', '7'
+    grid[bottom][left], grid[bottom][right] = 'L', 'J'
+    grid[top][rng.randint(left + 1, right - 1)] = 'S'
+
+    return join_grid(grid)
+
+@generator(2023, 11, base_size = 400)
+def galaxy_image(size: int, rng: random.Random) -> str:
+    side = grid_side(size)
+    grid = random_grid(side, rng, {'.': 49, '#': 1})
+    grid[0][0] = grid[-1][-1] = '#' # At least two galaxies
+
+    return join_grid(grid)
+
+@generator(2023, 12, base_size = 100)
+def spring_records(size: int, rng: random.Random) -> str:
+    # Build a valid arrangement, then hide some of it behind '?'
+    lines = []
+    for _ in range(size):
+        runs = [rng.randint(1, 4) for _ in range(rng.randint(1, 5))]
+        gaps = [rng.randint(0, 2)] + [rng.randint(1, 3) for _ in runs[1:]] + [rng.randint(0, 2)]
+        springs = ('').join('.' * gap + '#' * run for gap, run in zip(gaps, runs)) + '.' * gaps[-1]
+        springs = ('').join('?' if rng.random() < 0.5 else char for char in springs)
+        lines.append(f"{springs} {(',').join(str(run) for run in runs)}")
+
+    return ('\n').join(lines)
+
+def count_reflections(rows: list[str]) -> int:
+    """
+    Counts the lines of reflection of a pattern, both horizontal and vertical.
+
+    Args:
+        rows (list[str]): The rows of the pattern.
+
+    Returns:
+        int: The number of lines between rows or columns that the pattern is symmetrical
+             about.
+    """
+    reflections = 0
+    columns = [('').join(column) for column in zip(*rows)]
+    for lines in (rows, columns):
+        for mirror in range(1, len(lines)):
+            if all(a == b for a, b in zip(lines[mirror - 1::-1], lines[mirror:])):
+                reflections += 1
+
+    return reflections
+
+@generator(2023, 13, base_size = 20)
+def mirror_patterns(size: int, rng: random.Random) -> str:
+    patterns = []
+    while len(patterns) < size:
+        length, breadth = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [('').join(rng.choices('.#', k = breadth)) for _ in range(length)]
+        # Reflect the rows either side of a random line
+        mirror = rng.randint(1, length - 1)
+        for i in range(min(mirror, length - mirror)):
+            rows[mirror + i] = rows[mirror - 1 - i]
+        if rng.random() < 0.5: # Make it a vertical line of reflection instead
+            rows = [('').join(column) for column in zip(*rows)]
+        # Each pattern has exactly one line of reflection
+        if count_reflections(rows) == 1:
+            patterns.append(('\n').join(rows))
+
+    return ('\n\n').join(patterns)
+
+@generator(2023, 21, base_size = 400)
+def garden_map(size: int, rng: random.Random) -> str:
+    side = grid_side(size) | 1 # Odd, so that S is central
+    grid = random_grid(side, rng, {'.': 9, '#': 1})
+    middle = side // 2
+    for i in range(side): # The start's row and column are clear, as in the real input
+        grid[middle][i] = grid[i][middle] = '.'
+    grid[middle][middle] = 'S'
+
+    return join_grid(grid)
+
+@generator(2023, 23, base_size = 150)
+def hiking_trails(size: int, rng: random.Random) -> str:
+    # A random maze with a few extra openings, which are the slopes, to make loops
+    cells = grid_side(size, minimum = 9) // 2
+    side = 2 * cells + 1
+    steps = {(1, 0): '>', (-1, 0): '<', (0, 1): 'v', (0, -1): '^'}
+
+    # One slope must bypass a stretch of the route through the maze with a longer side
+    # branch, so keep trying until there is somewhere to put it
+    while True:
+        grid = [['#'] * side for _ in range(side)]
+        stack = [(0, 0)]
+        parents = {(0, 0): None} # The maze is a tree, rooted at the start
+        depths = {(0, 0): 0}
+        grid[1][1] = '.'
+        while stack:
+            x, y = stack[-1]
+            neighbours = [(x + dx, y + dy) for dx, dy in steps
+                          if 0 <= x + dx < cells and 0 <= y + dy < cells
+                          and (x + dx, y + dy) not in parents
+                          ]
+            if not neighbours:
+                stack.pop()
+                continue
+            next_x, next_y = rng.choice(neighbours)
+            grid[y + next_y + 1][x + next_x + 1] = '.'
+            grid[2 * next_y + 1][2 * next_x + 1] = '.'
+            parents[(next_x, next_y)] = (x, y)
+            depths[(next_x, next_y)] = depths[(x, y)] + 1
+            stack.append((next_x, next_y))
+
+        route = set()
+        cell = (cells - 1, cells - 1)
+        while cell is not None:
+            route.add(cell)
+            cell = parents[cell]
+        progress = {} # How far along the route each cell's branch leaves it
+        for cell in parents: # Parents come before their children
+            progress[cell] = depths[cell] if cell in route else progress[parents[cell]]
+
+        detours = [(x, y, dx, dy) for (x, y) in parents if (x, y) not in route
+                   for dx, dy in steps if (x + dx, y + dy) in route
+                   and grid[2 * y + dy + 1][2 * x + dx + 1] == '#'
+                   and depths[(x + dx, y + dy)] != progress[(x, y)]
+                   and depths[(x, y)] - progress[(x, y)] + 1
+                       > abs(depths[(x + dx, y + dy)] - progress[(x, y)])
+                   ]
+        if detours:
+            break
+
+    # Each slope only goes back towards the start of the route, so Part 1, once it leaves the
+    # route, can never rejoin it further on and must keep to it. Part 2 ignores the slopes,
+    # so can take the detour
+    def add_slope(x: int, y: int, dx: int, dy: int):
+        # Opens the wall between cell (x, y) and the next cell in direction (dx, dy)
+        wall_x, wall_y = 2 * x + dx + 1, 2 * y + dy + 1
+        ahead = progress[(x + dx, y + dy)] - progress[(x, y)]
+        if ahead > 0 or (ahead == 0 and rng.random() < 0.5):
+            dx, dy = -dx, -dy
+        grid[wall_y][wall_x] = steps[(dx, dy)]
+
+    add_slope(*rng.choice(detours))
+    for _ in range(max(1, cells * cells // 40)):
+        x, y = rng.randrange(cells - 1), rng.randrange(cells - 1)
+        dx, dy = rng.choice([(1, 0), (0, 1)])
+        if grid[2 * y + dy + 1][2 * x + dx + 1] == '#':
+            add_slope(x, y, dx, dy)
+    grid[0][1] = grid[-1][-2] = '.'
+
+    return join_grid(grid)
+
+# 2024
+
+@generator(2024, 1, base_size = 100)
+def location_lists(size: int, rng: random.Random) -> str:
+    left = [rng.randint(10000, 99999) for _ in range(size)]
+    # Repeat some left-hand numbers on the right, so that similarity scores are non-zero
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999)
+             for _ in range(size)
+             ]
+
+    return ('\n').join(f'{a}   {b}' for a, b in zip(left, right))
+
+@generator(2024, 2, base_size = 100)
+def reactor_reports(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        direction = rng.choice([-1, 1])
+        levels = [rng.randint(20, 80)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.4: # Spoil the report
+            levels[rng.randrange(len(levels))] = rng.randint(1, 99)
+        lines.append((' ').join(str(level) for level in levels))
+
+    return ('\n').join(lines)
+
+@generator(2024, 3, base_size = 200)
+def corrupted_memory(size: int, rng: random.Random) -> str:
+    junk = "mul(),don't?[]!@#%^&*+-_ 0123456789abcxyz"
+    tokens = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.3:
+            tokens.append(f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})')
+        elif kind < 0.35:
+            tokens.append('do()')
+        elif kind < 0.4:
+            tokens.append("don't()")
+        else:
+            tokens.append(('').join(rng.choices(junk, k = rng.randint(1, 6))))
+
+    return ('').join(tokens)
+
+@generator(2024, 4, base_size = 400)
+def word_search(size: int, rng: random.Random) -> str:
+    return join_grid(random_grid(grid_side(size), rng, {char: 1 for char in 'XMAS'}))
+
+@generator(2024, 5, base_size = 50)
+def print_queue(size: int, rng: random.Random) -> str:
+    # Every pair of pages is ordered by a rule, as in the real input; size is the updates
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f'{earlier}|{later}' for i, earlier in enumerate(pages) for later in pages[i + 1:]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5: # Correctly ordered
+            update.sort(key = pages.index)
+        updates.append((',').join(str(page) for page in update))
+
+    return ('\n').join(rules) + '\n\n' + ('\n').join(updates)
+
+@generator(2024, 6, base_size = 400)
+def guard_lab(size: int, rng: random.Random) -> str:
+    # The guard must leave the map, so keep trying until she does
+    side = grid_side(size)
+    while True:
+        grid = random_grid(side, rng, {'.': 12, '#': 1})
+        x, y = rng.randrange(side), rng.randrange(side)
+        grid[y][x] = '^'
+        delta_x, delta_y = 0, -1
+        visited = set()
+        while 0 <= x < side and 0 <= y < side and (x, y, delta_x, delta_y) not in visited:
+            visited.add((x, y, delta_x, delta_y))
+            next_x, next_y = x + delta_x, y + delta_y
+            if 0 <= next_x < side and 0 <= next_y < side and grid[next_y][next_x] == '#':
+                delta_x, delta_y = -delta_y, delta_x # Turn right
+            else:
+                x, y = next_x, next_y
+        if not (0 <= x < side and 0 <= y < side):
+            return join_grid(grid)
+
+@generator(2024, 7, base_size = 20)
+def calibration_equations(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.choice('+*|')
+            if operator == '+':
+                target += number
+            elif operator == '*':
+                target *= number
+            else:
+                target = int(f'{target}{number}')
+        if rng.random() < 0.5: # Make most of these impossible
+            target += rng.randint(1, 99)
+        lines.append(f"{target}: {(' ').join(str(number) for number in numbers)}")
+
+    return ('\n').join(lines)
+
+@generator(2024, 8, base_size = 400)
+def antenna_map(size: int, rng: random.Random) -> str:
+    side = grid_side(size)
+    grid = [['.'] * side for _ in range(side)]
+    frequencies = string.digits + string.ascii_letters
+    for frequency in rng.sample(frequencies, min(len(frequencies), max(1, size // 60))):
+        for _ in range(rng.randint(3, 5)):
+            grid[rng.randrange(side)][rng.randrange(side)] = frequency
+
+    return join_grid(grid)
+
+@generator(2024, 10, base_size = 400)
+def topographic_map(size: int, rng: random.Random) -> str:
+    # Diagonal slopes make long gentle trails; the noise breaks some of them up
+    side = grid_side(size)
+    grid = [[str((x + y) % 10) if rng.random() < 0.8 else str(rng.randint(0, 9))
+             for x in range(side)
+             ]
+            for y in range(side)
+            ]
+
+    return join_grid(grid)
+
+@generator(2024, 15, base_size = 400)
+def warehouse(size: int, rng: random.Random) -> str:
+    side = grid_side(size)
+    grid = random_grid(side, rng, {'.': 14, 'O': 5, '#': 1})
+    for i in range(side):
+        grid[0][i] = grid[-1][i] = grid[i][0] = grid[i][-1] = '#'
+    grid[rng.randint(1, side - 2)][rng.randint(1, side - 2)] = '@'
+
+    moves = ('').join(rng.choices('<>^v', k = 8 * size))
+    move_lines = [moves[i : i + 1000] for i in range(0, len(moves), 1000)]
+
+    return join_grid(grid) + '\n\n' + ('\n').join(move_lines)
+
+@generator(2024, 20, base_size = 225)
+def racetrack(size: int, rng: random.Random) -> str:
+    # A single track, snaking along alternate rows, with a wall between neighbouring rows
+    side = grid_side(size, minimum = 7) | 1
+    grid = [['#'] * side for _ in range(side)]
+    corridors = range(1, side - 1, 2)
+    for i, y in enumerate(corridors):
+        for x in range(1, side - 1):
+            grid[y][x] = '.'
+        if y + 2 < side - 1: # Join to the next corridor, at alternate ends
+            grid[y + 1][side - 2 if i % 2 == 0 else 1] = '.'
+    grid[1][1] = 'S'
+    last_y = corridors[-1]
+    grid[last_y][side - 2 if len(corridors) % 2 == 1 else 1] = 'E'
+    return join_grid(grid)
+
+@generator(2024, 21, base_size = 5)
+def door_codes(size: int, rng: random.Random) -> str:
+    return ('\n').join(f'{rng.randint(0, 999):03}A' for _ in range(size))
+
+@generator(2024, 22, base_size = 20)
+def secret_numbers(size: int, rng: random.Random) -> str:
+    return ('\n').join(str(rng.randint(1, 2**24 - 1)) for _ in range(size))
+
+@generator(2024, 23, base_size = 50)
+def lan_party(size: int, rng: random.Random) -> str:
+    # There are only 676 two-letter names, so beyond that only the connections grow
+    names = [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase]
+    computers = rng.sample(names, min(len(names), size))
+    max_connections = len(computers) * (len(computers) - 1) // 2
+    connections = set()
+    while len(connections) < min(6 * size, max_connections):
+        pair = tuple(sorted(rng.sample(computers, 2)))
+        connections.add(pair)
+
+    return ('\n').join(f'{a}-{b}' for a, b in connections)
+
+@generator(2024, 24, base_size = 4)
+def adder_circuit(size: int, rng: random.Random) -> str:
+    # A ripple-carry adder of `size` bits, with randomly named internal wires
+    width = max(2, len(str(size)))
+    wire_names = set()
+    def new_wire() -> str:
+        while True: # Names must not start with x, y or z, which are reserved
+            name = ('').join([rng.choice(string.ascii_lowercase[:-3]),
+                              *rng.choices(string.ascii_lowercase, k = 2)
+                              ])
+            if name not in wire_names:
+                wire_names.add(name)
+                return name
+
+    inputs = []
+    gates = []
+    carry = None
+    for bit in range(size):
+        x, y, z = (f'{prefix}{bit:0{width}}' for prefix in 'xyz')
+        inputs += [f'{x}: {rng.randint(0, 1)}', f'{y}: {rng.randint(0, 1)}']
+        if carry is None: # Half adder
+            gates.append(f'{x} XOR {y} -> {z}')
+            carry = new_wire()
+            gates.append(f'{x} AND {y} -> {carry}')
+            continue
+        partial_sum, both, carried = new_wire(), new_wire(), new_wire()
+        next_carry = f'z{size:0{width}}' if bit == size - 1 else new_wire()
+        gates += [f'{x} XOR {y} -> {partial_sum}',
+                  f'{partial_sum} XOR {carry} -> {z}',
+                  f'{x} AND {y} -> {both}',
+                  f'{partial_sum} AND {carry} -> {carried}',
+                  f'{both} OR {carried} -> {next_carry}'
+                  ]
+        carry = next_carry
+    if size == 1:
+        gates[-1] = gates[-1].replace(carry, f'z{size:0{width}}')
+    rng.shuffle(gates)
+
+    return ('\n').join(inputs) + '\n\n' + ('\n').join(gates)
+
+@generator(2024, 25, base_size = 50)
+def lock_schematics(size: int, rng: random.Random) -> str:
+    schematics = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [('').join('#' if height >= row else '.' for height in heights)
+                for row in range(1, 6)
+                ]
+        if rng.random() < 0.5: # Lock: filled from the top
+            schematics.append(('\n').join(['#####', *rows, '.....']))
+        else: # Key: filled from the bottom
+            schematics.append(('\n').join(['.....', *reversed(rows), '#####']))
+
+    return ('\n\n').join(schematics)
+
+# 2025
+
+@generator(2025, 1, base_size = 100)
+def dial_rotations(size: int, rng: random.Random) -> str:
+    return ('\n').join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+@generator(2025, 2, base_size = 10)
+def product_id_ranges(size: int, rng: random.Random) -> str:
+    ranges = []
+    for _ in range(size):
+        first = rng.randint(1, 10**rng.randint(2, 10))
+        ranges.append(f'{first}-{first + rng.randint(0, 5000)}')
+
+    return (',').join(ranges)
+
+@generator(2025, 3, base_size = 20)
+def battery_banks(size: int, rng: random.Random) -> str:
+    return ('\n').join(('').join(rng.choices('123456789', k = 100)) for _ in range(size))
+
+@generator(2025, 4, base_size = 400)
+def paper_rolls(size: int, rng: random.Random) -> str:
+    return join_grid(random_grid(grid_side(size), rng, {'@': 3, '.': 2}))
+
+@generator(2025, 5, base_size = 20)
+def ingredient_database(size: int, rng: random.Random) -> str:
+    ranges = []
+    for _ in range(size):
+        first = rng.randint(1, 10**15)
+        ranges.append((first, first + rng.randint(0, 10**12)))
+    ingredients = [rng.randint(*rng.choice(ranges)) if rng.random() < 0.5
+                   else rng.randint(1, 10**15)
+                   for _ in range(5 * size)
+                   ]
+
+    return (('\n').join(f'{first}-{last}' for first, last in ranges) + '\n\n'
+            + ('\n').join(str(ingredient) for ingredient in ingredients)
+            )
+
+@generator(2025, 6, base_size = 50)
+def math_worksheet(size: int, rng: random.Random) -> str:
+    # Problems side by side in columns, each aligned left or right as in the real input
+    rows = [[] for _ in range(5)]
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 10**rng.randint(1, 4) - 1)) for _ in range(4)]
+        width = max(len(number) for number in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        rows[4].append(rng.choice('+*').ljust(width))
+
+    return ('\n').join((' ').join(row) for row in rows)
+
+@generator(2025, 7, base_size = 400)
+def tachyon_manifold(size: int, rng: random.Random) -> str:
+    side = grid_side(size) | 1
+    grid = [['.'] * side for _ in range(side)]
+    grid[0][side // 2] = 'S'
+    for y in range(2, side, 2): # Splitters on every other row, away from the edges
+        for x in range(1, side - 1):
+            if rng.random() < 0.3:
+                grid[y][x] = '^'
+
+    return join_grid(grid)
+
+@generator(2025, 8, base_size = 100)
+def junction_boxes(size: int, rng: random.Random) -> str:
+    return ('\n').join((',').join(str(rng.randint(0, 99999)) for _ in range(3))
+                       for _ in range(size)
+                       )
+
+@generator(2025, 9, base_size = 40)
+def red_tiles(size: int, rng: random.Random) -> str:
+    # A rectilinear polygon with bumpy top and bottom edges, listed corner by corner
+    columns = max(2, size // 4)
+    xs = sorted(rng.sample(range(1, 100000), columns + 1))
+    tops, bottoms = [], []
+    for _ in range(columns):
+        # Neighbouring columns differ in height, so that every listed point is a corner
+        top, bottom = rng.randint(50001, 99999), rng.randint(1, 49999)
+        while tops and (top == tops[-1] or bottom == bottoms[-1]):
+            top, bottom = rng.randint(50001, 99999), rng.randint(1, 49999)
+        tops.append(top)
+        bottoms.append(bottom)
+
+    corners = [(xs[0], bottoms[0])]
+    for i in range(columns): # Along the top, left to right
+        corners += [(xs[i], tops[i]), (xs[i + 1], tops[i])]
+    for i in reversed(range(columns)): # Along the bottom, right to left
+        corners += [(xs[i + 1], bottoms[i]), (xs[i], bottoms[i])]
+    corners = corners[:-1] # The last is the first again
+
+    return ('\n').join(f'{x},{y}' for x, y in corners)
+
+@generator(2025, 10, base_size = 20)
+def machine_manuals(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        lights = rng.randint(4, 10)
+        buttons = [sorted(rng.sample(range(lights), rng.randint(1, lights - 1)))
+                   for _ in range(rng.randint(3, 13))
+                   ]
+        # Light and joltage targets reachable by pressing the buttons
+        pattern = [False] * lights
+        joltages = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                if presses % 2:
+                    pattern[light] = not pattern[light]
+                joltages[light] += presses
+
+        diagram = ('').join('#' if light else '.' for light in pattern)
+        wiring = (' ').join(f"({(',').join(str(light) for light in button)})"
+                            for button in buttons
+                            )
+        lines.append(f"[{diagram}] {wiring} {{{(',').join(str(j) for j in joltages)}}}")
+
+    return ('\n').join(lines)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point: prints a synthetic input for one day.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments, excluding the program
+                                           name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status, 0.
+    """
+    parser = argparse.ArgumentParser(prog = 'python -m aoc.generators',
+                                     description = 'Print a synthetic puzzle input.'
+                                     )
+    parser.add_argument('day', help = 'YEAR:DAY')
+    parser.add_argument('-s', '--scale', type = float, default = 1,
+                        help = 'size as a multiple of the base size (default: 1)'
+                        )
+    parser.add_argument('--seed', type = int, default = 0, help = 'random seed (default: 0)')
+    args = parser.parse_args(argv)
+
+    year, _, day = args.day.partition(':')
+    try:
+        print(generate(int(year), int(day), scale = args.scale, seed = args.seed))
+    except ValueError as error:
+        parser.error(str(error))
+
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
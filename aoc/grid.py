@@ -0,0 +1,203 @@
+from collections.abc import Iterator
+
+class Grid:
+    """
+    A rectangular character grid stored in a single flat bytearray.
+
+    The grid is surrounded by a one-cell border of a sentinel character, so every in-grid
+    cell has a neighbour in each direction and bounds checks become a comparison against
+    the border. Cells are addressed by a flat integer index rather than (x, y) tuples:
+    moving by one column is +/-1 and moving by one row is +/-`stride`. The precomputed
+    offset tuples `orthogonal` (N, E, S, W) and `surrounding` (all 8 neighbours) can be
+    added straight to an index.
+
+    Cells can be changed in place in O(1), unlike rows stored as immutable strings.
+
+    Attributes:
+        width (int): The number of columns, excluding the border.
+        height (int): The number of rows, excluding the border.
+        stride (int): The distance between vertically adjacent cells (width + 2).
+        border (str): The sentinel character filling the border.
+        cells (bytearray): The raw cell values, including the border.
+        orthogonal (tuple[int, int, int, int]): Offsets to the N, E, S and W neighbours.
+        surrounding (tuple[int, ...]): Offsets to all 8 neighbours, clockwise from N.
+    """
+    def __init__(self, rows: list[str], border: str = '\0'):
+        """
+        Builds a grid from its rows.
+
+        Args:
+            rows (list[str]): The rows of the grid, which must all be the same length.
+            border (str, optional): A single character, not otherwise used in the grid, to
+                                    fill the border with. Defaults to '\\0'.
+
+        Raises:
+            ValueError: If the rows are not all the same length.
+        """
+        self.width = len(rows[0]) if rows else 0
+        self.height = len(rows)
+        self.stride = self.width + 2
+        self.border = border
+        if any(len(row) != self.width for row in rows):
+            raise ValueError('All rows of a grid must have the same length')
+
+        edge = border * self.stride
+        padded_rows = [f'{border}{row}{border}' for row in rows]
+        self.cells = bytearray(('').join([edge, *padded_rows, edge]), 'latin-1')
+        self._border_byte = ord(border)
+
+        stride = self.stride
+        self.orthogonal = (-stride, 1, stride, -1)
+        self.surrounding = (-stride, -stride + 1, 1, stride + 1,
+                            stride, stride - 1, -1, -stride - 1
+                            )
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def __setitem__(self, index: int, char: str):
+        self.cells[index] = ord(char)
+
+    def __str__(self) -> str:
+        return ('\n').join(self.rows())
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Converts (x, y) coordinates to a flat index.
+
+        Args:
+            x (int): The column, counting from 0 at the left of the grid.
+            y (int): The row, counting from 0 at the top of the grid.
+
+        Returns:
+            int: The flat index of the cell.
+        """
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """
+        Converts a flat index back to (x, y) coordinates.
+
+        Args:
+            index (int): The flat index of a cell.
+
+        Returns:
+            tuple[int, int]: The x and y coordinates of the cell.
+        """
+        y, x = divmod(index, self.stride)
+
+        return x - 1, y - 1
+
+    def offset(self, delta_x: int, delta_y: int) -> int:
+        """
+        Converts a (delta_x, delta_y) step into the equivalent change of flat index.
+
+        Args:
+            delta_x (int): The change in column.
+            delta_y (int): The change in row.
+
+        Returns:
+            int: The amount to add to an index to take the step.
+        """
+        return delta_y * self.stride + delta_x
+
+    def in_grid(self, index: int) -> bool:
+        """
+        Checks whether an index is a cell of the grid rather than of its border.
+
+        Only indices at most one step away from the grid are meaningful, since the border is
+        one cell thick.
+
+        Args:
+            index (int): The flat index to check.
+
+        Returns:
+            bool: True if the index is inside the grid; False if it is on the border.
+        """
+        return self.cells[index] != self._border_byte
+
+    def find(self, char: str) -> int | None:
+        """
+        Finds the first cell containing a character, in reading order.
+
+        Args:
+            char (str): The character to search for.
+
+        Returns:
+            int: The flat index of the first matching cell.
+            None: If no cell contains the character.
+        """
+        index = self.cells.find(ord(char))
+
+        return index if index != -1 else None
+
+    def find_all(self, char: str) -> list[int]:
+        """
+        Finds every cell containing a character, in reading order.
+
+        Args:
+            char (str): The character to search for.
+
+        Returns:
+            list[int]: The flat indices of all matching cells.
+        """
+        indices = []
+        target = ord(char)
+        index = self.cells.find(target)
+        while index != -1:
+            indices.append(index)
+            index = self.cells.find(target, index + 1)
+
+        return indices
+
+    def indices(self) -> Iterator[int]:
+        """
+        Yields the flat index of every cell in the grid, in reading order, skipping the
+        border.
+
+        Yields:
+            int: The flat index of each cell.
+        """
+        for y in range(1, self.height + 1):
+            row_start = y * self.stride
+            yield from range(row_start + 1, row_start + self.width + 1)
+
+    def count(self, char: str) -> int:
+        """
+        Counts the cells containing a character.
+
+        Args:
+            char (str): The character to count.
+
+        Returns:
+            int: The number of matching cells.
+        """
+        return self.cells.count(ord(char))
+
+    def copy(self) -> 'Grid':
+        """
+        Returns an independent copy of the grid, which can be changed without affecting this
+        one.
+
+        Returns:
+            Grid: The copy.
+        """
+        new_grid = object.__new__(Grid)
+        new_grid.__dict__.update(self.__dict__)
+        new_grid.cells = self.cells[:]
+
+        return new_grid
+
+    def rows(self) -> list[str]:
+        """
+        Returns the rows of the grid as strings, without the border.
+
+        Returns:
+            list[str]: The rows, from top to bottom.
+        """
+        rows = []
+        for y in range(1, self.height + 1):
+            row_start = y * self.stride + 1
+            rows.append(self.cells[row_start : row_start + self.width].decode('latin-1'))
+
+        return rows
@@ -0,0 +1,267 @@
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError: # Only needed by read_int_array
+    np = None
+
+PuzzleInput = str | bytes | bytearray | mmap.mmap
+
+_INT_PATTERN = re.compile(r'\d+')
+_INT_PATTERN_BYTES = re.compile(rb'\d+')
+_BLANK_LINE_PATTERN = re.compile(r'\r?\n\r?\n')
+_BLANK_LINE_PATTERN_BYTES = re.compile(rb'\r?\n\r?\n')
+
+@contextmanager
+def map_input(inputfile: Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Memory-maps an input file for reading, without copying its contents into memory.
+
+    The mapping is only valid inside the `with` block, so anything that needs to outlive it
+    must be parsed out of the buffer first.
+
+    Args:
+        inputfile (Path): The path to the input file to be mapped.
+
+    Yields:
+        mmap.mmap | bytes: A read-only buffer over the file contents. Empty files cannot be
+                           mapped, so they give an empty bytes object instead.
+    """
+    with open(inputfile, 'rb') as fin:
+        if os.fstat(fin.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(fin.fileno(), 0, access = mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+def iter_lines(buffer: bytes | bytearray | mmap.mmap, start: int = 0, end: int | None = None
+               ) -> Iterator[memoryview]:
+    """
+    Lazily yields each line of (part of) a buffer as a view into it, without copying.
+
+    Line endings ('\\n' or '\\r\\n') are not included in the views. As with
+    `str.splitlines()`, a trailing newline does not produce a final empty line.
+
+    Args:
+        buffer (bytes | bytearray | mmap.mmap): The buffer to split into lines.
+        start (int, optional): The index to start from, which should be the start of a line.
+                               Defaults to 0.
+        end (int | None, optional): The index to stop at, which should be just after a line
+                                    ending. Defaults to the end of the buffer.
+
+    Yields:
+        memoryview: A view of each line, in order.
+    """
+    view = memoryview(buffer)
+    if end is None:
+        end = len(buffer)
+    while start < end:
+        newline = buffer.find(b'\n', start, end)
+        if newline == -1: # Final line has no line ending
+            newline = end
+        line_end = newline
+        if line_end > start and buffer[line_end - 1] == ord('\r'):
+            line_end -= 1
+        yield view[start:line_end]
+        start = newline + 1
+
+def split_lines(buffer: bytes | bytearray | mmap.mmap, chunk_size: int
+                ) -> list[tuple[int, int]]:
+    """
+    Divides a buffer into chunks of roughly equal size that start and end on line boundaries,
+    so that each chunk can be processed separately (eg: by another process).
+
+    Args:
+        buffer (bytes | bytearray | mmap.mmap): The buffer to divide.
+        chunk_size (int): The target size of each chunk, in bytes. Chunks are extended to
+                          the end of the line they would otherwise finish in.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) indices of each chunk, in order, covering the
+                               whole buffer.
+
+    Raises:
+        ValueError: If the chunk size is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be at least 1 byte')
+
+    chunks = []
+    start = 0
+    while start < len(buffer):
+        newline = buffer.find(b'\n', min(start + chunk_size, len(buffer)) - 1)
+        end = len(buffer) if newline == -1 else newline + 1
+        chunks.append((start, end))
+        start = end
+
+    return chunks
+
+def iter_chunks(puzzle_input: PuzzleInput, chunk_size: int) -> Iterator[bytes]:
+    """
+    Lazily yields the puzzle input in fixed-size chunks of bytes.
+
+    Only one chunk is copied out of a buffer at a time, so this is suitable for inputs too
+    big to hold in memory.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+        chunk_size (int): The size of each chunk, in bytes. The last chunk may be shorter.
+
+    Yields:
+        bytes: Each chunk, in order.
+    """
+    if isinstance(puzzle_input, str):
+        puzzle_input = puzzle_input.encode()
+
+    for start in range(0, len(puzzle_input), chunk_size):
+        yield bytes(puzzle_input[start:start + chunk_size])
+
+def iter_text_lines(puzzle_input: PuzzleInput, strip: bool = True) -> Iterator[str]:
+    """
+    Lazily yields each line of the puzzle input as a string.
+
+    Only one line is decoded at a time, so this is suitable for inputs too big to hold in
+    memory as text.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+        strip (bool, optional): Whether to remove leading/trailing whitespace from each
+                                line. Defaults to True.
+
+    Yields:
+        str: Each line of the input, without its line ending.
+    """
+    if isinstance(puzzle_input, str):
+        lines = iter(puzzle_input.splitlines())
+    else:
+        lines = (str(line, 'utf-8') for line in iter_lines(puzzle_input))
+
+    for line in lines:
+        yield line.strip() if strip else line
+
+def read_lines(puzzle_input: PuzzleInput, strip: bool = True) -> list[str]:
+    """
+    Returns a list of the lines of the puzzle input.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+        strip (bool, optional): Whether to remove leading/trailing whitespace from each
+                                line. Defaults to True.
+
+    Returns:
+        list[str]: A list containing each line of the input as a string.
+    """
+    return list(iter_text_lines(puzzle_input, strip = strip))
+
+def read_text(puzzle_input: PuzzleInput) -> str:
+    """
+    Returns the whole puzzle input as a single string.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+
+    Returns:
+        str: The contents of the input.
+    """
+    if isinstance(puzzle_input, str):
+        return puzzle_input
+
+    return str(memoryview(puzzle_input), 'utf-8')
+
+def iter_ints(puzzle_input: PuzzleInput, start: int = 0, end: int | None = None
+              ) -> Iterator[int]:
+    """
+    Lazily yields every non-negative integer in (part of) the puzzle input, in order.
+
+    Buffers are scanned in place, so only the digits of each number are ever copied.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+        start (int, optional): The index to start scanning from. Defaults to 0.
+        end (int | None, optional): The index to stop scanning at. Defaults to the end of
+                                    the input.
+
+    Yields:
+        int: Each run of decimal digits, converted to an integer.
+    """
+    pattern = _INT_PATTERN if isinstance(puzzle_input, str) else _INT_PATTERN_BYTES
+    if end is None:
+        end = len(puzzle_input)
+
+    for match in pattern.finditer(puzzle_input, start, end):
+        yield int(match[0])
+
+def read_int_array(puzzle_input: PuzzleInput) -> 'np.ndarray':
+    """
+    Parses every non-negative integer in the puzzle input into a NumPy array, in order.
+
+    Buffers are read in place, without copying the input. Rather than converting each number
+    separately, the digits in each place (units, tens, ...) of all the numbers are combined at
+    once with array operations.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+
+    Returns:
+        np.ndarray: The integers, as yielded by `iter_ints`, with dtype int64. Numbers of
+                    more than 18 digits may overflow.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError('read_int_array needs NumPy')
+    if isinstance(puzzle_input, str):
+        puzzle_input = puzzle_input.encode()
+
+    chars = np.frombuffer(puzzle_input, dtype = np.uint8)
+    is_digit = np.zeros(len(chars) + 2, dtype = bool) # Padded with a non-digit at each end
+    np.logical_and(chars >= ord('0'), chars <= ord('9'), out = is_digit[1:-1])
+    # Numbers start and end where is_digit changes, so the changes alternate between them
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1])
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+
+    # Add in the units of every number at once, then the tens, and so on
+    values = np.zeros(len(starts), dtype = np.int64)
+    for place in range(int(lengths.max(initial = 0))):
+        place_digits = np.where(lengths > place, chars[ends - 1 - place] - ord('0'), 0)
+        values += place_digits * np.int64(10 ** place)
+
+    return values
+
+def find_blank_line(puzzle_input: PuzzleInput, start: int = 0) -> tuple[int, int] | None:
+    """
+    Finds the first blank line, as used to separate sections of many puzzle inputs.
+
+    Args:
+        puzzle_input (PuzzleInput): The puzzle input, as a string or a buffer of the input
+                                    file.
+        start (int, optional): The index to start searching from. Defaults to 0.
+
+    Returns:
+        tuple[int, int]: The indices where the separating line endings start and end, ie: the
+                         end of the previous section and the start of the next.
+        None: If there is no blank line.
+    """
+    if isinstance(puzzle_input, str):
+        pattern = _BLANK_LINE_PATTERN
+    else:
+        pattern = _BLANK_LINE_PATTERN_BYTES
+
+    match = pattern.search(puzzle_input, start)
+    if match is None:
+        return None
+
+    return match.span()
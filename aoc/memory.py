@@ -0,0 +1,126 @@
+import signal
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Allocations made by the tracing machinery itself are not of interest
+_IGNORED_FILES = [tracemalloc.__file__, threading.__file__, __file__,
+                  '<frozen importlib._bootstrap>',
+                  '<frozen importlib._bootstrap_external>', '<unknown>'
+                  ]
+
+class MemoryBudgetExceeded(MemoryError):
+    """
+    Raised in the main thread when the traced memory goes over the budget.
+    """
+
+def _format_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[dict]:
+    """
+    Lists the source lines holding the most memory in a snapshot.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): The snapshot.
+        top (int): The number of lines to list.
+
+    Returns:
+        list[dict]: One dictionary per line, largest first, with keys 'site' ("file:line"),
+                    'size' (bytes) and 'count' (the number of live allocations).
+    """
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, filename)
+                                       for filename in _IGNORED_FILES
+                                       ])
+    sites = []
+    for statistic in snapshot.statistics('lineno')[:top]:
+        frame = statistic.traceback[0]
+        sites.append({'site': f'{frame.filename}:{frame.lineno}',
+                      'size': statistic.size,
+                      'count': statistic.count
+                      })
+
+    return sites
+
+@contextmanager
+def trace_memory(budget: int | None = None,
+                 top: int = 10,
+                 interval: float = 0.01
+                 ) -> Iterator[dict]:
+    """
+    Traces the memory allocated by Python inside a `with` block, recording its peak and the
+    source lines responsible for most of it, and optionally enforcing a budget.
+
+    A background thread polls the traced memory. Each time it reaches a new high, at least
+    10% above the last snapshot, the thread takes a snapshot of the live allocations, so the
+    reported sites are those holding memory close to the peak rather than at the end of the
+    block, when most of it has been freed.
+
+    If the memory goes over the budget, `MemoryBudgetExceeded` is raised in the main thread,
+    which must be the thread running the block (so this only works on Unix). The check is
+    made between Python bytecodes, so a single huge allocation by a C function can still
+    overshoot.
+
+    Args:
+        budget (int | None, optional): The most memory the block may allocate, in bytes.
+                                       Defaults to None, for no limit.
+        top (int, optional): The number of allocation sites to report. Defaults to 10.
+        interval (float, optional): The time between polls, in seconds. Defaults to 0.01.
+
+    Yields:
+        dict: A report, filled in when the block exits, with keys 'peak' (the peak traced
+              memory in bytes) and 'sites' (as returned by `_format_sites`).
+
+    Raises:
+        MemoryBudgetExceeded: If the traced memory goes over the budget.
+    """
+    report = {'peak': None, 'sites': []}
+    finished = threading.Event()
+    main_thread_id = threading.get_ident()
+    best = {'size': -1, 'snapshot': None}
+    # Set first thing as the block exits, after which a late signal must not raise. A plain
+    # store, unlike a call, gives the signal handler no chance to run before it takes effect
+    state = {'exited': False}
+
+    def watch():
+        while not finished.wait(interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if budget is not None and current > budget:
+                if not state['exited']:
+                    signal.pthread_kill(main_thread_id, signal.SIGUSR1)
+                return
+            if current > best['size'] * 1.1:
+                best['size'] = current
+                best['snapshot'] = tracemalloc.take_snapshot()
+
+    def over_budget(signum, frame):
+        if state['exited']: # Too late: raising now would interrupt the clean-up
+            return
+        raise MemoryBudgetExceeded(f'exceeded the memory budget of {budget / 2**20:g} MiB')
+
+    previous_handler = None
+    if budget is not None:
+        previous_handler = signal.signal(signal.SIGUSR1, over_budget)
+    tracemalloc.start()
+    watcher = threading.Thread(target = watch, daemon = True)
+    watcher.start()
+    try:
+        yield report
+    finally:
+        try:
+            # Hold back any later signal. One that has already arrived can still raise here,
+            # before the flag is set, so the clean-up below is in its own finally
+            if budget is not None:
+                signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGUSR1})
+            state['exited'] = True
+        finally:
+            finished.set()
+            watcher.join()
+            current, report['peak'] = tracemalloc.get_traced_memory()
+            if current > best['size']: # Nothing was caught while the block was running
+                best['snapshot'] = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            if budget is not None:
+                # Unblocking runs the handler for any signal held back, which now does
+                # nothing; only then is it safe to put the previous handler back
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGUSR1})
+                signal.signal(signal.SIGUSR1, previous_handler)
+            report['sites'] = _format_sites(best['snapshot'], top)
@@ -0,0 +1,386 @@
+import argparse
+import contextlib
+import importlib.util
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+from aoc.cache import ResultCache
+from aoc import trace
+from aoc.loader import map_input
+from aoc.memory import trace_memory
+from aoc.profiling import profile_call
+
+ROOT = Path(__file__).resolve().parent.parent
+DAY_PATTERN = re.compile(r'[Dd]ay0*(\d+)\.py')
+
+def find_years() -> list[int]:
+    """
+    Lists the puzzle years available in the repository.
+
+    Returns:
+        list[int]: The years, in ascending order, that have a directory of day scripts.
+    """
+    return sorted(int(path.name) for path in ROOT.iterdir()
+                  if path.is_dir() and path.name.isdigit()
+                  )
+
+def find_days(year: int) -> dict[int, Path]:
+    """
+    Maps each day number in a year to the path of its script.
+
+    Both naming schemes used in the repository are recognised ("Day1.py" and "day01.py").
+
+    Args:
+        year (int): The puzzle year.
+
+    Returns:
+        dict[int, Path]: A dictionary of {day: script_path}, in ascending day order.
+    """
+    days = {}
+    for path in (ROOT / str(year)).glob('*.py'):
+        match = DAY_PATTERN.fullmatch(path.name)
+        if match:
+            days[int(match[1])] = path
+
+    return dict(sorted(days.items()))
+
+def parse_selection(selectors: list[str]) -> list[tuple[int, int]]:
+    """
+    Expands command-line selectors into a list of (year, day) pairs.
+
+    Each selector is a year ("2024"), a single day ("2024:6") or an inclusive range of days
+    ("2024:1-5"). Days that have no script are skipped silently when a whole year or range is
+    requested, since the repository does not contain every day.
+
+    Args:
+        selectors (list[str]): The selectors to expand. An empty list selects every day of
+                               every year.
+
+    Returns:
+        list[tuple[int, int]]: The selected (year, day) pairs, sorted and without duplicates.
+
+    Raises:
+        ValueError: If a selector is malformed, or names a single day that does not exist.
+    """
+    if not selectors:
+        selectors = [str(year) for year in find_years()]
+
+    selected = set()
+    for selector in selectors:
+        year, _, days = selector.partition(':')
+        if not year.isdigit():
+            raise ValueError(f'Invalid selector: {selector!r}')
+        available = find_days(int(year))
+        if not days: # Whole year
+            selected.update((int(year), day) for day in available)
+        elif '-' in days: # Range of days
+            first, _, last = days.partition('-')
+            selected.update((int(year), day) for day in range(int(first), int(last) + 1)
+                            if day in available
+                            )
+        elif int(days) in available:
+            selected.add((int(year), int(days)))
+        else:
+            raise ValueError(f'No script found for {year} day {days}')
+
+    return sorted(selected)
+
+def load_day(year: int, day: int) -> ModuleType:
+    """
+    Imports a day script by its path and returns the module.
+
+    Year directories are not valid package names, so the script is loaded directly from its
+    file. The module is registered in `sys.modules` so that it is only imported once per
+    process, and so that its functions can be pickled for process pools.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+
+    Returns:
+        ModuleType: The imported day module.
+    """
+    path = find_days(year)[day]
+    module_name = f'aoc_{year}_{path.stem}'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name] # Don't leave a half-imported module behind
+        raise
+
+    return module
+
+def find_input(year: int, day: int) -> Path:
+    """
+    Returns the path of a day's input file, which sits next to its script.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+
+    Returns:
+        Path: The path to the input file. It is not checked for existence.
+    """
+    return find_days(year)[day].with_suffix('.txt')
+
+def run_day(year: int,
+            day: int,
+            profile: str | None = None,
+            profile_dir: Path = Path('profiles'),
+            top: int = 20,
+            cache: ResultCache | None = None,
+            memory: bool = False,
+            memory_budget: int | None = None
+            ) -> dict:
+    """
+    Solves a single day from its input file and times the solve.
+
+    The input file is memory-mapped and the buffer passed straight to `solve`. Any exception
+    raised while importing or solving is captured in the result rather than raised, so that
+    one broken day does not stop a run of many days.
+
+    Args:
+        year (int): The puzzle year.
+        day (int): The puzzle day.
+        profile (str | None, optional): 'cprofile' or 'sampling' to profile the solve (see
+                                        `aoc.profiling.profile_call`), in which case the time
+                                        includes the profiler's overhead. Defaults to None,
+                                        for no profiling.
+        profile_dir (Path, optional): The directory to save raw profiles to, as
+                                      "YEAR_dayDD.prof" (cProfile) or "YEAR_dayDD.folded"
+                                      (sampling). Defaults to "profiles".
+        top (int, optional): The number of functions in each table of the profile report,
+                             and of allocation sites in the memory report. Defaults to 20.
+        cache (ResultCache | None, optional): A cache to take the answers from if this input
+                                              has been solved by the same code before, and to
+                                              store them in otherwise. It is not used when
+                                              profiling or tracing memory. Defaults to None,
+                                              for no caching.
+        memory (bool, optional): Whether to trace the memory allocated by the solve (see
+                                 `aoc.memory.trace_memory`), in which case the time includes
+                                 the tracing overhead. Defaults to False.
+        memory_budget (int | None, optional): The most memory the solve may allocate, in
+                                              bytes; it is stopped with an error if it goes
+                                              over. Setting this implies `memory`. Defaults
+                                              to None, for no limit.
+
+    Returns:
+        dict: A dictionary with keys 'year', 'day', 'part1', 'part2', 'time' (seconds spent
+              in `solve`, or None), 'error' (a message, or None), 'profile' (the text
+              report, or None), 'cached' (whether the answers came from the cache, in
+              which case 'time' is that of the original solve), 'peak_memory' (bytes, or
+              None) and 'allocations' (the top allocation sites, as listed by
+              `aoc.memory.trace_memory`, or None).
+    """
+    result = {'year': year, 'day': day,
+              'part1': None, 'part2': None,
+              'time': None, 'error': None,
+              'profile': None, 'cached': False,
+              'peak_memory': None, 'allocations': None
+              }
+    memory = memory or memory_budget is not None
+    if profile or memory:
+        cache = None
+    try:
+        module = load_day(year, day)
+        if not hasattr(module, 'solve'):
+            raise NotImplementedError('no solve() function')
+        with map_input(find_input(year, day)) as puzzle_input:
+            if cache:
+                key = cache.key(find_days(year)[day], puzzle_input)
+                entry = cache.get(key)
+                if entry:
+                    result.update(entry, cached = True)
+                    return result
+            start = time.perf_counter()
+            with contextlib.ExitStack() as stack:
+                if memory:
+                    memory_report = stack.enter_context(trace_memory(budget = memory_budget,
+                                                                     top = top
+                                                                     ))
+                if profile:
+                    suffix = '.prof' if profile == 'cprofile' else '.folded'
+                    profile_dir.mkdir(parents = True, exist_ok = True)
+                    outputfile = profile_dir / f'{year}_day{day:02}{suffix}'
+                    answers, result['profile'] = profile_call(module.solve, puzzle_input,
+                                                              mode = profile,
+                                                              outputfile = outputfile,
+                                                              top = top
+                                                              )
+                else:
+                    answers = module.solve(puzzle_input)
+            result['time'] = time.perf_counter() - start
+        if memory:
+            result['peak_memory'] = memory_report['peak']
+            result['allocations'] = memory_report['sites']
+        result['part1'], result['part2'] = answers
+        if cache:
+            cache.put(key, {'part1': result['part1'], 'part2': result['part2'],
+                            'time': result['time']
+                            })
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+
+    return result
+
+def run_days(days: list[tuple[int, int]], workers: int = 1, **options) -> list[dict]:
+    """
+    Solves several days, spreading them across a process pool when more than one worker
+    is requested.
+
+    Args:
+        days (list[tuple[int, int]]): The (year, day) pairs to solve.
+        workers (int, optional): The maximum number of worker processes. With 1 worker (or a
+                                 single day), days are solved in this process. Defaults to 1.
+        **options: Keyword arguments passed on to `run_day`.
+
+    Returns:
+        list[dict]: One result per day, as returned by `run_day`, in the order of `days`.
+    """
+    if workers <= 1 or len(days) <= 1:
+        return [run_day(year, day, **options) for year, day in days]
+
+    with ProcessPoolExecutor(max_workers = min(workers, len(days))) as executor:
+        futures = [executor.submit(run_day, year, day, **options) for year, day in days]
+        return [future.result() for future in futures]
+
+def format_result(result: dict) -> str:
+    """
+    Formats a single day's result as one line of text.
+
+    Args:
+        result (dict): A result as returned by `run_day`.
+
+    Returns:
+        str: A line describing the answers and the time taken, or the error.
+    """
+    label = f"{result['year']} day {result['day']:>2}"
+    if result['error']:
+        return f"{label}  ERROR  {result['error']}"
+
+    notes = [f"{result['time']:.3f} s"]
+    if result['peak_memory'] is not None:
+        notes.append(f"peak {result['peak_memory'] / 2**20:.2f} MiB")
+    if result['cached']:
+        notes.append('cached')
+    return (f"{label}  part1={result['part1']}  part2={result['part2']}  "
+            f"({(', ').join(notes)})"
+            )
+
+def format_allocations(allocations: list[dict]) -> str:
+    """
+    Formats the top allocation sites of a solve as a text table.
+
+    Args:
+        allocations (list[dict]): The allocation sites, as listed by
+                                  `aoc.memory.trace_memory`.
+
+    Returns:
+        str: The table, largest first.
+    """
+    lines = [f"{'MiB':>10} {'blocks':>10}  site"]
+    for allocation in allocations:
+        lines.append(f"{allocation['size'] / 2**20:>10.3f} {allocation['count']:>10}  "
+                     f"{allocation['site']}"
+                     )
+
+    return ('\n').join(lines)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point: solves the selected days and prints one line per day.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments, excluding the program
+                                           name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status; 1 if any day failed, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(prog = 'python -m aoc',
+                                     description = 'Run Advent of Code solutions.'
+                                     )
+    parser.add_argument('selectors', nargs = '*',
+                        help = 'YEAR, YEAR:DAY or YEAR:FIRST-LAST (default: everything)'
+                        )
+    parser.add_argument('-j', '--workers', type = int, default = os.cpu_count() or 1,
+                        help = 'number of worker processes (default: one per CPU)'
+                        )
+    parser.add_argument('--profile', nargs = '?', const = 'cprofile',
+                        choices = ['cprofile', 'sampling'],
+                        help = 'profile each day, with cProfile (the default) or by sampling, '
+                               'and print its hottest functions'
+                        )
+    parser.add_argument('--profile-dir', type = Path, default = Path('profiles'),
+                        help = 'directory to save raw profiles to (default: profiles)'
+                        )
+    parser.add_argument('--top', type = int, default = 20,
+                        help = 'number of functions to list per profile table (default: 20)'
+                        )
+    parser.add_argument('--no-cache', action = 'store_true',
+                        help = 'solve every day afresh, without reading or writing the cache'
+                        )
+    parser.add_argument('--cache-dir', type = Path, default = ROOT / '.aoc_cache',
+                        help = 'directory for cached answers (default: .aoc_cache in the '
+                               'repository root)'
+                        )
+    parser.add_argument('--cache-size', type = float, default = 10,
+                        help = 'maximum size of the cache in MiB (default: 10)'
+                        )
+    parser.add_argument('--memory', action = 'store_true',
+                        help = 'trace memory, printing each day\'s peak and top allocation sites'
+                        )
+    parser.add_argument('--memory-budget', type = float, metavar = 'MIB',
+                        help = 'stop any day that allocates more than this many MiB '
+                               '(implies --memory)'
+                        )
+    parser.add_argument('--trace', metavar = 'LEVEL[:EVERY]',
+                        help = 'write the solvers\' diagnostics to stderr: LEVEL is info or '
+                               'debug, and EVERY samples every Nth message from each call site'
+                        )
+    args = parser.parse_args(argv)
+
+    try:
+        days = parse_selection(args.selectors)
+        if args.trace:
+            # Worker processes configure themselves from the environment when they start
+            os.environ[trace.ENVIRONMENT_VARIABLE] = args.trace
+            trace.configure_from_environment()
+    except ValueError as error:
+        parser.error(str(error))
+
+    cache = None
+    if not args.no_cache and not args.trace: # Cached days would not be traced
+        cache = ResultCache(args.cache_dir, max_size = int(args.cache_size * 2**20))
+
+    memory_budget = None
+    if args.memory_budget is not None:
+        memory_budget = int(args.memory_budget * 2**20)
+
+    start = time.perf_counter()
+    results = run_days(days, workers = args.workers,
+                       profile = args.profile, profile_dir = args.profile_dir, top = args.top,
+                       cache = cache, memory = args.memory, memory_budget = memory_budget
+                       )
+    wall_time = time.perf_counter() - start
+
+    for result in results:
+        print(format_result(result))
+        if result['profile']:
+            print(result['profile'])
+        if result['allocations']:
+            print(format_allocations(result['allocations']))
+    print(f'{len(results)} days in {wall_time:.3f} s')
+
+    return int(any(result['error'] for result in results))
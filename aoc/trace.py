@@ -0,0 +1,145 @@
+"""
+Leveled, sampled diagnostics for the solvers, in place of print().
+
+Each module gets a tracer, and guards every message with one of its level flags:
+
+    tracer = get_tracer(__name__)
+    ...
+    if tracer.debug:
+        tracer.log('Running position', posn)
+
+When tracing is off (the default), the guard is a single attribute check that is False, so
+the message is never built and hot loops pay almost nothing. Levels are 'info' (progress
+through the stages of a solve) and 'debug' (detail from inside loops). With sampling on,
+only every Nth message from each call site is written, which keeps hot loops readable.
+
+Tracing is set with `configure`, or through the environment variable AOC_TRACE, read at
+import, as LEVEL or LEVEL:EVERY (eg: "debug:1000"); a malformed value is reported and
+ignored. Messages go to stderr.
+"""
+import os
+import sys
+from collections import Counter
+
+DEBUG = 10
+INFO = 20
+OFF = 100
+LEVELS = {'debug': DEBUG, 'info': INFO, 'off': OFF}
+
+ENVIRONMENT_VARIABLE = 'AOC_TRACE'
+
+_settings = {'level': OFF, 'every': 1}
+_tracers = {}
+
+class Tracer:
+    """
+    Writes diagnostics for one module, if its level is enabled.
+
+    Attributes:
+        name (str): The name shown with each message, usually the module name.
+        debug (bool): Whether debug messages are enabled.
+        info (bool): Whether info messages are enabled.
+    """
+    def __init__(self, name: str):
+        """
+        Creates a tracer with the current settings. Use `get_tracer` rather than calling
+        this directly, so that the tracer is updated by `configure`.
+
+        Args:
+            name (str): The name shown with each message.
+        """
+        self.name = name
+        self.debug = False
+        self.info = False
+        self._counts = Counter()
+        self._update()
+
+    def _update(self):
+        self.debug = _settings['level'] <= DEBUG
+        self.info = _settings['level'] <= INFO
+
+    def log(self, *values, level: int = DEBUG):
+        """
+        Writes a message, like print(), if its level is enabled and it is not sampled out.
+
+        Messages are sampled separately for each distinct first value, which is normally
+        a fixed label identifying the call site.
+
+        Args:
+            *values: The values to write, separated by spaces.
+            level (int, optional): The level of the message. Defaults to DEBUG.
+        """
+        if level < _settings['level']:
+            return
+
+        every = _settings['every']
+        key = values[0] if values else ''
+        self._counts[key] += 1
+        count = self._counts[key]
+        if (count - 1) % every:
+            return
+
+        sample_note = f' (#{count})' if every > 1 else ''
+        print(f'[{self.name}]', *values, file = sys.stderr, end = f'{sample_note}\n')
+
+def get_tracer(name: str) -> Tracer:
+    """
+    Returns the tracer with a name, creating it if necessary.
+
+    Args:
+        name (str): The name of the tracer, usually the module's `__name__`.
+
+    Returns:
+        Tracer: The tracer.
+    """
+    if name not in _tracers:
+        _tracers[name] = Tracer(name)
+
+    return _tracers[name]
+
+def configure(level: int | str = OFF, every: int = 1):
+    """
+    Sets which messages all tracers write, now and in the future.
+
+    Args:
+        level (int | str, optional): The lowest level to write, as a number or as a name
+                                     from `LEVELS`. Defaults to OFF.
+        every (int, optional): Write only every Nth message from each call site. Defaults
+                               to 1, for every message.
+
+    Raises:
+        ValueError: If the level name is not recognised, or `every` is less than 1.
+    """
+    if isinstance(level, str):
+        if level.lower() not in LEVELS:
+            raise ValueError(f'Unknown trace level: {level!r}')
+        level = LEVELS[level.lower()]
+    if every < 1:
+        raise ValueError('The trace sampling interval must be at least 1')
+
+    _settings['level'] = level
+    _settings['every'] = every
+    for tracer in _tracers.values():
+        tracer._update()
+
+def configure_from_environment():
+    """
+    Configures tracing from the AOC_TRACE environment variable, given as LEVEL or
+    LEVEL:EVERY. Tracing is left off if the variable is not set.
+
+    Raises:
+        ValueError: If the variable is malformed.
+    """
+    setting = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not setting:
+        return
+
+    level, _, every = setting.partition(':')
+    if every and not every.isdigit():
+        raise ValueError(f'Malformed trace setting: {setting!r}')
+    configure(level, int(every) if every else 1)
+
+try:
+    configure_from_environment()
+except ValueError as error: # Don't break every import; the runner's --trace reports errors
+    print(f'Ignoring {ENVIRONMENT_VARIABLE}: {error}', file = sys.stderr)